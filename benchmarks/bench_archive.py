@@ -0,0 +1,107 @@
+"""
+Count salmon purchases in one year of a synthetic multi-year archive: loading
+every ``Week`` JSON file through pydantic versus a column-pruned read of the
+Parquet :class:`WeekArchive`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_archive [--repeat N] [--weeks N]
+"""
+
+import argparse
+import datetime as dt
+import tempfile
+import timeit
+from pathlib import Path
+
+from dinner_daily_helpers.archive import WeekArchive
+from dinner_daily_helpers.types.week import Week
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+SECTIONS = (
+    "dairy",
+    "frozen_foods",
+    "grocery",
+    "meat_poultry",
+    "produce",
+    "seafood",
+    "staples",
+    "other",
+)
+
+
+def synthetic_weeks(week, count):
+    """
+    ``count`` consecutive copies of ``week``, ending with ``week``.
+    """
+    start = week.menu.start_datetime
+    for i in range(count):
+        start_date = start - dt.timedelta(weeks=count - 1 - i)
+        menu = week.menu.copy(
+            update={"start_date": start_date.strftime("%Y-%m-%dT%H:%M:%S+00:00")}
+        )
+        yield week.copy(update={"menu": menu})
+
+
+def count_json(paths, year):
+    count = 0
+    for path in paths:
+        week = Week.parse_file(path)
+        if week.menu.start_datetime.year == year:
+            count += sum(
+                "salmon" in item.name
+                for section in SECTIONS
+                for item in getattr(week.shopping_list, section)
+            )
+    return count
+
+
+def count_archive(archive, year):
+    df = archive.read(
+        "shopping_items",
+        columns=["name"],
+        start=f"{ year }-01-01",
+        end=f"{ year + 1 }-01-01",
+    )
+    return int(df.name.str.contains("salmon").sum())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--weeks", type=int, default=260)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    week = Week.parse_file(FIXTURES_DIR.joinpath("weeks", "2021-05-24.json"))
+
+    with tempfile.TemporaryDirectory() as root:
+        json_dir = Path(root).joinpath("json")
+        json_dir.mkdir()
+        archive = WeekArchive(Path(root).joinpath("archive"))
+        paths = []
+        for week_i in synthetic_weeks(week, args.weeks):
+            path = json_dir.joinpath(f"{ WeekArchive.partition(week_i) }.json")
+            path.write_text(week_i.json())
+            paths.append(path)
+        duration = min(
+            timeit.repeat(
+                lambda: archive.extend(Week.parse_file(path) for path in paths),
+                number=1,
+                repeat=1,
+            )
+        )
+        print(f"{ args.weeks } weeks archived in { duration * 1e3:.1f} ms")
+
+        year = 2021
+        for name, function in (
+            ("JSON (pydantic)", lambda: count_json(paths, year)),
+            ("Parquet archive", lambda: count_archive(archive, year)),
+        ):
+            count = function()
+            duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+            print(
+                f"{ name:16s} { duration * 1e3:9.1f} ms  { count } salmon in { year }"
+            )
@@ -0,0 +1,65 @@
+"""
+Memory held by many weeks of shopping lists: pydantic ``ShoppingList`` models
+versus :class:`CompactShoppingList`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_compact_shopping_list [--weeks N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+from dinner_daily_helpers.types.compact import CompactShoppingList
+from dinner_daily_helpers.types.week import Week
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def allocated(function):
+    """
+    Bytes still allocated by the result of ``function()``.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--weeks", type=int, default=520)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sources = [p.read_bytes() for p in sorted(FIXTURES_DIR.glob("weeks/*.json"))]
+
+    def load():
+        return [
+            Week.parse_raw(sources[i % len(sources)]).shopping_list
+            for i in range(args.weeks)
+        ]
+
+    def load_compact():
+        return [
+            CompactShoppingList.from_shopping_list(
+                Week.parse_raw(sources[i % len(sources)]).shopping_list
+            )
+            for i in range(args.weeks)
+        ]
+
+    shopping_lists, size = allocated(load)
+    compact, compact_size = allocated(load_compact)
+    assert [c.to_shopping_list() for c in compact] == shopping_lists
+    for name, size_i in (("ShoppingList", size), ("CompactShoppingList", compact_size)):
+        print(
+            f"{ name:20s} { size_i / 2 ** 20:8.2f} MiB "
+            f"({ size_i / args.weeks / 1024:6.1f} KiB/week)"
+        )
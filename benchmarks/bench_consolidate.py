@@ -0,0 +1,83 @@
+"""
+Consolidated shopping list of many weeks: summing ``pint`` quantities item by
+item versus :func:`consolidate` (each distinct amount parsed once).
+
+Run from the repository root::
+
+    python -m benchmarks.bench_consolidate [--repeat N] [--weeks N]
+"""
+
+import argparse
+import math
+import re
+import timeit
+from collections import Counter
+from pathlib import Path
+
+from dinner_daily_helpers.consolidate import (
+    SECTIONS,
+    _parse_amount,
+    _unit_factor,
+    consolidate,
+)
+from dinner_daily_helpers.types.week import Week
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def normalize_name(name):
+    name = re.sub(r"\s+", " ", re.sub(r"\([^)]*\)", " ", name.lower()))
+    return name.strip(" ,")
+
+
+def consolidate_loops(shopping_lists):
+    totals = {}
+    units = {}
+    for shopping_list in shopping_lists:
+        for section in SECTIONS:
+            for item in getattr(shopping_list, section):
+                ingredient = normalize_name(item.name)
+                parsed = _parse_amount(item.formatted_amount)
+                key = (section, ingredient, parsed["group_unit"])
+                totals[key] = totals.get(key, 0.0) + parsed["magnitude"]
+                units.setdefault(key, Counter())[parsed["unit"]] += 1
+    consolidated = {}
+    for key, total in totals.items():
+        # Most common unit, ties broken alphabetically as ``Series.mode()``.
+        unit = min(units[key].items(), key=lambda pair: (-pair[1], pair[0]))[0]
+        consolidated[key] = (total / _unit_factor(unit, key[2]), unit)
+    return consolidated
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--weeks", type=int, default=52)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    weeks = [Week.parse_file(p) for p in sorted(FIXTURES_DIR.glob("weeks/*.json"))]
+    shopping_lists = [weeks[i % len(weeks)].shopping_list for i in range(args.weeks)]
+
+    totals = consolidate_loops(shopping_lists)
+    df = consolidate(shopping_lists)
+    expected = {
+        (section, ingredient, unit): quantity
+        for (section, ingredient, _), (quantity, unit) in totals.items()
+    }
+    actual = dict(zip(zip(df.section, df.ingredient, df.unit), df.quantity))
+    identical = expected.keys() == actual.keys() and all(
+        math.isclose(expected[key], actual[key]) or math.isnan(expected[key])
+        for key in expected
+    )
+    for name, function in (
+        ("Python loops", lambda: consolidate_loops(shopping_lists)),
+        ("consolidate", lambda: consolidate(shopping_lists)),
+    ):
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{ name:20s} { duration * 1e3:8.2f} ms  "
+            f"output { 'identical' if identical else 'DIFFERS' }"
+        )
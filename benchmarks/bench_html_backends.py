@@ -0,0 +1,57 @@
+"""
+Compare the ``markdown-it`` (in-process) and ``pandoc`` (subprocess) HTML
+backends of :func:`render` on the archived fixture menus.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_html_backends [--repeat N]
+"""
+
+import argparse
+import shutil
+import timeit
+import warnings
+from pathlib import Path
+
+from dinner_daily_helpers.render import (
+    HtmlBackend,
+    RenderFormat,
+    load_legacy_menu,
+    render,
+)
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    warnings.simplefilter("ignore")
+    menus = [
+        load_legacy_menu(p) for p in sorted(FIXTURES_DIR.glob("legacy_menus/*.json"))
+    ]
+
+    print(f"{ len(menus) } menus")
+    for backend in HtmlBackend:
+        if backend == HtmlBackend.PANDOC and shutil.which("pandoc") is None:
+            print(f"{ backend.value:12s} unavailable (`pandoc` not found)")
+            continue
+        duration = min(
+            timeit.repeat(
+                lambda: [
+                    render(menu, RenderFormat.HTML, html_backend=backend)
+                    for menu in menus
+                ],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{ backend.value:12s} { duration * 1e3:8.1f} ms "
+            f"({ duration * 1e3 / len(menus):6.1f} ms/menu)"
+        )
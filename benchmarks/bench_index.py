@@ -0,0 +1,68 @@
+"""
+Time ingestion into, and lookups in, a :class:`MenuIndex` of synthetic weeks
+(copies of the fixture menus with distinct dates).
+
+Run from the repository root::
+
+    python -m benchmarks.bench_index [--repeat N] [--weeks N]
+"""
+
+import argparse
+import time
+import timeit
+import warnings
+from pathlib import Path
+
+from dinner_daily_helpers.index import MenuIndex
+from dinner_daily_helpers.render import load_legacy_menu
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+QUERIES = {
+    "search salmon": lambda index: index.search("salmon", limit=20),
+    "search salmon AND asparagus": lambda index: index.search(
+        "salmon AND asparagus", limit=20
+    ),
+    "ingredient lookup": lambda index: index.connection.execute(
+        "SELECT COUNT(*) FROM ingredients WHERE ingredient = 'fresh parsley'"
+    ).fetchall(),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--weeks", type=int, default=500)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    warnings.simplefilter("ignore")
+    menus = [
+        load_legacy_menu(path)
+        for path in sorted(FIXTURES_DIR.glob("legacy_menus/*.json"))
+    ]
+
+    with MenuIndex(":memory:") as index:
+        start = time.perf_counter()
+        for i in range(args.weeks):
+            menu = menus[i % len(menus)]
+            index.add_menu(menu.copy(update={"date": f"{ menu.date } #{ i }"}))
+        duration = time.perf_counter() - start
+        dishes = index.connection.execute("SELECT COUNT(*) FROM dishes").fetchone()[0]
+        print(
+            f"{ args.weeks } weeks ({ dishes } dishes) indexed in "
+            f"{ duration:.2f} s ({ duration * 1e3 / args.weeks:.1f} ms/week)"
+        )
+
+        for name, query in QUERIES.items():
+            number = 100
+            duration = (
+                min(
+                    timeit.repeat(
+                        lambda: query(index), number=number, repeat=args.repeat
+                    )
+                )
+                / number
+            )
+            print(f"{ name:30s} { duration * 1e3:8.3f} ms")
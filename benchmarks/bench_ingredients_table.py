@@ -0,0 +1,58 @@
+"""
+Time :func:`ingredients_table` on every fixture menu and on a synthetic menu
+with 10k ingredients.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_ingredients_table [--repeat N] [--size N]
+"""
+
+import argparse
+import itertools as it
+import timeit
+from pathlib import Path
+
+from dinner_daily_helpers.menu import ingredients_table
+from dinner_daily_helpers.render import load_legacy_menu
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def synthetic_menu(menus, size):
+    """
+    Menu with ``size`` ingredients, cycling through the meals of ``menus``.
+    """
+    meals = it.cycle([meal for menu in menus for meal in menu["meals"]])
+    result = dict(menus[0], meals=[])
+    count = 0
+    while count < size:
+        meal = next(meals)
+        result["meals"].append(meal)
+        count += len(meal["main_dish"]["ingredients"]) + sum(
+            len(side["ingredients"]) for side in meal["side_dishes"]
+        )
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--size", type=int, default=10000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    paths = sorted(FIXTURES_DIR.glob("legacy_menus/*.json")) + sorted(
+        FIXTURES_DIR.glob("weeks/*.json")
+    )
+    menus = {path: load_legacy_menu(path).dict() for path in paths}
+    menus["synthetic"] = synthetic_menu(list(menus.values()), args.size)
+
+    for name, menu in menus.items():
+        rows = len(ingredients_table(menu))
+        duration = min(
+            timeit.repeat(lambda: ingredients_table(menu), number=1, repeat=args.repeat)
+        )
+        label = name if isinstance(name, str) else name.relative_to(FIXTURES_DIR)
+        print(f"{ str(label):40s} { rows:6d} rows { duration * 1e3:9.1f} ms")
@@ -0,0 +1,94 @@
+"""
+Weekly, per-protein-category and rolling nutrition aggregates over many
+weeks: Python loops over ``DayMenu`` models versus :class:`NutritionTable`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_nutrition [--repeat N] [--weeks N]
+"""
+
+import argparse
+import timeit
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from dinner_daily_helpers.nutrition import FIELDS, NutritionTable
+from dinner_daily_helpers.types.week import Week
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def aggregate_loops(menus, window=4):
+    weekly = [
+        [
+            sum(getattr(day_menu, field) for day_menu in menu.day_menus)
+            for field in FIELDS
+        ]
+        for menu in menus
+    ]
+    totals = defaultdict(lambda: [0.0] * len(FIELDS))
+    counts = defaultdict(int)
+    for menu in menus:
+        for day_menu in menu.day_menus:
+            category = day_menu.main.protein_category
+            counts[category] += 1
+            for j, field in enumerate(FIELDS):
+                totals[category][j] += getattr(day_menu, field)
+    by_category = {
+        category: [total / counts[category] for total in totals[category]]
+        for category in totals
+    }
+    rolling = [
+        [
+            sum(week[j] for week in weekly[i : i + window]) / window
+            for j in range(len(FIELDS))
+        ]
+        for i in range(len(weekly) - window + 1)
+    ]
+    return weekly, by_category, rolling
+
+
+def aggregate_table(menus, window=4):
+    table = NutritionTable.from_menus(menus)
+    return table.weekly(), table.by_protein_category(), table.rolling_mean(window)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--weeks", type=int, default=520)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    weeks = [Week.parse_file(p) for p in sorted(FIXTURES_DIR.glob("weeks/*.json"))]
+    menus = [weeks[i % len(weeks)].menu for i in range(args.weeks)]
+
+    weekly, by_category, rolling = aggregate_loops(menus)
+    weekly_, by_category_, rolling_ = aggregate_table(menus)
+    identical = (
+        np.allclose(weekly, weekly_)
+        and np.allclose(rolling, rolling_)
+        and all(np.allclose(v, by_category_[k]) for k, v in by_category.items())
+    )
+    table = NutritionTable.from_menus(menus)
+    for name, function in (
+        ("Python loops", lambda: aggregate_loops(menus)),
+        ("NutritionTable", lambda: aggregate_table(menus)),
+        (
+            "  (aggregates only)",
+            lambda: (
+                table.weekly(),
+                table.by_protein_category(),
+                table.rolling_mean(4),
+            ),
+        ),
+    ):
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{ name:20s} { duration * 1e3:8.2f} ms  "
+            f"output { 'identical' if identical else 'DIFFERS' }"
+        )
@@ -0,0 +1,88 @@
+"""
+Compare ``bs4`` tree builders on the archived fixture HTML.
+
+For each parser, time parsing every fixture document once and running all
+extractors on the shared :class:`ParsedDocument`, and check that every parser
+produces the same output as ``html5lib``.  Also compare the ``bs4`` and
+``lxml`` (XPath) engines of :func:`extract_menu` on the weekly menus.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parsers [--repeat N]
+"""
+
+import argparse
+import timeit
+import warnings
+from pathlib import Path
+
+import dinner_daily_helpers as ddh
+from dinner_daily_helpers.document import ParsedDocument
+from dinner_daily_helpers.menu import extract_menu
+from dinner_daily_helpers.shopping_list import extract_shopping_list
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+PARSERS = ("html5lib", "lxml", "html.parser")
+
+
+def extract_all(menus, shopping_lists, parser):
+    results = [extract_menu(ParsedDocument(html, parser)) for html in menus]
+    for html in shopping_lists:
+        document = ParsedDocument(html, parser)
+        results += [
+            extract_shopping_list(document).astype(str).to_dict("records"),
+            ddh.get_staple_ingredients(document),
+            ddh.get_section_ingredients(document).astype(str).to_dict("records"),
+        ]
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    warnings.simplefilter("ignore")
+    menus = [p.read_text() for p in sorted(FIXTURES_DIR.glob("legacy_html/*.html"))]
+    shopping_lists = [
+        p.read_text() for p in sorted(FIXTURES_DIR.glob("legacy_shopping_lists/*.html"))
+    ]
+
+    expected = extract_all(menus, shopping_lists, PARSERS[0])
+    print(f"{ len(menus) } menus, { len(shopping_lists) } shopping lists")
+    for parser in PARSERS:
+        try:
+            identical = extract_all(menus, shopping_lists, parser) == expected
+        except Exception as exception:
+            print(f"{ parser:12s} unavailable ({ exception })")
+            continue
+        duration = min(
+            timeit.repeat(
+                lambda: extract_all(menus, shopping_lists, parser),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{ parser:12s} { duration * 1e3:8.1f} ms  "
+            f"output { 'identical' if identical else 'DIFFERS' }"
+        )
+
+    print()
+    expected = [extract_menu(html) for html in menus]
+    for engine in ("bs4", "lxml"):
+        identical = [extract_menu(html, engine=engine) for html in menus] == expected
+        duration = min(
+            timeit.repeat(
+                lambda: [extract_menu(html, engine=engine) for html in menus],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"extract_menu(engine={ engine !r:6s}) { duration * 1e3:8.1f} ms  "
+            f"output { 'identical' if identical else 'DIFFERS' }"
+        )
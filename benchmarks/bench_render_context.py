@@ -0,0 +1,99 @@
+"""
+Time the ingredient tables of the weekly menu template on menus with 5, 7 and
+30 meals: computed by :func:`render_context` (one sort and ``groupby`` pass)
+versus the former per-meal pandas expressions evaluated inside the template.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_render_context [--repeat N] [--meals N [N ...]]
+"""
+
+import argparse
+import timeit
+import warnings
+from pathlib import Path
+
+from dinner_daily_helpers.menu import ingredients_table
+from dinner_daily_helpers.render import (
+    RenderFormat,
+    load_legacy_menu,
+    render,
+    render_context,
+)
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def menu_with_meals(menus, count):
+    """
+    Menu with ``count`` meals, cycling through the meals of ``menus``.
+    """
+    meals = [meal for menu in menus for meal in menu.meals]
+    return menus[0].copy(
+        update={"meals": [meals[i % len(meals)] for i in range(count)]}
+    )
+
+
+def template_tables(menu):
+    """
+    Ingredient tables as previously computed by ``weekly_menu.template.md``.
+    """
+    menu_dict = menu.dict()
+    df_ingredients = ingredients_table(menu_dict)
+    return {
+        "preparation_html": df_ingredients.sort_values(
+            ["ingredient", "processing", "meal"]
+        )
+        .dropna()
+        .set_index(["ingredient", "processing"])[["quantity", "unit", "meal", "dish"]]
+        .to_html(),
+        "meal_ingredients_html": [
+            df_ingredients.fillna("-")
+            .set_index("meal")
+            .loc[i + 1]
+            .set_index(["processing", "ingredient"])
+            .sort_index()[["quantity", "unit", "dish"]]
+            .dropna()
+            .to_html()
+            for i in range(len(menu_dict["meals"]))
+        ],
+        "summary_html": df_ingredients.sort_values(["ingredient", "meal"])
+        .set_index(["ingredient", "meal", "dish"])[["quantity", "unit"]]
+        .to_html(),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--meals", type=int, nargs="+", default=[5, 7, 30])
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    warnings.simplefilter("ignore")
+    menus = [
+        load_legacy_menu(path)
+        for path in sorted(FIXTURES_DIR.glob("legacy_menus/*.json"))
+    ]
+
+    print(f"{ 'meals':>6s} { 'template':>12s} { 'context':>12s} { 'render':>12s}")
+    for count in args.meals:
+        menu = menu_with_meals(menus, count)
+        context = render_context(menu)
+        expected = template_tables(menu)
+        identical = all(context[key] == value for key, value in expected.items())
+        durations = [
+            min(timeit.repeat(function, number=1, repeat=args.repeat))
+            for function in (
+                lambda: template_tables(menu),
+                lambda: render_context(menu),
+                lambda: render(menu, RenderFormat.MARKDOWN),
+            )
+        ]
+        print(
+            f"{ count:6d} "
+            + " ".join(f"{ duration * 1e3:9.1f} ms" for duration in durations)
+            + f"  output { 'identical' if identical else 'DIFFERS' }"
+        )
@@ -0,0 +1,48 @@
+"""
+Measure ``Week`` parse throughput (weeks/sec) on the fixture weeks, scaled
+up: full pydantic validation versus the trusted (construct-based) load path.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_week_parse [--repeat N] [--weeks N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from dinner_daily_helpers.types.trusted import parse_raw_trusted
+from dinner_daily_helpers.types.week import Week
+
+FIXTURES_DIR = Path(__file__).parents[1].joinpath("tests", "fixtures")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--weeks", type=int, default=500)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    fixtures = [p.read_bytes() for p in sorted(FIXTURES_DIR.glob("weeks/*.json"))]
+    sources = [fixtures[i % len(fixtures)] for i in range(args.weeks)]
+
+    expected = [Week.parse_raw(source) for source in sources[: len(fixtures)]]
+    for name, parse in (
+        ("Week.parse_raw", Week.parse_raw),
+        ("parse_raw_trusted", lambda source: parse_raw_trusted(Week, source)),
+    ):
+        identical = [parse(source) for source in sources[: len(fixtures)]] == expected
+        duration = min(
+            timeit.repeat(
+                lambda: [parse(source) for source in sources],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{ name:18s} { args.weeks / duration:9.0f} weeks/s  "
+            f"output { 'identical' if identical else 'DIFFERS' }"
+        )
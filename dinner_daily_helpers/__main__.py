@@ -8,6 +8,7 @@ import os
 import pathlib
 import subprocess as sp
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -15,8 +16,11 @@ import jinja2
 import pandas as pd
 from pydantic import ValidationError
 
+from .batch import find_sources, format_summary, render_batch
+from .cache import DEFAULT_CACHE_DIR, MenuCache
 from .menu import extract_menu, ingredients_table
-from .render import RenderFormat, load_legacy_menu, render
+from .render import HtmlBackend, RenderFormat, load_legacy_menu, render
+from .serialize import write_json, write_ndjson
 from .types.legacy import LegacyMenu, to_legacy
 from .types.week import Week
 
@@ -27,7 +31,8 @@ def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "source",
-        help="A (legacy) weekly menu HTML document, a JSON LegacyMenu, or a JSON Week.",
+        help="A (legacy) weekly menu HTML document, a JSON LegacyMenu, or a JSON Week. "
+        "With `--output-dir`: a directory or glob pattern of such documents.",
     )
     parser.add_argument(
         "output_path",
@@ -36,9 +41,51 @@ def parse_args():
         nargs="?",
     )
     parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write each menu of `source` (a document, directory, or glob pattern) "
+        "as one line of JSON.",
+    )
     parser.add_argument("--markdown", action="store_true")
+    parser.add_argument(
+        "--html-backend",
+        choices=[backend.value for backend in HtmlBackend],
+        help="Markdown to HTML converter (default: `markdown-it` if installed, "
+        "otherwise `pandoc`).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="Batch mode: render each source document into this directory, "
+        "skipping outputs newer than their source.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Batch mode: number of rendering processes (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Batch mode: render even if outputs are up to date.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse (or store) parsed menus in the cache directory "
+        f"(default: `{ DEFAULT_CACHE_DIR }`).",
+    )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.output_dir is not None and args.output_path != "-":
+        parser.error("`output_path` cannot be combined with `--output-dir`.")
+    if args.output_dir is not None and args.ndjson:
+        parser.error("`--ndjson` cannot be combined with `--output-dir`.")
+    return args
 
 
 if __name__ == "__main__":
@@ -50,10 +97,44 @@ if __name__ == "__main__":
     else:
         format_ = RenderFormat.HTML
 
+    if args.output_dir is not None:
+        start = time.perf_counter()
+        results = render_batch(
+            find_sources(args.source),
+            args.output_dir,
+            format_=format_,
+            jobs=args.jobs,
+            html_backend=args.html_backend,
+            cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+            force=args.force,
+        )
+        print(format_summary(results, time.perf_counter() - start))
+        sys.exit(1 if any(result.status == "failed" for result in results) else 0)
+
+    cache = None if args.no_cache else MenuCache()
+    if args.json or args.ndjson:
+        # Stream JSON straight to the output.
+        output = (
+            sys.stdout.buffer
+            if args.output_path == "-"
+            else open(args.output_path, "wb")
+        )
+        with output:
+            if args.ndjson:
+                source_path = Path(args.source)
+                paths = (
+                    [source_path]
+                    if source_path.is_file()
+                    else find_sources(source_path)
+                )
+                write_ndjson((load_legacy_menu(p, cache=cache) for p in paths), output)
+            else:
+                write_json(load_legacy_menu(Path(args.source), cache=cache), output)
+        sys.exit(0)
+
     source_path = Path(args.source)
-    menu = load_legacy_menu(source_path)
-    rendered = render(menu, format_=format_)
-    rendered_str = rendered.decode("utf8")
+    menu = load_legacy_menu(source_path, cache=cache)
+    rendered_str = render(menu, format_=format_, html_backend=args.html_backend)
 
     if args.output_path == "-":
         print(rendered_str)
@@ -0,0 +1,249 @@
+"""
+Direct access to the Dinner Daily API with the bearer token of a logged in
+session, without a browser.
+
+A browser is only needed to log in (see :func:`scrape.browser_refresh`), when
+there is no saved session or the saved one has expired::
+
+    >>> store = TokenStore()
+    >>> refresh = browser_refresh(username, password)
+    >>> with DinnerDailyClient(token_store=store, refresh=refresh) as client:
+    ...     week = client.fetch_week(WeekOption.PREVIOUS)
+"""
+
+import base64
+import concurrent.futures
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import requests
+import requests.adapters
+from pydantic import BaseModel
+
+from .types.menu import Menu
+from .types.shopping_list import ShoppingList
+from .types.week import Week, WeekOption
+
+__all__ = [
+    "BASE_URL",
+    "DEFAULT_TOKEN_PATH",
+    "DinnerDailyClient",
+    "Session",
+    "SessionExpired",
+    "TokenStore",
+]
+
+BASE_URL = "https://db.thedinnerdaily.com/api/v2"
+DEFAULT_TOKEN_PATH = Path(
+    os.environ.get(
+        "DINNER_DAILY_TOKEN_FILE",
+        Path(
+            os.environ.get("XDG_CONFIG_HOME", Path.home().joinpath(".config"))
+        ).joinpath("dinner_daily_helpers", "session.json"),
+    )
+)
+#: Seconds before expiry at which a token is refreshed ahead of time.
+REFRESH_MARGIN = 60
+
+
+class Session(BaseModel):
+    token: str
+    refreshToken: str  # XXX TODO: find refresh URL
+
+    def expires_at(self) -> Optional[float]:
+        """
+        Expiry (seconds since the epoch) of :attr:`token`, if it is a JWT with
+        an ``exp`` claim.
+        """
+        try:
+            payload = self.token.split(".")[1]
+            claims = json.loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            )
+            return float(claims["exp"])
+        except Exception:
+            return None
+
+
+class SessionExpired(Exception):
+    """
+    The session was rejected and could not be refreshed.
+    """
+
+
+class TokenStore:
+    """
+    Session saved in a JSON file only readable by its owner (mode ``0600``).
+
+    Use one store (file) per account.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_TOKEN_PATH):
+        self.path = Path(path)
+
+    def load(self) -> Optional[Session]:
+        try:
+            return Session.parse_file(self.path)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, session: Session):
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # `mkstemp()` creates the file with mode 0600.
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{ self.path.name }."
+        )
+        try:
+            with os.fdopen(fd, "w") as output:
+                output.write(session.json())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def clear(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class DinnerDailyClient:
+    """
+    Pooled, keep-alive HTTP client for the Dinner Daily API.
+
+    Parameters
+    ----------
+    session
+        Session to authenticate with (default: loaded from ``token_store``).
+    token_store
+        Where sessions are loaded from and new sessions are saved to.
+    refresh
+        Called with the expired session (or ``None`` if there is none) to get
+        a new one, e.g., :func:`scrape.browser_refresh`.  Without it, requests
+        with an expired session raise :class:`SessionExpired`.
+    base_url
+        API root URL (default: :data:`BASE_URL`).
+    pool_size
+        Maximum number of connections kept open to the API, and of requests
+        sent at once.
+    timeout
+        Connect/read timeout (in seconds) applied to every request.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        token_store: Optional[TokenStore] = None,
+        refresh: Optional[Callable[[Optional[Session]], Session]] = None,
+        base_url: Optional[str] = None,
+        pool_size: int = 10,
+        timeout: Optional[float] = 30.0,
+    ):
+        if session is None and token_store is not None:
+            session = token_store.load()
+        self.session = session
+        self.token_store = token_store
+        self.refresh = refresh
+        self.base_url = BASE_URL if base_url is None else base_url
+        self.timeout = timeout
+        self._refresh_lock = threading.Lock()
+        self.http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="dinner-daily-api"
+        )
+
+    def close(self):
+        self._executor.shutdown()
+        self.http.close()
+
+    def __enter__(self) -> "DinnerDailyClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _refresh(self, expired: Optional[Session]) -> Session:
+        with self._refresh_lock:
+            # Another thread may have refreshed the session in the meantime.
+            if self.session is not None and self.session != expired:
+                return self.session
+            if self.refresh is None:
+                raise SessionExpired("Session expired; log in again.")
+            self.session = self.refresh(expired)
+            if self.token_store is not None:
+                self.token_store.save(self.session)
+            return self.session
+
+    def _current_session(self) -> Session:
+        session = self.session
+        if session is None:
+            return self._refresh(None)
+        expires_at = session.expires_at()
+        if expires_at is not None and expires_at - time.time() < REFRESH_MARGIN:
+            return self._refresh(session)
+        return session
+
+    def get_json(self, path: str, **params) -> Any:
+        """
+        ``GET`` ``path`` (relative to :attr:`base_url`), refreshing the
+        session once if it is rejected (HTTP 401).
+        """
+        session = self._current_session()
+        for attempt in range(2):
+            response = self.http.get(
+                f"{ self.base_url }/{ path.lstrip('/') }",
+                params=params,
+                headers={"Authorization": f"Bearer { session.token }"},
+                timeout=self.timeout,
+            )
+            if response.status_code != 401:
+                break
+            if attempt == 0:
+                session = self._refresh(session)
+        else:
+            raise SessionExpired("Session rejected after refresh.")
+        response.raise_for_status()
+        return response.json()
+
+    def get_menu(self, week_option: WeekOption = WeekOption.CURRENT) -> Dict:
+        return self.get_json("week-menu", week=WeekOption(week_option).value)
+
+    def get_shopping_list(self, week_option: WeekOption = WeekOption.CURRENT) -> Dict:
+        return self.get_json("shopping-list", week=WeekOption(week_option).value)
+
+    def fetch_week(self, week_option: WeekOption = WeekOption.CURRENT) -> Week:
+        """
+        Menu and shopping list of ``week_option``, fetched concurrently.
+        """
+        return self.fetch_weeks([week_option])[0]
+
+    def fetch_weeks(self, week_options: Iterable[WeekOption]) -> List[Week]:
+        """
+        Same as :meth:`fetch_week` for each of ``week_options``, with all
+        requests sent at once.
+        """
+        futures = [
+            (
+                self._executor.submit(self.get_menu, week_option),
+                self._executor.submit(self.get_shopping_list, week_option),
+            )
+            for week_option in week_options
+        ]
+        return [
+            Week(
+                menu=Menu.parse_obj(menu.result()),
+                shopping_list=ShoppingList.parse_obj(shopping_list.result()),
+            )
+            for menu, shopping_list in futures
+        ]
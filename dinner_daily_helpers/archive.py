@@ -0,0 +1,285 @@
+"""
+Columnar archive of weekly menus and shopping lists.
+
+Each :class:`Week` is flattened into the following Parquet tables, partitioned
+by week start date, with one file per menu (so weeks of several households or
+stores starting on the same date are kept apart)
+(``<root>/<table>/start_date=YYYY-MM-DD/menu-<menu id>.parquet``):
+
+``day_menus``
+    One row per ``Menu.day_menus`` entry (nutrition, main dish name, ...).
+``dishes``
+    One row per main or side dish of each day.
+``ingredients``
+    One row per dish ingredient.
+``shopping_items``
+    One row per shopping list item, with its ``section`` (e.g., ``produce``).
+
+Reads only load the requested columns and weeks, e.g.::
+
+    >>> archive = WeekArchive("archive")
+    >>> df = archive.read("shopping_items", columns=["name"],
+    ...                   start="2021-01-01", end="2022-01-01")
+    >>> df.name.str.contains("salmon").sum()
+
+Requires ``pyarrow``.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .files import write_atomic
+from .types.week import Week
+
+__all__ = ["TABLE_SCHEMAS", "WeekArchive", "flatten_week"]
+
+SHOPPING_LIST_SECTIONS = (
+    "dairy",
+    "frozen_foods",
+    "grocery",
+    "meat_poultry",
+    "produce",
+    "seafood",
+    "staples",
+    "other",
+)
+
+TABLE_SCHEMAS = {
+    "day_menus": pa.schema(
+        [
+            ("menu_id", pa.int64()),
+            ("day", pa.int16()),
+            ("id", pa.int64()),
+            ("main_name", pa.string()),
+            ("main_id", pa.int64()),
+            ("protein_category", pa.int8()),
+            ("calories", pa.float64()),
+            ("carbs", pa.float64()),
+            ("fat", pa.float64()),
+            ("fiber", pa.float64()),
+            ("protein", pa.float64()),
+            ("saturated_fat", pa.float64()),
+            ("sodium", pa.float64()),
+            ("time_to_table", pa.float64()),
+            ("corner_note", pa.string()),
+        ]
+    ),
+    "dishes": pa.schema(
+        [
+            ("menu_id", pa.int64()),
+            ("day", pa.int16()),
+            ("id", pa.int64()),
+            ("name", pa.string()),
+            ("dish_type", pa.int8()),
+            ("protein_category", pa.int8()),
+            ("cooking_time", pa.float64()),
+            ("preparation_time", pa.float64()),
+            ("is_personal", pa.bool_()),
+        ]
+    ),
+    "ingredients": pa.schema(
+        [
+            ("menu_id", pa.int64()),
+            ("day", pa.int16()),
+            ("dish_id", pa.int64()),
+            ("dish_name", pa.string()),
+            ("dish_type", pa.int8()),
+            ("position", pa.int16()),
+            ("ingredient", pa.string()),
+        ]
+    ),
+    "shopping_items": pa.schema(
+        [
+            ("shopping_list_id", pa.int64()),
+            ("section", pa.string()),
+            ("id", pa.int64()),
+            ("name", pa.string()),
+            ("brand", pa.string()),
+            ("formatted_amount", pa.string()),
+            ("notes", pa.string()),
+            ("cost", pa.float64()),
+            ("dish_type", pa.int8()),
+            ("is_checked", pa.bool_()),
+            ("is_fulfilled", pa.bool_()),
+            ("is_on_sale", pa.bool_()),
+            ("is_optional", pa.bool_()),
+        ]
+    ),
+}
+PARTITIONING = ds.partitioning(pa.schema([("start_date", pa.string())]), flavor="hive")
+
+
+def _columns(schema: pa.Schema) -> Dict[str, list]:
+    return {name: [] for name in schema.names}
+
+
+def flatten_week(week: Week) -> Dict[str, pa.Table]:
+    """
+    Flatten ``week`` into one Arrow table per archive table.
+    """
+    menu = week.menu
+    day_menus = _columns(TABLE_SCHEMAS["day_menus"])
+    dishes = _columns(TABLE_SCHEMAS["dishes"])
+    ingredients = _columns(TABLE_SCHEMAS["ingredients"])
+
+    for day, day_menu in enumerate(menu.day_menus):
+        main = day_menu.main
+        row = {
+            "menu_id": menu.id,
+            "day": day,
+            "main_id": None if main is None else main.id,
+            "protein_category": None if main is None else main.protein_category,
+        }
+        for name, values in day_menus.items():
+            values.append(row[name] if name in row else getattr(day_menu, name))
+
+        for dish in ([] if main is None else [main]) + day_menu.sides:
+            row = {"menu_id": menu.id, "day": day}
+            for name, values in dishes.items():
+                values.append(row[name] if name in row else getattr(dish, name))
+            for position, ingredient in enumerate(dish.ingredients):
+                ingredients["menu_id"].append(menu.id)
+                ingredients["day"].append(day)
+                ingredients["dish_id"].append(dish.id)
+                ingredients["dish_name"].append(dish.name)
+                ingredients["dish_type"].append(dish.dish_type)
+                ingredients["position"].append(position)
+                ingredients["ingredient"].append(ingredient)
+
+    shopping_list = week.shopping_list
+    shopping_items = _columns(TABLE_SCHEMAS["shopping_items"])
+    for section in SHOPPING_LIST_SECTIONS:
+        for item in getattr(shopping_list, section):
+            row = {"shopping_list_id": shopping_list.id, "section": section}
+            for name, values in shopping_items.items():
+                values.append(row[name] if name in row else getattr(item, name))
+
+    columns = {
+        "day_menus": day_menus,
+        "dishes": dishes,
+        "ingredients": ingredients,
+        "shopping_items": shopping_items,
+    }
+    return {
+        name: pa.table(columns[name], schema=schema)
+        for name, schema in TABLE_SCHEMAS.items()
+    }
+
+
+class WeekArchive:
+    """
+    Parquet archive of :class:`Week` data (see module documentation).
+
+    Parameters
+    ----------
+    root
+        Archive directory.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    @staticmethod
+    def partition(week: Week) -> str:
+        """
+        Partition key of ``week``, i.e., its start date (``YYYY-MM-DD``).
+        """
+        return week.menu.start_datetime.date().isoformat()
+
+    def _path(self, table: str, start_date: str, menu_id: int) -> Path:
+        return self.root.joinpath(
+            table, f"start_date={ start_date }", f"menu-{ menu_id }.parquet"
+        )
+
+    def weeks(self) -> List[str]:
+        """
+        Start dates of archived weeks (once per date, even if several menus
+        start on it).
+        """
+        return sorted(
+            {
+                path.parent.name.split("=", 1)[1]
+                for path in self.root.joinpath("shopping_items").glob(
+                    "start_date=*/menu-*.parquet"
+                )
+            }
+        )
+
+    def append(self, week: Week, overwrite: bool = False) -> bool:
+        """
+        Add ``week`` to the archive.
+
+        Returns
+        -------
+        bool
+            ``False`` if the week (i.e., its menu) was already archived (and
+            ``overwrite`` is not set).
+        """
+        start_date = self.partition(week)
+        menu_id = week.menu.id
+        # The shopping items table is written last, so it marks complete weeks.
+        if not overwrite and self._path("shopping_items", start_date, menu_id).exists():
+            return False
+        tables = flatten_week(week)
+        for name in TABLE_SCHEMAS:
+            path = self._path(name, start_date, menu_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically; dot files are ignored by readers.
+            output = pa.BufferOutputStream()
+            pq.write_table(tables[name], output)
+            write_atomic(path, output.getvalue().to_pybytes())
+        return True
+
+    def extend(self, weeks: Iterable[Week], overwrite: bool = False) -> int:
+        """
+        Add each of ``weeks`` to the archive.
+
+        Returns
+        -------
+        int
+            Number of weeks added.
+        """
+        return sum(self.append(week, overwrite=overwrite) for week in weeks)
+
+    def dataset(self, table: str) -> ds.Dataset:
+        schema = TABLE_SCHEMAS[table].append(pa.field("start_date", pa.string()))
+        return ds.dataset(
+            self.root.joinpath(table),
+            schema=schema,
+            format="parquet",
+            partitioning=PARTITIONING,
+        )
+
+    def read(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> "pandas.DataFrame":
+        """
+        Read archived rows of ``table`` into a data frame.
+
+        Parameters
+        ----------
+        table
+            Archive table name (see :data:`TABLE_SCHEMAS`).
+        columns
+            Columns to load (default: all, including ``start_date``).
+        start, end
+            Only load weeks starting in ``[start, end)`` (``YYYY-MM-DD``).
+        """
+        filter_ = None
+        if start is not None:
+            filter_ = ds.field("start_date") >= start
+        if end is not None:
+            before_end = ds.field("start_date") < end
+            filter_ = before_end if filter_ is None else filter_ & before_end
+        if not self.root.joinpath(table).exists():
+            schema = TABLE_SCHEMAS[table].append(pa.field("start_date", pa.string()))
+            return schema.empty_table().select(columns or schema.names).to_pandas()
+        return self.dataset(table).to_table(columns=columns, filter=filter_).to_pandas()
@@ -0,0 +1,177 @@
+import concurrent.futures as cf
+import glob
+import time
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from .cache import MenuCache
+from .files import write_atomic
+from .render import (
+    HtmlBackend,
+    RenderFormat,
+    get_environment,
+    load_legacy_menu,
+    render,
+)
+
+__all__ = ["BatchResult", "find_sources", "format_summary", "render_batch"]
+
+#: Menu documents picked up from a source directory.
+SOURCE_SUFFIXES = (".html", ".htm", ".json")
+OUTPUT_SUFFIXES = {
+    RenderFormat.JSON: ".json",
+    RenderFormat.MARKDOWN: ".md",
+    RenderFormat.HTML: ".html",
+}
+
+
+class BatchResult(NamedTuple):
+    source: Path
+    output: Path
+    #: ``"rendered"``, ``"skipped"`` (output up to date), or ``"failed"``.
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def find_sources(pattern: Union[str, Path]) -> List[Path]:
+    """
+    Menu documents in directory ``pattern``, or matching glob ``pattern``
+    (e.g., ``archive/**/*.html``).
+    """
+    pattern = Path(pattern)
+    if pattern.is_dir():
+        paths = (p for p in pattern.iterdir() if p.suffix.lower() in SOURCE_SUFFIXES)
+    else:
+        paths = map(Path, glob.glob(str(pattern), recursive=True))
+    return sorted(p for p in paths if p.is_file())
+
+
+def _initialize_worker():
+    # Load templates and the unit registry once per worker process.
+    from .units import ureg  # noqa: F401
+
+    get_environment().get_template("weekly_menu.template.md")
+
+
+def _render_file(
+    source: Path,
+    output: Path,
+    format_: RenderFormat,
+    html_backend: Optional[HtmlBackend],
+    cache_dir: Optional[Path],
+) -> BatchResult:
+    start = time.perf_counter()
+    try:
+        cache = None if cache_dir is None else MenuCache(cache_dir)
+        menu = load_legacy_menu(source, cache=cache)
+        rendered_str = render(menu, format_=format_, html_backend=html_backend)
+        # Write atomically so an interrupted run never leaves a partial output
+        # that looks up to date.
+        write_atomic(output, rendered_str)
+    except Exception as exception:
+        return BatchResult(
+            source,
+            output,
+            "failed",
+            time.perf_counter() - start,
+            f"{ type(exception).__name__ }: { exception }",
+        )
+    return BatchResult(source, output, "rendered", time.perf_counter() - start)
+
+
+def render_batch(
+    sources: Iterable[Path],
+    output_dir: Union[str, Path],
+    format_: RenderFormat = RenderFormat.HTML,
+    jobs: int = 1,
+    html_backend: Optional[HtmlBackend] = None,
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> List[BatchResult]:
+    """
+    Render each source menu to ``output_dir/<source stem>.<format>``.
+
+    Parameters
+    ----------
+    sources
+        Menu documents (see :func:`render.load_legacy_menu`).
+    jobs
+        Number of worker processes (``1``: render in this process).
+    cache_dir
+        Menu cache directory (see :class:`cache.MenuCache`), or ``None`` to
+        disable caching.
+    force
+        Render even if an output is at least as recent as its source.
+
+    Returns
+    -------
+    List[BatchResult]
+        One result per source, in order.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    format_ = RenderFormat(format_)
+
+    results = []
+    pending = []
+    sources_by_output = {}
+    for source in sources:
+        source = Path(source)
+        output = output_dir.joinpath(source.stem + OUTPUT_SUFFIXES[format_])
+        if output.resolve() == source.resolve():
+            raise ValueError(f"Output would overwrite source `{ source }`.")
+        if output in sources_by_output:
+            raise ValueError(
+                f"Sources `{ sources_by_output[output] }` and `{ source }` would "
+                f"both be rendered to `{ output }`."
+            )
+        sources_by_output[output] = source
+        if (
+            not force
+            and output.exists()
+            and output.stat().st_mtime >= source.stat().st_mtime
+        ):
+            results.append(BatchResult(source, output, "skipped"))
+        else:
+            results.append(None)
+            pending.append((len(results) - 1, source, output))
+
+    arguments = [
+        (source, output, format_, html_backend, cache_dir)
+        for _, source, output in pending
+    ]
+    if jobs > 1 and len(pending) > 1:
+        with cf.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_initialize_worker
+        ) as executor:
+            rendered = list(executor.map(_render_file, *zip(*arguments)))
+    else:
+        rendered = [_render_file(*arguments_i) for arguments_i in arguments]
+
+    for (i, _, _), result in zip(pending, rendered):
+        results[i] = result
+    return results
+
+
+def format_summary(results: List[BatchResult], elapsed: float) -> str:
+    """
+    Per-file timing table, with totals.
+    """
+    lines = []
+    for result in results:
+        line = (
+            f"{ result.seconds * 1e3:9.1f} ms  { result.status:8s}  { result.source }"
+        )
+        if result.error:
+            line += f"  ({ result.error })"
+        lines.append(line)
+    counts = {
+        status: sum(result.status == status for result in results)
+        for status in ("rendered", "skipped", "failed")
+    }
+    lines.append(
+        f"{ elapsed * 1e3:9.1f} ms  total     "
+        + ", ".join(f"{ count } { status }" for status, count in counts.items())
+    )
+    return "\n".join(lines)
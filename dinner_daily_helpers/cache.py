@@ -0,0 +1,125 @@
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import __version__
+
+__all__ = ["CACHE_FORMAT", "DEFAULT_CACHE_DIR", "MenuCache"]
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get(
+        "DINNER_DAILY_CACHE_DIR",
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home().joinpath(".cache"))).joinpath(
+            "dinner_daily_helpers"
+        ),
+    )
+)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+#: Version of cached entries: bump whenever parsing yields different menus
+#: (e.g., on changes to ``extract_menu()``), so stale entries are ignored.
+CACHE_FORMAT = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_hash() -> bytes:
+    from .types.legacy import LegacyMenu
+
+    return hashlib.sha256(LegacyMenu.schema_json().encode("utf8")).digest()
+
+
+class MenuCache:
+    """
+    On-disk cache of parsed menus, keyed by a hash of the source document, the
+    package version, :data:`CACHE_FORMAT` and the ``LegacyMenu`` schema.
+
+    Entries are pickled.  Once the cache grows beyond ``max_bytes``, the least
+    recently used entries are evicted.
+
+    Parameters
+    ----------
+    directory
+        Cache directory (default: ``$DINNER_DAILY_CACHE_DIR``, or
+        ``$XDG_CACHE_HOME/dinner_daily_helpers``).
+    max_bytes
+        Maximum total size of cached entries.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(source: bytes) -> str:
+        salt = f"{ __version__ }\0{ CACHE_FORMAT }\0".encode("utf8") + _schema_hash()
+        return hashlib.sha256(salt + b"\0" + source).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory.joinpath(f"{ key }.pickle")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with path.open("rb") as input_:
+                value = pickle.load(input_)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry (possibly removed by another process
+            # in the meantime).
+            path.unlink(missing_ok=True)
+            return None
+        # Mark entry as recently used (unless evicted in the meantime).
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent readers never see a partial entry.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as output:
+            try:
+                pickle.dump(value, output, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                output.close()
+                os.unlink(output.name)
+                raise
+        os.replace(output.name, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in
+        ``max_bytes``.
+        """
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self):
+        for path in self.directory.glob("*.pickle"):
+            path.unlink()
@@ -0,0 +1,212 @@
+"""
+Consolidate shopping lists of many weeks into one list, summing the amounts
+of each ingredient (e.g., ``3/4 lb`` + ``8 oz`` = ``1.25 lb``).
+
+Example::
+
+    >>> consolidate(week.shopping_list for week in month)
+    >>> # Or straight from the Parquet archive.
+    >>> consolidate(archive.read("shopping_items", start="2021-05-01",
+    ...                          end="2021-06-01"))
+"""
+
+import re
+from typing import Any, Dict, Iterable, Union
+
+import pandas as pd
+
+from .quantity import parse_quantity
+from .types.compact import SECTIONS
+
+__all__ = ["consolidate", "items_frame", "normalize_names", "parse_amounts"]
+
+CRE_MIXED_NUMBER = re.compile(r"^(\d+)\s+(\d+/\d+)")
+CRE_FLUID_OUNCE = re.compile(r"\bfl\.?\s+oz\b")
+# A single integer, decimal, fraction or mixed number, then the unit (e.g.,
+# "1 8-oz pkg" is 1 "8-oz pkg").
+CRE_AMOUNT = re.compile(
+    r"^(?P<number>\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?)"
+    r"(?:\s+|(?=[^\d./])|$)(?P<unit>.*)$"
+)
+
+
+def items_frame(shopping_lists: Iterable[Any]) -> pd.DataFrame:
+    """
+    Items of ``ShoppingList`` (or ``CompactShoppingList``) objects, one row
+    per item, with ``week`` (index of the list), ``section``, ``name`` and
+    ``formatted_amount`` columns.
+    """
+    rows = [
+        (i, section, item.name, item.formatted_amount)
+        for i, shopping_list in enumerate(shopping_lists)
+        for section in SECTIONS
+        for item in getattr(shopping_list, section)
+    ]
+    return pd.DataFrame(rows, columns=["week", "section", "name", "formatted_amount"])
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """
+    Lower case, without parenthesized remarks or repeated whitespace, e.g.,
+    ``"Red pepper (or orange or yellow)"`` becomes ``"red pepper"``.
+    """
+    return (
+        names.str.lower()
+        .str.replace(r"\([^)]*\)", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip(" ,")
+    )
+
+
+def _parse_amount(amount: str) -> Dict[str, Any]:
+    """
+    Parse ``amount`` (e.g., ``"1 1/2 lbs"``) into:
+
+    - ``magnitude``: amount in ``group_unit``;
+    - ``group_unit``: unit used to sum compatible amounts (base unit of the
+      dimension, or the unit itself for countable units, e.g., ``bunch``);
+    - ``unit``: unit as written.
+    """
+    import pint
+
+    from .units import ureg
+
+    expression = CRE_MIXED_NUMBER.sub(r"(\1 + \2)", amount.strip())
+    # "fl oz" would parse as femtoliter ounce.
+    expression = CRE_FLUID_OUNCE.sub("floz", expression)
+    try:
+        parsed = parse_quantity(expression)
+    except pint.UndefinedUnitError:
+        # Unknown unit, e.g., "1 package of 6": count it by its unit name.
+        match = CRE_AMOUNT.match(amount.strip())
+        if match is None:
+            return {"magnitude": float("nan"), "group_unit": amount, "unit": amount}
+        unit = match.group("unit") or "each"
+        number = CRE_MIXED_NUMBER.sub(r"(\1 + \2)", match.group("number"))
+        try:
+            magnitude = float(parse_quantity(number).imperial)
+        except Exception:
+            magnitude = float("nan")
+        return {"magnitude": magnitude, "group_unit": unit, "unit": unit}
+    except Exception:
+        return {"magnitude": float("nan"), "group_unit": amount, "unit": amount}
+
+    imperial, metric = parsed
+    if not isinstance(imperial, ureg.Quantity):
+        # Plain number, e.g., "3" lemons.
+        return {"magnitude": float(imperial), "group_unit": "each", "unit": "each"}
+    unit = "each" if imperial.unitless else str(imperial.units)
+    if imperial.dimensionless:
+        # Countable units (e.g., bunch, head) are all dimensionless, so only
+        # sum amounts of the same unit.
+        return {
+            "magnitude": float(imperial.magnitude),
+            "group_unit": unit,
+            "unit": unit,
+        }
+    return {
+        "magnitude": float(metric.magnitude),
+        "group_unit": str(metric.units),
+        "unit": unit,
+    }
+
+
+def parse_amounts(amounts: pd.Series) -> pd.DataFrame:
+    """
+    Parse amounts (see :func:`_parse_amount`), each distinct amount once.
+    """
+    distinct = amounts.dropna().unique()
+    parsed = pd.DataFrame(
+        [_parse_amount(amount) for amount in distinct], index=distinct
+    )
+    if parsed.empty:
+        parsed = pd.DataFrame(columns=["magnitude", "group_unit", "unit"])
+    return parsed.reindex(amounts.values).set_index(amounts.index)
+
+
+def _most_common(units: pd.Series) -> Any:
+    """
+    Most common of ``units``, or NaN if none of the amounts was given.
+    """
+    modes = units.mode()
+    return modes.iat[0] if len(modes) else float("nan")
+
+
+def _unit_factor(unit: str, group_unit: str) -> float:
+    """
+    Size of one ``unit`` in ``group_unit``.
+    """
+    if unit == group_unit:
+        return 1.0
+    return float(parse_quantity(f"1 { unit }").metric.to(group_unit).magnitude)
+
+
+def consolidate(
+    items: Union[pd.DataFrame, Iterable[Any]],
+    name: str = "name",
+    amount: str = "formatted_amount",
+    section: str = "section",
+) -> pd.DataFrame:
+    """
+    Sum the amounts of each ingredient, across any number of weeks.
+
+    Parameters
+    ----------
+    items
+        Shopping lists (see :func:`items_frame`), or a frame with one row per
+        item (e.g., ``archive.WeekArchive.read("shopping_items")``).
+    name, amount, section
+        Columns of ``items`` holding the ingredient name, its amount (e.g.,
+        ``"3/4 lb"``) and the store section.  For the output of
+        :func:`shopping_list.extract_shopping_list`, use ``name="ingredient",
+        amount="quantity", section="category"``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per store section, (normalized) ingredient and kind of unit,
+        with columns ``section``, ``ingredient``, ``quantity`` and ``unit``
+        (most common unit of the summed amounts), ``items`` (number of summed
+        items) and, if ``items`` has a ``week`` (or ``start_date``) column,
+        ``weeks`` (number of distinct weeks).
+    """
+    df = items if isinstance(items, pd.DataFrame) else items_frame(items)
+    week = next((c for c in ("week", "start_date") if c in df.columns), None)
+    df_items = pd.DataFrame(
+        {
+            "section": df[section].values,
+            "ingredient": normalize_names(df[name].astype(str)).values,
+        }
+    )
+    df_items = df_items.join(parse_amounts(df[amount]).reset_index(drop=True))
+    if week is not None:
+        df_items["week"] = df[week].values
+
+    keys = ["section", "ingredient", "group_unit"]
+    grouped = df_items.groupby(keys, sort=True, dropna=False)
+    aggregations = {
+        "magnitude": ("magnitude", "sum"),
+        "parsed": ("magnitude", "count"),
+        "unit": ("unit", _most_common),
+        "items": ("magnitude", "size"),
+    }
+    if week is not None:
+        aggregations["weeks"] = ("week", "nunique")
+    df_consolidated = grouped.agg(**aggregations).reset_index()
+    # Same as `sum(min_count=1)`: groups without any parsed amount (e.g., "to
+    # taste") have no total, rather than 0.
+    df_consolidated["magnitude"] = df_consolidated["magnitude"].where(
+        df_consolidated["parsed"] > 0
+    )
+
+    # Express totals in the most common unit of each group, e.g., lb.
+    # Missing amounts (e.g., staples) have no unit, nor total to convert.
+    pairs = list(zip(df_consolidated["unit"], df_consolidated["group_unit"]))
+    factors = {pair: _unit_factor(*pair) for pair in set(pairs) if pd.notna(pair[0])}
+    df_consolidated["quantity"] = df_consolidated["magnitude"] / [
+        factors.get(pair, 1.0) for pair in pairs
+    ]
+    columns = ["section", "ingredient", "quantity", "unit", "items"]
+    if week is not None:
+        columns.append("weeks")
+    return df_consolidated[columns]
@@ -0,0 +1,38 @@
+from typing import Optional, Union
+
+import bs4
+
+__all__ = ["DEFAULT_PARSER", "ParsedDocument"]
+
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    DEFAULT_PARSER = "html5lib"
+else:
+    DEFAULT_PARSER = "lxml"
+
+
+class ParsedDocument:
+    """
+    HTML document parsed once and shared between extractors.
+
+    Parameters
+    ----------
+    html
+        Document source.
+    parser
+        ``bs4`` tree builder (default: ``lxml`` if installed, otherwise
+        ``html5lib``).
+    """
+
+    def __init__(self, html: Union[str, bytes], parser: Optional[str] = None):
+        self.html = html
+        self.parser = DEFAULT_PARSER if parser is None else parser
+        self.soup = bs4.BeautifulSoup(html, self.parser)
+
+    @classmethod
+    def coerce(cls, document: Union[str, bytes, "ParsedDocument"]) -> "ParsedDocument":
+        """
+        Return ``document`` as is if already parsed, otherwise parse it.
+        """
+        return document if isinstance(document, cls) else cls(document)
@@ -1,14 +1,32 @@
 import argparse
+import collections
+import concurrent.futures
+import hashlib
+import json
 import logging
 import os
 import re
+from pathlib import Path
 
 import dateparser
 import requests
+import requests.adapters
 
+from .files import write_atomic
 from .menu import extract_menu
 
 DEFAULT_STORE = os.environ.get('DINNER_DAILY_STORE', 'Any Store')
+BASE_URL = 'https://db.thedinnerdaily.com/menus/'
+#: Maximum number of requests sent at once.
+MAX_WORKERS = 8
+#: Validators and content hash of each downloaded page, in the output
+#: directory.
+MANIFEST_NAME = '.download-manifest.json'
+
+#: ``status`` is ``written``, ``unchanged`` (same content as the existing file)
+#: or ``not-modified`` (HTTP 304).
+DownloadResult = collections.namedtuple('DownloadResult', 'store week page '
+                                        'path status')
 
 
 def login(username, password):
@@ -22,6 +40,9 @@ def login(username, password):
         authenticated access.
     '''
     session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     url = 'https://thedinnerdaily.com/cms/wp-login.php'
 
     data = {'log': username, 'pwd': password,
@@ -44,11 +65,40 @@ def download(week_, output_dir, session=None, username=None, password=None,
     .. versionchanged:: X.X.X
         Add ``username`` and ``password`` kwargs. Use these to authenticate
         session for download.
+    .. versionchanged:: X.X.X
+        Download the menu and the shopping list concurrently.
+    .. versionchanged:: X.X.X
+        Only rewrite changed pages (see :func:`download_weeks`).  Return
+        results.
     '''
-    if week_ not in ('current', 'previous'):
-        raise ValueError('`week` must be either `current` or `previous`.')
+    return download_weeks([week_], output_dir, session=session,
+                          username=username, password=password,
+                          stores=[store])
+
+
+def download_weeks(weeks, output_dir, session=None, username=None,
+                   password=None, stores=(DEFAULT_STORE,),
+                   max_workers=MAX_WORKERS, force=False):
+    '''
+    Download the menu and shopping list of each of ``weeks`` (``current``
+    and/or ``previous``) for each of ``stores``, with up to ``max_workers``
+    requests sent at once.
 
-    base_url = 'https://db.thedinnerdaily.com/menus/'
+    Pages are requested conditionally (``If-None-Match`` and
+    ``If-Modified-Since``), using the validators recorded in the
+    :data:`MANIFEST_NAME` file of ``output_dir``, and only (atomically)
+    rewritten if their content changed.  Set ``force`` to download and write
+    all pages.
+
+    Returns
+    -------
+    list[DownloadResult]
+        Menu and shopping list result of each store and week.
+    '''
+    weeks = list(weeks)
+    stores = list(stores)
+    if any(week_ not in ('current', 'previous') for week_ in weeks):
+        raise ValueError('`week` must be either `current` or `previous`.')
 
     if session is None:
         if any((username is None, password is None)):
@@ -57,40 +107,114 @@ def download(week_, output_dir, session=None, username=None, password=None,
         else:
             session = login(username, password)
 
-    # Download weekly menu using browser cookies.
-    menu_response = session.get(base_url + 'print/%s/%s' % (store, week_))
-    # Scrape date from menu HTML to use in file name.
-    menu = extract_menu(menu_response.text)
-    menu['date'] = re.sub(r' to .*', '', menu['date'])
-    menu_date = dateparser.parse(menu['date'])
-    # Download weekly shopping list using browser cookies.
-    list_response = session.get(base_url + 'print-shopping-list/%s/%s' %
-                                (store, week_))
-
-    cwd = os.getcwd()
+    output_dir = Path(output_dir)
+    # Always load the manifest, so entries of other stores and weeks are kept.
+    manifest = _load_manifest(output_dir)
+
+    def get(page, store, week_):
+        url = page_url(page, store, week_)
+        headers = {} if force else _conditional_headers(manifest.get(url),
+                                                         output_dir)
+        return url, executor.submit(session.get, url, headers=headers)
+
+    results = []
     try:
-        os.chdir(output_dir)
-        out_name_fmt = '%s-%%s-%s.html' % (menu_date.strftime('%Y-%m-%d'),
-                                           store)
-
-        out_name = out_name_fmt % 'weekly-menu'
-        with open(out_name, 'w') as output:
-            output.write(menu_response.text)
-        logging.info('Wrote weekly menu to: `%s`' % out_name)
-
-        out_name = out_name_fmt % 'shopping-list'
-        with open(out_name, 'w') as output:
-            output.write(list_response.text)
-        logging.info('Wrote weekly menu to: `%s`' % out_name)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            # Download weekly menus and shopping lists using browser cookies.
+            requests_ = [(store, week_, get('print', store, week_),
+                          get('print-shopping-list', store, week_))
+                         for store in stores for week_ in weeks]
+            for store, week_, menu, shopping_list in requests_:
+                results.extend(_write(store, week_, menu, shopping_list,
+                                      output_dir, manifest, force))
     finally:
-        os.chdir(cwd)
+        _save_manifest(output_dir, manifest)
+    return results
 
 
+def page_url(page, store, week_):
+    return BASE_URL + '%s/%s/%s' % (page, store, week_)
+
+
+def _load_manifest(output_dir):
+    try:
+        with output_dir.joinpath(MANIFEST_NAME).open() as input_:
+            return json.load(input_)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(output_dir, manifest):
+    write_atomic(output_dir.joinpath(MANIFEST_NAME),
+                 json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def _conditional_headers(entry, output_dir):
+    if entry is None or not output_dir.joinpath(entry['path']).exists():
+        return {}
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def _write(store, week_, menu, shopping_list, output_dir, manifest, force):
+    '''
+    Write the menu and shopping list pages of ``store`` and ``week_``, given
+    as ``(url, future response)`` pairs.
+    '''
+    menu_url = menu[0]
+    responses = [(page, url, future.result()) for page, (url, future) in
+                 (('weekly-menu', menu), ('shopping-list', shopping_list))]
+    for page, url, response in responses:
+        if response.status_code != 304:
+            response.raise_for_status()
+
+    menu_response = responses[0][2]
+    if menu_response.status_code == 304:
+        menu_date = manifest[menu_url]['date']
+    else:
+        # Scrape date from menu HTML to use in file name.
+        menu = extract_menu(menu_response.text)
+        menu['date'] = re.sub(r' to .*', '', menu['date'])
+        menu_date = dateparser.parse(menu['date']).strftime('%Y-%m-%d')
+    out_name_fmt = '%s-%%s-%s.html' % (menu_date, store)
+
+    results = []
+    for page, url, response in responses:
+        entry = manifest.get(url, {})
+        if response.status_code == 304:
+            results.append(DownloadResult(store, week_, page,
+                                          output_dir.joinpath(entry['path']),
+                                          'not-modified'))
+            continue
+
+        out_name = out_name_fmt % page
+        path = output_dir.joinpath(out_name)
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        if (not force and entry.get('sha256') == sha256
+                and entry.get('path') == out_name and path.exists()):
+            status = 'unchanged'
+            logging.debug('Unchanged: `%s`' % path)
+        else:
+            write_atomic(path, response.content)
+            status = 'written'
+            logging.info('Wrote %s to: `%s`' % (page.replace('-', ' '), path))
+        manifest[url] = {'path': out_name, 'sha256': sha256,
+                         'etag': response.headers.get('ETag'),
+                         'last_modified': response.headers.get('Last-Modified'),
+                         'date': menu_date}
+        results.append(DownloadResult(store, week_, page, path, status))
+    return results
+
 
 def parse_args():
     parser = argparse.ArgumentParser()
 
-    parser.add_argument('week', choices=('current', 'previous'))
+    parser.add_argument('weeks', nargs='+', choices=('current', 'previous'),
+                        metavar='week', help='`current` and/or `previous`.')
     parser.add_argument('--username',
                         default=os.environ.get('DINNER_DAILY_USERNAME'),
                         help='Dinner Daily username (default: '
@@ -99,8 +223,11 @@ def parse_args():
                         default=os.environ.get('DINNER_DAILY_PASSWORD'),
                         help='Dinner Daily password (default: '
                         '`DINNER_DAILY_PASSWORD` environment variable).')
-    parser.add_argument('--store', default=DEFAULT_STORE, help='Store '
-                        '(default: %(default)s)')
+    parser.add_argument('--store', dest='stores', action='append',
+                        help='Store; may be repeated (default: %s)'
+                        % DEFAULT_STORE)
+    parser.add_argument('--force', action='store_true', help='Download and '
+                        'write all pages, even if unchanged.')
     parser.add_argument('output_dir', help='Output directory.')
 
     return parser.parse_args()
@@ -109,5 +236,6 @@ def parse_args():
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
     args = parse_args()
-    download(args.week, args.output_dir, username=args.username,
-             password=args.password, store=args.store)
\ No newline at end of file
+    download_weeks(args.weeks, args.output_dir, username=args.username,
+                   password=args.password,
+                   stores=args.stores or [DEFAULT_STORE], force=args.force)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Atomic file writes.
+"""
+
+import os
+import secrets
+from pathlib import Path
+from typing import Union
+
+__all__ = ["write_atomic"]
+
+
+def write_atomic(path: Union[str, Path], data: Union[bytes, str]):
+    """
+    Write ``data`` (``str`` is UTF-8 encoded) to ``path`` through a temporary
+    dot file in the same directory, so readers never see a partial file.
+
+    The file gets the same mode as with :func:`open` (``0666`` less the
+    umask), unlike :mod:`tempfile` files which are private (``0600``).
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf8")
+    while True:
+        temp_path = path.with_name(f".{ path.name }.{ secrets.token_hex(4) }.tmp")
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        break
+    try:
+        with os.fdopen(fd, "wb") as output:
+            output.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
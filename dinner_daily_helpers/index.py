@@ -0,0 +1,380 @@
+"""
+SQLite index of past menus: dishes, decoded ingredients, meal nutrition and
+shopping list items, with full-text search over dish names, ingredients and
+instructions.
+
+Command line usage::
+
+    python -m dinner_daily_helpers.index ingest menus.db archive/*.json
+    python -m dinner_daily_helpers.index search menus.db "salmon NOT salad"
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import List, Optional, Union
+
+from pydantic import ValidationError
+
+from .cache import MenuCache
+from .menu import ingredients_table
+from .types.legacy import LegacyMenu, Nutrition, to_legacy
+from .types.shopping_list import ShoppingList
+from .types.week import Week
+
+__all__ = ["MenuIndex"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weeks (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    store TEXT NOT NULL,
+    date TEXT NOT NULL,
+    servings TEXT NOT NULL
+);
+-- Hashes of indexed source documents.
+CREATE TABLE IF NOT EXISTS sources (
+    hash TEXT PRIMARY KEY,
+    week_id INTEGER NOT NULL REFERENCES weeks(id)
+);
+CREATE TABLE IF NOT EXISTS meals (
+    week_id INTEGER NOT NULL REFERENCES weeks(id),
+    meal INTEGER NOT NULL,
+    duration TEXT NOT NULL,
+    notes TEXT,
+    calories REAL,
+    carbs REAL,
+    fat REAL,
+    fiber REAL,
+    protein REAL,
+    PRIMARY KEY (week_id, meal)
+);
+CREATE TABLE IF NOT EXISTS dishes (
+    id INTEGER PRIMARY KEY,
+    week_id INTEGER NOT NULL REFERENCES weeks(id),
+    meal INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    side INTEGER NOT NULL,
+    instructions TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dishes_title ON dishes(title);
+CREATE TABLE IF NOT EXISTS ingredients (
+    dish_id INTEGER NOT NULL REFERENCES dishes(id),
+    quantity TEXT,
+    unit TEXT,
+    ingredient TEXT,
+    processing TEXT
+);
+CREATE INDEX IF NOT EXISTS ingredients_ingredient ON ingredients(ingredient);
+CREATE INDEX IF NOT EXISTS ingredients_dish_id ON ingredients(dish_id);
+CREATE TABLE IF NOT EXISTS shopping_items (
+    week_id INTEGER NOT NULL REFERENCES weeks(id),
+    section TEXT NOT NULL,
+    name TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    formatted_amount TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    cost REAL NOT NULL,
+    is_on_sale INTEGER NOT NULL,
+    is_optional INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS shopping_items_name ON shopping_items(name);
+CREATE VIRTUAL TABLE IF NOT EXISTS dish_search USING fts5(
+    title, ingredients, instructions, tokenize = 'porter unicode61'
+);
+"""
+SHOPPING_LIST_SECTIONS = (
+    "dairy",
+    "frozen_foods",
+    "grocery",
+    "meat_poultry",
+    "produce",
+    "seafood",
+    "staples",
+    "other",
+)
+
+
+class MenuIndex:
+    """
+    SQLite index of menus (see module documentation).
+
+    Each week is identified by its menu title, store and date, so the same
+    week is only indexed once, whether it comes from a legacy HTML menu, a
+    ``LegacyMenu`` or a ``Week``.
+
+    Parameters
+    ----------
+    path
+        Database file (created if necessary), or ``":memory:"``.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def key(menu: LegacyMenu) -> str:
+        return "\0".join([menu.title, menu.store, menu.date])
+
+    def __contains__(self, menu: LegacyMenu) -> bool:
+        return self._week_id(self.key(menu)) is not None
+
+    def _week_id(self, key: str) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT id FROM weeks WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row["id"]
+
+    def add_menu(
+        self,
+        menu: LegacyMenu,
+        shopping_list: Optional[ShoppingList] = None,
+        source_hash: Optional[str] = None,
+    ) -> bool:
+        """
+        Index ``menu`` (and its shopping list, if specified).
+
+        If the week was already indexed without a shopping list, only
+        ``shopping_list`` is added.
+
+        Parameters
+        ----------
+        source_hash
+            Hash of the source document (see :meth:`add_path`).
+
+        Returns
+        -------
+        bool
+            ``False`` if the week was already indexed (and nothing was added).
+        """
+        week_id = self._week_id(self.key(menu))
+        if week_id is not None:
+            with self.connection:
+                self._add_source(source_hash, week_id)
+                has_items = self.connection.execute(
+                    "SELECT 1 FROM shopping_items WHERE week_id = ?", (week_id,)
+                ).fetchone()
+                if shopping_list is None or has_items is not None:
+                    return False
+                self._add_shopping_list(week_id, shopping_list)
+            return True
+
+        menu_dict = menu.dict()
+        df_ingredients = ingredients_table(menu_dict)
+
+        with self.connection:
+            week_id = self.connection.execute(
+                "INSERT INTO weeks (key, title, store, date, servings) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.key(menu),
+                    menu.title,
+                    menu.store,
+                    menu.date,
+                    menu.servings,
+                ),
+            ).lastrowid
+
+            # Dish of each ingredients table row (rows are in the order of the
+            # dishes and their ingredients).
+            row_dish_ids = []
+            for i, meal in enumerate(menu.meals, start=1):
+                try:
+                    nutrition = Nutrition.from_list(meal.nutrition).dict()
+                except (AttributeError, KeyError):
+                    nutrition = {}
+                self.connection.execute(
+                    "INSERT INTO meals VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (week_id, i, meal.duration, "\n".join(meal.notes or []))
+                    + tuple(
+                        nutrition.get(name)
+                        for name in ("calories", "carbs", "fat", "fiber", "protein")
+                    ),
+                )
+                dishes = [(meal.main_dish, False)] + [
+                    (dish, True) for dish in meal.side_dishes
+                ]
+                for dish, side in dishes:
+                    instructions = "\n".join(dish.instructions)
+                    dish_id = self.connection.execute(
+                        "INSERT INTO dishes (week_id, meal, title, side, instructions) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (week_id, i, dish.title, side, instructions),
+                    ).lastrowid
+                    row_dish_ids += [dish_id] * len(dish.ingredients)
+                    self.connection.execute(
+                        "INSERT INTO dish_search (rowid, title, ingredients, "
+                        "instructions) VALUES (?, ?, ?, ?)",
+                        (
+                            dish_id,
+                            dish.title,
+                            "\n".join(dish.ingredients),
+                            instructions,
+                        ),
+                    )
+
+            self.connection.executemany(
+                "INSERT INTO ingredients VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        dish_id,
+                        None if row.quantity is None else str(row.quantity),
+                        row.unit,
+                        row.ingredient,
+                        row.processing,
+                    )
+                    for dish_id, row in zip(
+                        row_dish_ids,
+                        df_ingredients.astype(object)
+                        .where(df_ingredients.notna(), None)
+                        .itertuples(),
+                    )
+                ),
+            )
+
+            if shopping_list is not None:
+                self._add_shopping_list(week_id, shopping_list)
+            self._add_source(source_hash, week_id)
+        return True
+
+    def _add_source(self, source_hash: Optional[str], week_id: int):
+        if source_hash is not None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO sources VALUES (?, ?)", (source_hash, week_id)
+            )
+
+    def _add_shopping_list(self, week_id: int, shopping_list: ShoppingList):
+        self.connection.executemany(
+            "INSERT INTO shopping_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    week_id,
+                    section,
+                    item.name,
+                    item.brand,
+                    item.formatted_amount,
+                    item.notes,
+                    item.cost,
+                    item.is_on_sale,
+                    item.is_optional,
+                )
+                for section in SHOPPING_LIST_SECTIONS
+                for item in getattr(shopping_list, section)
+            ),
+        )
+
+    def add_week(self, week: Week, source_hash: Optional[str] = None) -> bool:
+        return self.add_menu(
+            to_legacy(week.menu), week.shopping_list, source_hash=source_hash
+        )
+
+    def add_path(self, path: Path) -> bool:
+        """
+        Index a (legacy) weekly menu HTML document, a JSON ``LegacyMenu``, or a
+        JSON ``Week``, unless a document with identical contents was already
+        indexed.
+        """
+        from .menu import extract_menu
+
+        source = path.read_bytes()
+        source_hash = MenuCache.key(source)
+        row = self.connection.execute(
+            "SELECT 1 FROM sources WHERE hash = ?", (source_hash,)
+        ).fetchone()
+        if row is not None:
+            return False
+
+        if path.suffix.lower() != ".json":
+            menu = LegacyMenu.parse_obj(extract_menu(source.decode("utf8")))
+            return self.add_menu(menu, source_hash=source_hash)
+        try:
+            return self.add_week(Week.parse_raw(source), source_hash=source_hash)
+        except ValidationError:
+            return self.add_menu(LegacyMenu.parse_raw(source), source_hash=source_hash)
+
+    def search(self, query: str, limit: int = 20) -> List[sqlite3.Row]:
+        """
+        Dishes matching FTS5 ``query`` (e.g., ``salmon AND asparagus``), best
+        match first.
+
+        Returns
+        -------
+        List[sqlite3.Row]
+            Rows with ``title``, ``side``, ``meal``, ``date``, ``store`` and
+            ``snippet`` (matching ingredients or instructions) columns.
+        """
+        return self.connection.execute(
+            "SELECT dishes.title, dishes.side, dishes.meal, weeks.date, "
+            "weeks.store, snippet(dish_search, -1, '[', ']', '...', 8) AS snippet "
+            "FROM dish_search "
+            "JOIN dishes ON dishes.id = dish_search.rowid "
+            "JOIN weeks ON weeks.id = dishes.week_id "
+            "WHERE dish_search MATCH ? ORDER BY rank LIMIT ?",
+            (query, limit),
+        ).fetchall()
+
+
+def parse_args(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser(
+        "ingest", help="Index menu documents (already indexed weeks are skipped)."
+    )
+    ingest.add_argument("database", type=Path)
+    ingest.add_argument(
+        "sources",
+        nargs="+",
+        help="Menu documents, directories, or glob patterns of menu documents.",
+    )
+
+    search = subparsers.add_parser("search", help="Full-text search of dishes.")
+    search.add_argument("database", type=Path)
+    search.add_argument("query", help="FTS5 query, e.g., `salmon NOT salad`.")
+    search.add_argument("-n", "--limit", type=int, default=20)
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None):
+    from .batch import find_sources
+
+    args = parse_args(args)
+    with MenuIndex(args.database) as index:
+        if args.command == "ingest":
+            added = skipped = 0
+            for source in args.sources:
+                paths = (
+                    [Path(source)] if Path(source).is_file() else find_sources(source)
+                )
+                for path in paths:
+                    if index.add_path(path):
+                        added += 1
+                    else:
+                        skipped += 1
+            print(f"{ added } added, { skipped } already indexed")
+        else:
+            for row in index.search(args.query, limit=args.limit):
+                print(
+                    f"{ row['date'] } ({ row['store'] }), meal { row['meal'] }: "
+                    f"{ row['title'] }{ ' (side)' if row['side'] else '' }\n"
+                    f"    { row['snippet'].replace(chr(10), '; ') }"
+                )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+In-process Markdown to HTML conversion, producing output equivalent to::
+
+    pandoc -f gfm -t html --template GitHub.html5 --toc --toc-depth 2
+"""
+
+import functools
+import re
+from typing import Any, Dict, List, Tuple
+
+from markdown_it import MarkdownIt
+
+__all__ = ["markdown_to_html", "render_pandoc_template", "slugify"]
+
+CRE_TEMPLATE_COMMENT = re.compile(r"^\$--.*\n", re.MULTILINE)
+# Directives alone on a line do not produce a line in the output.
+CRE_TEMPLATE_DIRECTIVE_LINE = re.compile(
+    r"^[ \t]*(\$(?:(?:if|for)\([\w-]+\)|else|endif|endfor)\$)[ \t]*\n", re.MULTILINE
+)
+CRE_TEMPLATE_TOKEN = re.compile(
+    r"\$(?:(?P<keyword>if|for)\((?P<argument>[\w-]+)\)|(?P<end>else|endif|endfor|sep)"
+    r"|(?P<variable>[\w-]+)|(?P<dollar>))\$"
+)
+CRE_SLUG_PUNCTUATION = re.compile(r"[^\w\- ]")
+
+
+def slugify(text: str) -> str:
+    """
+    GitHub-style heading identifier: lower case, punctuation (except ``-``
+    and ``_``) removed and spaces replaced by ``-``.
+    """
+    return CRE_SLUG_PUNCTUATION.sub("", text.strip().lower()).replace(" ", "-")
+
+
+@functools.lru_cache(maxsize=None)
+def _parser() -> MarkdownIt:
+    return (
+        MarkdownIt("commonmark", {"html": True}).enable("table").enable("strikethrough")
+    )
+
+
+def _toc(headings: List[Tuple[int, str, str]]) -> str:
+    """
+    Nested ``<ul>`` of links to ``(level, id, html)`` headings.
+    """
+    # Each entry: (level, link, children)
+    root = (0, None, [])
+    stack = [root]
+    for level, id_, html in headings:
+        while stack[-1][0] >= level:
+            stack.pop()
+        entry = (level, f'<a href="#{ id_ }">{ html }</a>', [])
+        stack[-1][2].append(entry)
+        stack.append(entry)
+
+    def render(entries) -> str:
+        return "<ul>\n%s\n</ul>" % "\n".join(
+            f"<li>{ link }" + (f"\n{ render(children) }" if children else "") + "</li>"
+            for _, link, children in entries
+        )
+
+    return render(root[2]) if root[2] else ""
+
+
+def _drop_empty_table_headers(tokens: list) -> list:
+    """
+    Remove table header rows without any text (as ``pandoc`` does).
+    """
+    output = []
+    header = None
+    for token in tokens:
+        if token.type == "thead_open":
+            header = [token]
+        elif header is not None:
+            header.append(token)
+            if token.type == "thead_close":
+                if any(t.content.strip() for t in header if t.type == "inline"):
+                    output.extend(header)
+                header = None
+        else:
+            output.append(token)
+    return output
+
+
+def markdown_to_html(markdown_str: str, toc_depth: int = 2) -> Tuple[str, str]:
+    """
+    Convert GitHub-flavoured Markdown to HTML.
+
+    Returns
+    -------
+    body, toc
+        HTML of the document (headings have unique identifiers) and table of
+        contents listing headings up to level ``toc_depth``.
+    """
+    parser = _parser()
+    tokens = _drop_empty_table_headers(parser.parse(markdown_str))
+    ids = set()
+    headings = []
+    for token, inline in zip(tokens, tokens[1:]):
+        if token.type != "heading_open":
+            continue
+        text = "".join(
+            child.content
+            for child in inline.children
+            if child.type in ("text", "code_inline")
+        )
+        base = id_ = slugify(text) or "section"
+        for i in range(1, len(ids) + 2):
+            if id_ not in ids:
+                break
+            id_ = f"{ base }-{ i }"
+        ids.add(id_)
+        token.attrSet("id", id_)
+        level = int(token.tag[1:])
+        if level <= toc_depth:
+            headings.append(
+                (
+                    level,
+                    id_,
+                    parser.renderer.render(inline.children, parser.options, {}),
+                )
+            )
+    body = parser.renderer.render(tokens, parser.options, {})
+    return body, _toc(headings)
+
+
+def _parse_template(template: str) -> list:
+    template = CRE_TEMPLATE_COMMENT.sub("", template)
+    template = CRE_TEMPLATE_DIRECTIVE_LINE.sub(r"\1", template)
+
+    # Each frame: (keyword, argument, nodes, alternative nodes)
+    stack = [(None, None, [], [])]
+    in_alternative = [False]
+    position = 0
+    for match in CRE_TEMPLATE_TOKEN.finditer(template):
+        nodes = stack[-1][3] if in_alternative[-1] else stack[-1][2]
+        nodes.append(template[position : match.start()])
+        position = match.end()
+        if match.group("keyword"):
+            stack.append((match.group("keyword"), match.group("argument"), [], []))
+            in_alternative.append(False)
+        elif match.group("end") in ("else", "sep"):
+            in_alternative[-1] = True
+        elif match.group("end"):
+            keyword, argument, nodes_, alternative = stack.pop()
+            in_alternative.pop()
+            parent = stack[-1][3] if in_alternative[-1] else stack[-1][2]
+            parent.append((keyword, argument, nodes_, alternative))
+        elif match.group("variable"):
+            nodes.append(("variable", match.group("variable")))
+        else:
+            nodes.append("$")
+    stack[-1][2].append(template[position:])
+    return stack[-1][2]
+
+
+def _render_nodes(nodes: list, variables: Dict[str, Any]) -> str:
+    output = []
+    for node in nodes:
+        if isinstance(node, str):
+            output.append(node)
+            continue
+        keyword, argument, *children = node
+        value = variables.get(argument)
+        if keyword == "variable":
+            if isinstance(value, (list, tuple)):
+                value = "".join(map(str, value))
+            output.append("" if value in (None, False) else str(value))
+        elif keyword == "if":
+            output.append(
+                _render_nodes(children[0] if value else children[1], variables)
+            )
+        elif keyword == "for":
+            if value in (None, False, ""):
+                continue
+            items = value if isinstance(value, (list, tuple)) else [value]
+            body, separator = children
+            output.append(
+                _render_nodes(separator, variables).join(
+                    _render_nodes(body, dict(variables, **{argument: item}))
+                    for item in items
+                )
+            )
+    return "".join(output)
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_template(template: str) -> list:
+    return _parse_template(template)
+
+
+def render_pandoc_template(template: str, variables: Dict[str, Any]) -> str:
+    """
+    Fill a pandoc template (``$variable$``, ``$if(...)$``, ``$for(...)$``).
+    """
+    return _render_nodes(_parsed_template(template), variables)
@@ -3,12 +3,11 @@ import io
 import itertools as it
 import re
 
-import bs4
 import pandas as pd
 import pint
-import six
 
-from . import ureg
+from .document import ParsedDocument
+from .quantity import parse_quantity
 
 
 def dish_to_markdown(dish):
@@ -44,11 +43,14 @@ def dish_to_markdown(dish):
 
 
 def extract_meal(meal_div):
+    # N.B., `str()` drops the reference each `bs4` string holds to the parse
+    # tree, so results can be pickled (and do not keep the tree alive).
+
     # Duration
-    duration_i = meal_div.find('span', class_='duration').contents[0]
+    duration_i = str(meal_div.find('span', class_='duration').contents[0])
 
     # Main dish title
-    title_i = meal_div.select_one('h3 span.label').contents[0]
+    title_i = str(meal_div.select_one('h3 span.label').contents[0])
 
     def extract_recipe(recipe_div):
         recipe = {}
@@ -56,10 +58,10 @@ def extract_meal(meal_div):
         # ## Title
         title_span = recipe_div.select_one('h5 > span.label')
         if title_span is not None:
-            recipe['title'] = title_span.contents[0]
+            recipe['title'] = str(title_span.contents[0])
 
         # ## Ingredients
-        recipe['ingredients'] = [li.contents[0]
+        recipe['ingredients'] = [str(li.contents[0])
                                  for li in recipe_div.select('li')]
 
         # ## Instructions
@@ -81,7 +83,7 @@ def extract_meal(meal_div):
                      .contents[0].lower() != 'add a side']
 
     # Meal nutrition
-    nutrition_i = [li.contents[0]
+    nutrition_i = [str(li.contents[0])
                    for li in meal_div.select('ul.nutrition > li')]
 
     meal = {'main_dish': main_dish_i,
@@ -92,12 +94,32 @@ def extract_meal(meal_div):
     # Meal notes
     notes_div_i = meal_div.find('div', class_='recipe-notes')
     if notes_div_i is not None:
-        meal['notes'] = [p.contents[0] for p in notes_div_i.select('p')]
+        meal['notes'] = [str(p.contents[0]) for p in notes_div_i.select('p')]
     return meal
 
 
-def extract_menu(weekly_html):
-    soup = bs4.BeautifulSoup(weekly_html, 'html5lib')
+def extract_menu(weekly_html, engine='bs4'):
+    '''
+    Parameters
+    ----------
+    weekly_html : str or ParsedDocument
+        Weekly menu HTML document.
+    engine : str, optional
+        ``'bs4'`` to query the ``bs4`` tree with CSS selectors, or ``'lxml'``
+        to use the compiled XPath expressions of :mod:`menu_xpath` (much
+        faster for bulk processing; requires ``lxml``).  Both engines return
+        the same result.
+    '''
+    if engine not in ('bs4', 'lxml'):
+        raise ValueError('`engine` must be either `bs4` or `lxml`.')
+    elif engine == 'lxml':
+        from .menu_xpath import extract_menu as extract_menu_xpath
+
+        if isinstance(weekly_html, ParsedDocument):
+            weekly_html = weekly_html.html
+        return extract_menu_xpath(weekly_html)
+
+    soup = ParsedDocument.coerce(weekly_html).soup
     try:
         # Parse title, store, date, and servings from menus up until 2019-03-17
         result = dict(zip(['store', 'date', 'servings'],
@@ -187,17 +209,19 @@ def ingredients_table(menu, decode_processing=True):
     df_decode_ingredients.loc[isna, 'quantity'] = 1
 
     # Set unit to `"each"` for ingredients where no units were specified.
-    for i, ingredient_i in df_decode_ingredients.iterrows():
-        (quantity_i, unit_i, desc_i) = ingredient_i
+    # Check each distinct unit against the unit registry only once.
+    units = df_decode_ingredients['unit']
+    unknown_units = []
+    for unit_i in units.dropna().unique():
         try:
-            ureg.parse_expression('%s %s' % (quantity_i, unit_i))
+            parse_quantity('1 %s' % unit_i)
         except pint.UndefinedUnitError:
-            # No recognized unit.  Assume unit is omitted, and assume "each".
-            if unit_i == unit_i and isinstance(unit_i, six.string_types):
-                desc_i = '%s %s' % (unit_i, desc_i)
-            unit_i = 'each'
-            ingredient_i.description = desc_i
-            ingredient_i.unit = unit_i
+            unknown_units.append(unit_i)
+    # No recognized unit.  Assume unit is omitted, and assume "each".
+    unknown = units.isin(unknown_units)
+    df_decode_ingredients.loc[unknown, 'description'] = \
+        units[unknown] + ' ' + df_decode_ingredients.loc[unknown, 'description']
+    df_decode_ingredients.loc[unknown, 'unit'] = 'each'
 
     # Extract any processing instructions.
     actions = ['chopped', 'peeled', 'minced', 'diced', 'sliced', 'drained',
@@ -0,0 +1,146 @@
+# coding: utf-8
+'''
+Weekly menu extraction using compiled XPath expressions on an ``lxml`` tree.
+
+Produces exactly the same output as :func:`menu.extract_menu` with the
+(default) ``bs4`` engine, at a fraction of the cost.
+'''
+from __future__ import print_function, unicode_literals, division
+import re
+
+import lxml.etree
+import lxml.html
+
+
+def _has_class(class_):
+    return ('contains(concat(" ", normalize-space(@class), " "), " %s ")' %
+            class_)
+
+
+def _xpath(path, **kwargs):
+    return lxml.etree.XPath(path, namespaces={'re': 'http://exslt.org/'
+                                              'regular-expressions'},
+                            **kwargs)
+
+
+# Menus up until 2019-03-17.
+HEADER_INFO = _xpath('//header/h2')
+HEADER_TITLE = _xpath('//header/h1')
+# Menus after 2019-03-17.
+FAMILY_TITLE = _xpath('//header//div[@id="family-label"]/h1')
+FAMILY_SERVINGS = _xpath('//header//div[@id="family-label"]/h2')
+THEME_DATE = _xpath('//header//*[%s]' % _has_class('theme-date'))
+THEME_STORE = _xpath('//header//*[%s]' % _has_class('theme-store-name'))
+
+MEAL_ITEMS = _xpath('(//ul[@id="menu"])[1]//li[re:test(@id, "item-\\d+")]')
+DURATION = _xpath('(.//span[%s])[1]' % _has_class('duration'))
+MEAL_TITLE = _xpath('(.//h3//span[%s])[1]' % _has_class('label'))
+MAIN_DISH = _xpath('(.//div[%s]/div[%s])[1]' % (_has_class('dishes'),
+                                                _has_class('details')))
+SIDE_DISHES = _xpath('.//div[%s]/div[%s]/div[%s]' %
+                     (_has_class('dishes'), _has_class('side-dishes'),
+                      _has_class('details')))
+SIDE_HEADING = _xpath('(.//h5[%s]/span[%s])[1]' % (_has_class('side-heading'),
+                                                   _has_class('label')))
+NUTRITION = _xpath('.//ul[%s]/li' % _has_class('nutrition'))
+NOTES = _xpath('(.//div[%s])[1]' % _has_class('recipe-notes'))
+PARAGRAPHS = _xpath('.//p')
+RECIPE_TITLE = _xpath('(.//h5/span[%s])[1]' % _has_class('label'))
+INGREDIENTS = _xpath('.//li')
+INSTRUCTIONS = _xpath('(.//div[%s]//p)[1]' % _has_class('instructions'))
+
+
+def _first(xpath, element):
+    '''
+    First element matched by ``xpath``; raise :class:`AttributeError` (as
+    accessing ``None`` returned by ``bs4`` ``select_one()`` would) if none.
+    '''
+    result = xpath(element)
+    if not result:
+        raise AttributeError('No match for `%s`' % xpath.path)
+    return result[0]
+
+
+def _text(element):
+    return ''.join(element.itertext())
+
+
+def extract_recipe(recipe_div):
+    recipe = {}
+
+    # ## Title
+    title_span = RECIPE_TITLE(recipe_div)
+    if title_span:
+        recipe['title'] = title_span[0].text
+
+    # ## Ingredients
+    recipe['ingredients'] = [li.text for li in INGREDIENTS(recipe_div)]
+
+    # ## Instructions
+    recipe['instructions'] = re.sub(r'\.\s+', '.\n',
+                                    _first(INSTRUCTIONS, recipe_div)
+                                    .text).splitlines()
+    return recipe
+
+
+def extract_meal(meal_div):
+    # Duration
+    duration_i = _first(DURATION, meal_div).text
+
+    # Main dish title
+    title_i = _first(MEAL_TITLE, meal_div).text
+
+    # Main dish
+    main_dish_i = extract_recipe(_first(MAIN_DISH, meal_div))
+    main_dish_i['title'] = title_i
+
+    # Side dishes
+    side_dishes_i = [extract_recipe(dish_div_ij) for dish_div_ij in
+                     SIDE_DISHES(meal_div)
+                     if _first(SIDE_HEADING, dish_div_ij).text.lower() !=
+                     'add a side']
+
+    # Meal nutrition
+    nutrition_i = [li.text for li in NUTRITION(meal_div)]
+
+    meal = {'main_dish': main_dish_i,
+            'side_dishes': side_dishes_i,
+            'duration': duration_i,
+            'nutrition': nutrition_i}
+
+    # Meal notes
+    notes_div_i = NOTES(meal_div)
+    if notes_div_i:
+        meal['notes'] = [p.text for p in PARAGRAPHS(notes_div_i[0])]
+    return meal
+
+
+def extract_menu(weekly_html):
+    '''
+    Parameters
+    ----------
+    weekly_html : str
+        Weekly menu HTML document.
+
+    Returns
+    -------
+    dict
+        Menu in the format returned by :func:`menu.extract_menu`.
+    '''
+    root = lxml.html.document_fromstring(weekly_html)
+    try:
+        # Parse title, store, date, and servings from menus up until 2019-03-17
+        result = dict(zip(['store', 'date', 'servings'],
+                          [s.strip() for s in _first(HEADER_INFO, root)
+                           .text.split('-')]))
+        result['title'] = _first(HEADER_TITLE, root).text.strip()
+    except AttributeError:
+        # Parse title, store, date, and servings from menus after 2019-03-17
+        result = {}
+        result['title'] = _text(_first(FAMILY_TITLE, root)).strip()
+        result['date'] = _text(_first(THEME_DATE, root)).split('-')[-1].strip()
+        result['store'] = _text(_first(THEME_STORE, root))
+        result['servings'] = _text(_first(FAMILY_SERVINGS, root))
+    result['meals'] = [extract_meal(meal_div_i) for meal_div_i in
+                       MEAL_ITEMS(root)]
+    return result
@@ -0,0 +1,167 @@
+"""
+Nutrition of many menus as dense arrays, with vectorized aggregates.
+
+Example::
+
+    >>> table = NutritionTable.from_menus(week.menu for week in weeks)
+    >>> table.weekly()[:, table.index("calories")]      # calories per week
+    >>> table.rolling_mean(4)                            # 4-week moving average
+    >>> table.by_protein_category()[ProteinCategory.FISH]
+"""
+
+import operator
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+import numpy as np
+
+from .types.menu import Menu, ProteinCategory
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["FIELDS", "NutritionTable"]
+
+#: Columns of :attr:`NutritionTable.values`.
+FIELDS = (
+    "calories",
+    "carbs",
+    "fat",
+    "fiber",
+    "protein",
+    "saturated_fat",
+    "sodium",
+    "time_to_table",
+)
+_get_fields = operator.attrgetter(*FIELDS)
+
+
+class NutritionTable(NamedTuple):
+    """
+    Nutrition of each day of a sequence of menus ("weeks").
+    """
+
+    #: ``(days, len(FIELDS))`` nutrition of each day.
+    values: np.ndarray
+    #: ``(days,)`` index of the week of each day.
+    week: np.ndarray
+    #: ``(days,)`` protein category of the main dish of each day.
+    protein_category: np.ndarray
+    #: ``(weeks,)`` start date of each week.
+    start_date: np.ndarray
+
+    @classmethod
+    def from_menus(cls, menus: Iterable[Menu]) -> "NutritionTable":
+        rows = []
+        week = []
+        protein_category = []
+        start_date = []
+        for i, menu in enumerate(menus):
+            start_date.append(menu.start_date[:10])
+            for day_menu in menu.day_menus:
+                rows.append(_get_fields(day_menu))
+                week.append(i)
+                main = day_menu.main
+                protein_category.append(
+                    ProteinCategory.NONE
+                    if main is None or main.protein_category is None
+                    else main.protein_category
+                )
+        return cls(
+            np.array(rows, dtype=float).reshape(-1, len(FIELDS)),
+            np.array(week, dtype=np.intp),
+            np.array(protein_category, dtype=np.int8),
+            np.array(start_date, dtype="datetime64[D]"),
+        )
+
+    @classmethod
+    def from_frame(cls, df: "pd.DataFrame") -> "NutritionTable":
+        """
+        Build from a data frame with one row per day, e.g., the ``day_menus``
+        table of :class:`archive.WeekArchive`.
+
+        ``df`` must have :data:`FIELDS`, ``protein_category`` and
+        ``start_date`` (``YYYY-MM-DD...``) columns.
+        """
+        start_date = df["start_date"].astype(str).str.slice(0, 10).to_numpy()
+        weeks, week = np.unique(start_date, return_inverse=True)
+        return cls(
+            df[list(FIELDS)].to_numpy(dtype=float),
+            week.astype(np.intp),
+            df["protein_category"].fillna(ProteinCategory.NONE).to_numpy(np.int8),
+            weeks.astype("datetime64[D]"),
+        )
+
+    @staticmethod
+    def index(field: str) -> int:
+        """
+        Column of ``field`` in :attr:`values` (and in aggregates).
+        """
+        return FIELDS.index(field)
+
+    def weekly(self) -> np.ndarray:
+        """
+        ``(weeks, len(FIELDS))`` totals of each week.
+        """
+        weeks = len(self.start_date)
+        return np.stack(
+            [
+                np.bincount(self.week, weights=column, minlength=weeks)
+                for column in self.values.T
+            ],
+            axis=1,
+        ).reshape(weeks, len(FIELDS))
+
+    def days_per_week(self) -> np.ndarray:
+        return np.bincount(self.week, minlength=len(self.start_date))
+
+    def weekly_mean(self) -> np.ndarray:
+        """
+        ``(weeks, len(FIELDS))`` daily averages of each week (``nan`` for
+        weeks without days).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.weekly() / self.days_per_week()[:, None]
+
+    def by_protein_category(self) -> np.ndarray:
+        """
+        ``(len(ProteinCategory), len(FIELDS))`` daily averages for each
+        protein category, indexed by category value (``nan`` for categories
+        without days).
+        """
+        categories = len(ProteinCategory)
+        totals = np.stack(
+            [
+                np.bincount(self.protein_category, weights=column, minlength=categories)
+                for column in self.values.T
+            ],
+            axis=1,
+        ).reshape(categories, len(FIELDS))
+        counts = np.bincount(self.protein_category, minlength=categories)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return totals / counts[:, None]
+
+    def rolling_mean(self, window: int, daily: bool = False) -> np.ndarray:
+        """
+        ``(weeks - window + 1, len(FIELDS))`` moving averages of weekly
+        totals (or of daily averages, if ``daily``) over ``window`` weeks.
+        Row ``i`` covers weeks ``i`` to ``i + window - 1``.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        weekly = self.weekly_mean() if daily else self.weekly()
+        cumulative = np.cumsum(
+            np.concatenate([np.zeros((1, len(FIELDS))), weekly]), axis=0
+        )
+        return (cumulative[window:] - cumulative[:-window]) / window
+
+    def to_frame(self) -> "pd.DataFrame":
+        """
+        Weekly totals, indexed by week start date.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.weekly(),
+            columns=list(FIELDS),
+            index=pd.Index(self.start_date, name="start_date"),
+        )
@@ -0,0 +1,71 @@
+import functools
+from typing import Any, NamedTuple, Union
+
+__all__ = ["ParsedQuantity", "QuantityParser", "cache_info", "parse_quantity"]
+
+
+class ParsedQuantity(NamedTuple):
+    #: Quantity as written, e.g., ``3/4 lb``.
+    imperial: Union["pint.Quantity", float]
+    #: Quantity converted to base units, e.g., ``340.19 gram``.
+    metric: Union["pint.Quantity", float]
+
+
+class _Failure(NamedTuple):
+    exception: Exception
+
+
+class QuantityParser:
+    """
+    Bounded LRU cache of parsed quantity expressions (e.g., ``"3/4 lb"``).
+
+    Expressions that fail to parse are cached too; parsing them again raises
+    the same exception.  Cached quantities are shared between callers and
+    must not be modified in place.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of cached expressions.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._parse = functools.lru_cache(maxsize=maxsize)(self._parse_uncached)
+
+    @staticmethod
+    def _parse_uncached(expression: str) -> Union[ParsedQuantity, _Failure]:
+        from .units import ureg
+
+        try:
+            imperial = ureg.parse_expression(expression)
+        except Exception as exception:
+            # Without its traceback, which holds on to the parser frames.
+            return _Failure(exception.with_traceback(None))
+        metric = (
+            imperial.to_base_units()
+            if isinstance(imperial, ureg.Quantity)
+            else imperial
+        )
+        return ParsedQuantity(imperial, metric)
+
+    def parse(self, expression: str) -> ParsedQuantity:
+        result = self._parse(expression)
+        if isinstance(result, _Failure):
+            raise result.exception.with_traceback(None)
+        return result
+
+    __call__ = parse
+
+    def cache_info(self) -> Any:
+        """
+        Cache statistics (``hits``, ``misses``, ``maxsize``, ``currsize``).
+        """
+        return self._parse.cache_info()
+
+    def cache_clear(self):
+        self._parse.cache_clear()
+
+
+#: Parser shared by the whole package.
+parse_quantity = QuantityParser()
+cache_info = parse_quantity.cache_info
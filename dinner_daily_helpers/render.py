@@ -1,10 +1,12 @@
 from __future__ import division, print_function, unicode_literals
 
-from typing import Optional
+from typing import Any, Dict, Optional
 from pathlib import Path
 from pydantic import ValidationError
 import argparse
 import enum
+import functools
+import html
 import io
 import json
 import os
@@ -16,13 +18,47 @@ import jinja2
 import numpy
 import pandas as pd
 
+from .cache import DEFAULT_CACHE_DIR, MenuCache
 from .menu import extract_menu, ingredients_table
+from .serialize import dumps
 from .types.week import Week
 from .types.legacy import LegacyMenu, to_legacy
 
-__all__ = ["RenderFormat", "load_legacy_menu", "render"]
+__all__ = [
+    "HtmlBackend",
+    "RenderFormat",
+    "load_legacy_menu",
+    "render",
+    "render_context",
+]
 
 PARENT_DIR = os.path.realpath(os.path.join(__file__, os.path.pardir))
+TEMPLATES_DIR = pathlib.Path(PARENT_DIR).joinpath("templates")
+#: Reload templates when modified on disk (e.g., while editing them).
+DEV_MODE = os.environ.get("DINNER_DAILY_DEV_MODE", "") not in ("", "0")
+
+
+@functools.lru_cache(maxsize=None)
+def get_environment() -> jinja2.Environment:
+    """
+    Template environment shared by all renders.
+
+    Compiled templates are kept in memory and their bytecode is cached on disk
+    (under ``cache.DEFAULT_CACHE_DIR``) across processes.  Templates are only
+    checked for modifications in dev mode (``DINNER_DAILY_DEV_MODE=1``).
+    """
+    bytecode_dir = DEFAULT_CACHE_DIR.joinpath("jinja2")
+    try:
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        bytecode_cache = None
+    else:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_dir))
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=bytecode_cache,
+        auto_reload=DEV_MODE,
+    )
 
 
 class RenderFormat(str, enum.Enum):
@@ -31,32 +67,118 @@ class RenderFormat(str, enum.Enum):
     HTML = "html"
 
 
+class HtmlBackend(str, enum.Enum):
+    #: Convert Markdown in-process with ``markdown-it-py``.
+    MARKDOWN_IT = "markdown-it"
+    #: Convert Markdown with a ``pandoc`` subprocess.
+    PANDOC = "pandoc"
+
+
+try:
+    import markdown_it  # noqa: F401
+except ImportError:
+    DEFAULT_HTML_BACKEND = HtmlBackend.PANDOC
+else:
+    DEFAULT_HTML_BACKEND = HtmlBackend.MARKDOWN_IT
+
+
+@functools.lru_cache(maxsize=None)
+def _read_template(name: str) -> str:
+    return TEMPLATES_DIR.joinpath(name).read_text()
+
+
+def render_context(menu: LegacyMenu) -> Dict[str, Any]:
+    """
+    Variables for ``weekly_menu.template.md``.
+
+    All ingredient tables are rendered to HTML here, so the template only
+    inserts ready-made fragments:
+
+    - ``preparation_html``: ingredients requiring processing, by ingredient;
+    - ``meal_ingredients_html``: ingredients of each meal (in menu order), by
+      processing;
+    - ``summary_html``: all ingredients, by ingredient.
+    """
+    menu_dict = menu.dict()
+    df_ingredients = ingredients_table(menu_dict)
+
+    df_preparation = (
+        df_ingredients.dropna()
+        .sort_values(["ingredient", "processing", "meal"])
+        .set_index(["ingredient", "processing"])
+    )
+
+    # Sort once, then split into meals (groups keep the sorted order).
+    meal_groups = (
+        df_ingredients.fillna("-")
+        .sort_values(["meal", "processing", "ingredient"], kind="mergesort")
+        .groupby("meal", sort=False)
+    )
+    meal_ingredients_html = {
+        meal: df_meal.set_index(["processing", "ingredient"])[
+            ["quantity", "unit", "dish"]
+        ].to_html()
+        for meal, df_meal in meal_groups
+    }
+
+    df_summary = df_ingredients.sort_values(["ingredient", "meal"]).set_index(
+        ["ingredient", "meal", "dish"]
+    )
+    return {
+        "menu": menu_dict,
+        "df_ingredients": df_ingredients,
+        "preparation_html": df_preparation[
+            ["quantity", "unit", "meal", "dish"]
+        ].to_html(),
+        "meal_ingredients_html": [
+            meal_ingredients_html.get(i + 1, "") for i in range(len(menu_dict["meals"]))
+        ],
+        "summary_html": df_summary[["quantity", "unit"]].to_html(),
+    }
+
+
 def render(
     menu: LegacyMenu,
     format_: Optional[RenderFormat] = RenderFormat.MARKDOWN,
+    html_backend: Optional[HtmlBackend] = None,
 ) -> str:
+    """
+    Parameters
+    ----------
+    html_backend
+        Markdown to HTML converter used for ``RenderFormat.HTML`` (default:
+        ``markdown-it`` if installed, otherwise ``pandoc``).
+    """
     with io.StringIO() as output:
         if format_ == RenderFormat.JSON:
             # Dump as JSON output.
-            return json.dumps(menu, indent=4, sort_keys=True)
+            return dumps(menu).decode("utf8")
         else:
             menu_markdown = io.StringIO()
 
-            templates_dir = pathlib.Path(os.path.join(PARENT_DIR, "templates"))
-            template_path = templates_dir.joinpath("weekly_menu.template.md")
-            with open(template_path, "r") as input_:
-                template = jinja2.Template(input_.read())
-
-            df_ingredients = ingredients_table(menu.dict())
-
-            print(
-                template.render(menu=menu.dict(), df_ingredients=df_ingredients),
-                file=menu_markdown,
-            )
+            template = get_environment().get_template("weekly_menu.template.md")
+            print(template.render(render_context(menu)), file=menu_markdown)
 
             if format_ == RenderFormat.MARKDOWN:
                 return menu_markdown.getvalue()
             else:
+                html_backend = HtmlBackend(html_backend or DEFAULT_HTML_BACKEND)
+                template_path = TEMPLATES_DIR.joinpath("GitHub.html5")
+                if DEV_MODE:
+                    _read_template.cache_clear()
+                if html_backend == HtmlBackend.MARKDOWN_IT:
+                    from .markdown_html import markdown_to_html, render_pandoc_template
+
+                    body, toc = markdown_to_html(menu_markdown.getvalue(), toc_depth=2)
+                    return render_pandoc_template(
+                        _read_template(template_path.name),
+                        {
+                            "body": body,
+                            "toc": toc,
+                            "pagetitle": html.escape(menu.title),
+                        },
+                    ).strip()
+
                 markdown_str = menu_markdown.getvalue().encode("utf8")
                 # Dump as HTML.
                 command = [
@@ -67,27 +189,49 @@ def render(
                     "html",
                     "-",
                     "--template",
-                    templates_dir.joinpath("GitHub.html5"),
+                    template_path,
                     "--toc",
                     "--toc-depth",
                     "2",
+                    "--metadata",
+                    f"pagetitle={ menu.title }",
                 ]
                 process = sp.Popen(command, stdout=sp.PIPE, stdin=sp.PIPE)
                 process.stdin.write(markdown_str)
                 stdout, stderr = process.communicate()
 
-                return stdout.strip()
+                return stdout.strip().decode("utf8")
+
+
+def load_legacy_menu(
+    source_path: Path, cache: Optional[MenuCache] = None
+) -> LegacyMenu:
+    """
+    Parameters
+    ----------
+    source_path
+        A (legacy) weekly menu HTML document, a JSON ``LegacyMenu``, or a JSON
+        ``Week``.
+    cache
+        If specified, reuse the menu previously loaded from identical source
+        contents, skipping scraping and validation.
+    """
+    source = source_path.read_bytes()
+    if cache is not None:
+        key = cache.key(source)
+        menu = cache.get(key)
+        if menu is not None:
+            return menu
 
-
-def load_legacy_menu(source_path: Path) -> LegacyMenu:
     if source_path.suffix.lower() == ".json":
         try:
-            menu = LegacyMenu.parse_file(source_path)
+            menu = LegacyMenu.parse_raw(source)
         except ValidationError as exception:
-            week = Week.parse_file(source_path)
+            week = Week.parse_raw(source)
             menu = to_legacy(week.menu)
     else:
-        with source_path.open("r") as input_:
-            menu_html = input_.read()
-        menu = LegacyMenu.parse_obj(extract_menu(menu_html))
+        menu = LegacyMenu.parse_obj(extract_menu(source.decode("utf8")))
+
+    if cache is not None:
+        cache.put(key, menu)
     return menu
@@ -1,20 +1,68 @@
+import contextlib
 import enum
+import logging
+import threading
 import time
-from typing import Optional
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import chromedriver_binary  # Adds chromedriver binary to path
 import selenium.webdriver.chrome.webdriver
 from selenium.webdriver.common.keys import Keys
 import selenium.webdriver.remote.webelement
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from selenium import webdriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 
+from .api import BASE_URL, REFRESH_MARGIN, DinnerDailyClient, Session, TokenStore
 from .types.menu import Menu
 from .types.shopping_list import ShoppingList
 from .types.week import Week, WeekOption
 
-__all__ = ["scrape_week"]
+__all__ = [
+    "BrowserPool",
+    "Timeouts",
+    "browser_refresh",
+    "login",
+    "new_driver",
+    "scrape_week",
+    "scrape_weeks",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Timeouts(BaseModel):
+    """
+    Maximum time (in seconds) to wait for each phase of :func:`login`.
+    """
+
+    #: Loading the app page.
+    page_load: float = 30.0
+    #: Rendering the login form.
+    login_form: float = 10.0
+    #: Receiving the session, once the form is submitted.
+    session: float = 10.0
+    #: Interval between checks while waiting.
+    poll_frequency: float = 0.05
+
+
+DEFAULT_TIMEOUTS = Timeouts()
 
 
 class LoginFields(BaseModel):
@@ -26,11 +74,6 @@ class LoginFields(BaseModel):
         arbitrary_types_allowed = True
 
 
-class Session(BaseModel):
-    token: str
-    refreshToken: str  # XXX TODO: find refresh URL
-
-
 def shadow_query_selector(
     browser: selenium.webdriver.chrome.webdriver.WebDriver,
     element: selenium.webdriver.remote.webelement.WebElement,
@@ -44,7 +87,7 @@ def shadow_query_selector(
 def login_fields(
     browser: selenium.webdriver.chrome.webdriver.WebDriver,
 ) -> LoginFields:
-    dd_app = browser.find_element_by_tag_name("dd-app")
+    dd_app = browser.find_element(By.TAG_NAME, "dd-app")
     dd_login = shadow_query_selector(browser, dd_app, "dd-login")
     main_fab = shadow_query_selector(browser, dd_app, "#main-fab")
     log_in_button = shadow_query_selector(browser, main_fab, "button")
@@ -79,59 +122,374 @@ fetch("{ url }", {{
     return browser.execute_async_script(script)
 
 
+def fetch_json_all(
+    browser: selenium.webdriver.chrome.webdriver.WebDriver,
+    session: Session,
+    urls: List[str],
+) -> List[dict]:
+    """
+    Same as :func:`fetch_json` for each of ``urls``, with all requests sent at
+    once (``Promise.all``).
+    """
+    script = """var urls = arguments[0], token = arguments[1];
+var done = arguments[arguments.length - 1];
+Promise.all(urls.map(function(url) {
+    return fetch(url, {
+        method: "GET",
+        headers: {"Authorization": "Bearer " + token}
+    }).then(function(response) {
+        return response.json();
+    });
+})).then(done);"""
+    return browser.execute_async_script(script, urls, session.token)
+
+
+def new_driver() -> selenium.webdriver.chrome.webdriver.WebDriver:
+    import chromedriver_binary  # Adds chromedriver binary to path
+
+    # The following options are required to make headless Chrome
+    # work in a Docker container
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    options.add_argument("--disable-gpu")
+    driver = webdriver.Chrome(options=options)
+    driver.maximize_window()
+    return driver
+
+
+@contextlib.contextmanager
+def _timed(phase: str, timings: Optional[Dict[str, float]]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        if timings is not None:
+            timings[phase] = duration
+        logger.debug("Login phase `%s` took %.3f s", phase, duration)
+
+
+def _ready_login_fields(
+    driver: selenium.webdriver.chrome.webdriver.WebDriver,
+) -> Union[LoginFields, bool]:
+    try:
+        return login_fields(driver)
+    except (NoSuchElementException, JavascriptException, ValidationError):
+        return False
+
+
+def _ready_session(
+    driver: selenium.webdriver.chrome.webdriver.WebDriver,
+) -> Union[Session, bool]:
+    try:
+        return Session.parse_obj(driver.execute_script("return window.localStorage;"))
+    except ValidationError:
+        return False
+
+
+def login(
+    driver: selenium.webdriver.chrome.webdriver.WebDriver,
+    username: str,
+    password: str,
+    timeouts: Timeouts = DEFAULT_TIMEOUTS,
+    timings: Optional[Dict[str, float]] = None,
+) -> Session:
+    """
+    Log in through the app's login form.
+
+    Parameters
+    ----------
+    timeouts
+        Maximum time to wait for each phase; exceeding it raises
+        ``selenium.common.exceptions.TimeoutException``.
+    timings
+        If specified, set to the duration (in seconds) of each phase:
+        ``load``, ``login_form``, ``submit`` and ``session``.
+    """
+    with _timed("load", timings):
+        driver.set_page_load_timeout(timeouts.page_load)
+        driver.get("https://app.thedinnerdaily.com")
+
+    with _timed("login_form", timings):
+        login_fields_ = WebDriverWait(
+            driver, timeouts.login_form, poll_frequency=timeouts.poll_frequency
+        ).until(_ready_login_fields, "Login form not found.")
+
+    with _timed("submit", timings):
+        login_fields_.email.send_keys(username)
+        login_fields_.password.send_keys(password)
+        login_fields_.password.send_keys(Keys.ENTER)
+
+    # Wait for the app to store the access token in local storage.
+    with _timed("session", timings):
+        return WebDriverWait(
+            driver, timeouts.session, poll_frequency=timeouts.poll_frequency
+        ).until(_ready_session, "No session after logging in.")
+
+
+class PooledDriver(NamedTuple):
+    driver: selenium.webdriver.chrome.webdriver.WebDriver
+    session: Session
+    #: ``time.monotonic()`` at launch.
+    created: float
+
+
+class BrowserPool:
+    """
+    Headless Chrome drivers kept open and logged in, per account, so
+    consecutive scrapes skip browser startup and login.
+
+    Example::
+
+        >>> with BrowserPool() as pool:
+        ...     for week_option in WeekOption:
+        ...         weeks.append(scrape_week(username, password, week_option,
+        ...                                  pool=pool))
+
+    Parameters
+    ----------
+    max_age
+        Seconds after which a driver is quit instead of reused.
+    max_idle
+        Maximum number of idle drivers kept per account.
+    driver_factory
+        Called to launch a driver (default: :func:`new_driver`).
+    timeouts
+        Login timeouts (see :func:`login`).
+    """
+
+    def __init__(
+        self,
+        max_age: float = 30 * 60,
+        max_idle: int = 1,
+        driver_factory: Callable[
+            [], selenium.webdriver.chrome.webdriver.WebDriver
+        ] = new_driver,
+        timeouts: Timeouts = DEFAULT_TIMEOUTS,
+    ):
+        self.max_age = max_age
+        self.max_idle = max_idle
+        self.driver_factory = driver_factory
+        self.timeouts = timeouts
+        self._idle: Dict[str, List[PooledDriver]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @contextlib.contextmanager
+    def session(
+        self, username: str, password: str
+    ) -> Iterator[Tuple[selenium.webdriver.chrome.webdriver.WebDriver, Session]]:
+        """
+        Logged in driver of ``username`` (and its session), reserved for the
+        ``with`` block.  A driver that raises a ``WebDriverException`` in the
+        block is quit instead of returned to the pool, as is one whose session
+        was rejected (e.g., API error responses raise ``ValidationError``).
+        """
+        pooled = self._acquire(username, password)
+        try:
+            yield pooled.driver, pooled.session
+        except (WebDriverException, ValidationError):
+            self._quit(pooled)
+            raise
+        except BaseException:
+            self._release(username, pooled)
+            raise
+        else:
+            self._release(username, pooled)
+
+    def close(self):
+        """
+        Quit all idle drivers.  Drivers in use are quit when released.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for pooled in (pooled for drivers in idle.values() for pooled in drivers):
+            self._quit(pooled)
+
+    def _acquire(self, username: str, password: str) -> PooledDriver:
+        if self._closed:
+            raise RuntimeError("Browser pool is closed.")
+        while True:
+            with self._lock:
+                drivers = self._idle.get(username)
+                pooled = drivers.pop() if drivers else None
+            if pooled is None:
+                break
+            if time.monotonic() - pooled.created > self.max_age:
+                self._quit(pooled)
+                continue
+            healthy = self._check(pooled)
+            if healthy is not None:
+                return healthy
+        driver = self.driver_factory()
+        try:
+            session = login(driver, username, password, self.timeouts)
+        except BaseException:
+            driver.quit()
+            raise
+        return PooledDriver(driver, session, time.monotonic())
+
+    def _check(self, pooled: PooledDriver) -> Optional[PooledDriver]:
+        """
+        ``pooled`` with its current session, or ``None`` (after quitting it)
+        if the browser is unresponsive, logged out or its session (about to
+        be) expired.
+        """
+        try:
+            local_storage = pooled.driver.execute_script("return window.localStorage;")
+            session = Session.parse_obj(local_storage)
+        except Exception:
+            self._quit(pooled)
+            return None
+        expires_at = session.expires_at()
+        if expires_at is not None and expires_at - time.time() < REFRESH_MARGIN:
+            self._quit(pooled)
+            return None
+        return pooled._replace(session=session)
+
+    def _release(self, username: str, pooled: PooledDriver):
+        with self._lock:
+            drivers = self._idle.setdefault(username, [])
+            if not self._closed and len(drivers) < self.max_idle:
+                drivers.append(pooled)
+                return
+        self._quit(pooled)
+
+    @staticmethod
+    def _quit(pooled: PooledDriver):
+        with contextlib.suppress(Exception):
+            pooled.driver.quit()
+
+
+def browser_refresh(
+    username: str,
+    password: str,
+    pool: Optional[BrowserPool] = None,
+    timeouts: Timeouts = DEFAULT_TIMEOUTS,
+) -> Callable[[Optional[Session]], Session]:
+    """
+    ``refresh`` callback of :class:`api.DinnerDailyClient`, logging in with a
+    browser (from ``pool``, if specified; otherwise with ``timeouts``).
+    """
+
+    def refresh(expired: Optional[Session]) -> Session:
+        if pool is None:
+            driver = new_driver()
+            try:
+                return login(driver, username, password, timeouts)
+            finally:
+                driver.quit()
+        with pool.session(username, password) as (driver, session):
+            if session == expired:
+                # Log out first: the app could restore the expired session
+                # instead of showing the login form.
+                driver.execute_script("window.localStorage.clear();")
+                session = login(driver, username, password, pool.timeouts)
+            return session
+
+    return refresh
+
+
 def scrape_week(
     username: str,
     password: str,
     week_option: Optional[WeekOption] = WeekOption.CURRENT,
     driver: Optional[selenium.webdriver.chrome.webdriver.WebDriver] = None,
+    pool: Optional[BrowserPool] = None,
+    token_store: Optional[TokenStore] = None,
+    timeouts: Timeouts = DEFAULT_TIMEOUTS,
 ) -> Week:
-    if driver is None:
-        # The following options are required to make headless Chrome
-        # work in a Docker container
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-        options.add_argument("--disable-gpu")
-        # Initialize a new driver
-        driver = webdriver.Chrome(options=options)
-        driver_created = True
-    else:
-        driver_created = False
+    """
+    .. versionchanged:: X.X.X
+        Add ``pool`` kwarg, to reuse logged in drivers across calls.
+    .. versionchanged:: X.X.X
+        Add ``token_store`` kwarg.  If specified, call the API directly with
+        the saved session, and only use a browser to log in again when the
+        session has expired.
+    .. versionchanged:: X.X.X
+        Fetch the menu and the shopping list concurrently.
+    .. versionchanged:: X.X.X
+        Add ``timeouts`` kwarg (see :func:`login`), used unless ``pool`` is
+        specified.  Wait for the login form and session with explicit waits,
+        instead of implicit waits and 1 second polling.
+    """
+    return scrape_weeks(
+        username,
+        password,
+        [week_option],
+        driver=driver,
+        pool=pool,
+        token_store=token_store,
+        timeouts=timeouts,
+    )[0]
 
-    #  https://selenium-python.readthedocs.io/waits.html#implicit-waits
-    driver.implicitly_wait(10)
-    driver.maximize_window()
-    driver.get("https://app.thedinnerdaily.com")
 
-    login_fields_ = login_fields(driver)
+def scrape_weeks(
+    username: str,
+    password: str,
+    week_options: Iterable[WeekOption] = tuple(WeekOption),
+    driver: Optional[selenium.webdriver.chrome.webdriver.WebDriver] = None,
+    pool: Optional[BrowserPool] = None,
+    token_store: Optional[TokenStore] = None,
+    timeouts: Timeouts = DEFAULT_TIMEOUTS,
+) -> List[Week]:
+    """
+    Same as :func:`scrape_week`, for several weeks of one account, with all
+    requests sent at once.
+    """
+    week_options = list(week_options)
+    if token_store is not None:
+        refresh = browser_refresh(username, password, pool, timeouts)
+        with DinnerDailyClient(token_store=token_store, refresh=refresh) as client:
+            return client.fetch_weeks(week_options)
 
-    login_fields_.email.send_keys(username)
-    login_fields_.password.send_keys(password)
-    login_fields_.password.send_keys(Keys.ENTER)
+    if pool is not None:
+        with pool.session(username, password) as (driver, session):
+            return _fetch_weeks(driver, session, week_options)
 
-    # Retry 5 times to read access token from local storage; wait 1 second between
-    for i in range(5):
-        try:
-            local_storage = driver.execute_script("return window.localStorage;")
-            session = Session.parse_obj(local_storage)
-            break
-        except Exception as exception:
-            time.sleep(1)
+    if driver is None:
+        # Initialize a new driver
+        driver = new_driver()
+        driver_created = True
     else:
-        raise exception
+        driver_created = False
+        # Only wait explicitly (see `login()`).
+        driver.implicitly_wait(0)
+        driver.maximize_window()
 
-    base_url = "https://db.thedinnerdaily.com/api/v2"
-    menu_url = f"{ base_url }/week-menu?week={ week_option }"
-    shopping_list_url = f"{ base_url }/shopping-list?week={ week_option }"
+    try:
+        session = login(driver, username, password, timeouts)
+        return _fetch_weeks(driver, session, week_options)
+    finally:
+        if driver_created:
+            driver.quit()
 
-    menu_dict = fetch_json(driver, session, menu_url)
-    shopping_list_dict = fetch_json(driver, session, shopping_list_url)
 
-    menu = Menu.parse_obj(menu_dict)
-    shopping_list = ShoppingList.parse_obj(shopping_list_dict)
-    result = Week(menu=menu, shopping_list=shopping_list)
+def _fetch_weeks(
+    driver: selenium.webdriver.chrome.webdriver.WebDriver,
+    session: Session,
+    week_options: List[WeekOption],
+) -> List[Week]:
+    urls = []
+    for week_option in week_options:
+        week = WeekOption(week_option).value
+        urls.append(f"{ BASE_URL }/week-menu?week={ week }")
+        urls.append(f"{ BASE_URL }/shopping-list?week={ week }")
 
-    if driver_created:
-        driver.quit()
+    results = fetch_json_all(driver, session, urls)
 
-    return result
+    return [
+        Week(
+            menu=Menu.parse_obj(menu_dict),
+            shopping_list=ShoppingList.parse_obj(shopping_list_dict),
+        )
+        for menu_dict, shopping_list_dict in zip(results[::2], results[1::2])
+    ]
@@ -0,0 +1,91 @@
+"""
+JSON serialization of models (e.g., ``LegacyMenu``, ``Week``) straight to
+binary streams, using ``orjson`` when installed.
+
+Many models are written as newline-delimited JSON (one compact document per
+line), so they can be produced and consumed one at a time.
+"""
+
+import functools
+import json
+from typing import BinaryIO, Iterable, Iterator, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["dumps", "read_ndjson", "write_json", "write_ndjson"]
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def dumps(model: BaseModel, indent: bool = True) -> bytes:
+    """
+    UTF-8 encoded JSON document, with sorted keys.
+
+    Parameters
+    ----------
+    indent
+        Indent nested values by two spaces (otherwise, output a single line).
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(model.dict(), default=pydantic_encoder, option=option)
+    return json.dumps(
+        model.dict(),
+        default=pydantic_encoder,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=True,
+    ).encode("utf8")
+
+
+def write_json(model: BaseModel, output: BinaryIO, indent: bool = True):
+    output.write(dumps(model, indent=indent))
+    output.write(b"\n")
+
+
+def write_ndjson(models: Iterable[BaseModel], output: BinaryIO) -> int:
+    """
+    Write each model as one line of JSON, as it is produced by ``models``.
+
+    Returns
+    -------
+    int
+        Number of models written.
+    """
+    count = 0
+    for model in models:
+        write_json(model, output, indent=False)
+        count += 1
+    return count
+
+
+def read_ndjson(
+    input_: BinaryIO, model_type: Type[Model], trusted: bool = False
+) -> Iterator[Model]:
+    """
+    Parse newline-delimited JSON, one model at a time.
+
+    Parameters
+    ----------
+    trusted
+        Skip validation (see :mod:`.types.trusted`); only for streams written
+        by :func:`write_ndjson`.
+    """
+    from .types.trusted import construct
+
+    loads = json.loads if orjson is None else orjson.loads
+    parse = (
+        functools.partial(construct, model_type) if trusted else model_type.parse_obj
+    )
+    for line in input_:
+        if line.strip():
+            yield parse(loads(line))
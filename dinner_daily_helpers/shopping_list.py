@@ -1,14 +1,20 @@
 # coding: utf-8
+import itertools as it
 import re
 
-import bs4
 import pandas as pd
 
-from . import ureg
+from .document import ParsedDocument
+from .quantity import parse_quantity
 
 
 def extract_shopping_list(shopping_list_html, csv=False):
     '''
+    Parameters
+    ----------
+    shopping_list_html : str or ParsedDocument
+        Shopping list HTML document.
+
     Returns
     -------
     pandas.DataFrame or str
@@ -63,7 +69,7 @@ def extract_shopping_list(shopping_list_html, csv=False):
             43        NaN        staple               toasted sesame oil      5     False
             44        NaN        staple                         turmeric      3     False
     '''
-    soup = bs4.BeautifulSoup(shopping_list_html, 'html5lib')
+    soup = ParsedDocument.coerce(shopping_list_html).soup
     staple_ingredient_items = soup.select('section#menu-key div#staple > '
                                           'ul.shopping-list > li')
 
@@ -116,7 +122,7 @@ def extract_shopping_list(shopping_list_html, csv=False):
 def extract_ingredient(ingredient_item):
     category_i = ingredient_item.find_parent('div').attrs['id']
 
-    for i in range(1, 6) + ['multi']:
+    for i in list(range(1, 6)) + ['multi']:
         if u'list-%s' % i in ingredient_item.attrs['class']:
             meal_i = i
             break
@@ -129,3 +135,97 @@ def extract_ingredient(ingredient_item):
     else:
         side_dish_i = None
     return (meal_i, category_i, name_i, side_dish_i)
+
+
+def get_staple_ingredients(html):
+    """
+    Parameters
+    ----------
+    html : str or ParsedDocument
+        Shopping list HTML document.
+    """
+    soup = ParsedDocument.coerce(html).soup
+    staples_div = soup.find("div", attrs={"id": "staple"})
+    staples_list = staples_div.find("ul", attrs={"class": "shopping-list"})
+    staple_ingredients = [
+        c.find_all("span")[-1].contents[0].lower().replace("*", "").split(", ")
+        for c in staples_list.find_all("li")
+    ]
+    staples_combined = set(it.chain(*staple_ingredients))
+    return sorted(
+        [
+            (
+                staple,
+                [
+                    i + 1
+                    for i, recipe_staples in enumerate(staple_ingredients)
+                    if staple in recipe_staples
+                ],
+            )
+            for staple in staples_combined
+        ]
+    )
+
+
+def get_section_ingredients(html):
+    """
+    Combine all section (i.e., grocery, meat, etc.) shopping lists into a
+    single dataframe with imperial and metric quantities.
+
+    Parameters
+    ----------
+    html : str or ParsedDocument
+        Shopping list HTML document.
+    """
+    soup = ParsedDocument.coerce(html).soup
+    main_list_section = soup.find("section", id="main-list")
+    list_sections = {
+        list_i.attrs["id"]: list_i
+        for list_i in main_list_section.find_all("div", class_="list-section")
+    }
+    frames = []
+    keys = []
+
+    cre_ingredient = re.compile(
+        r"^(?P<side_dish>\*)?(?P<name>.*)[ \xa0]"
+        r"\((?P<quantity>[^\)]+?)(,\xa0(?P<optional>optional))?\)$"
+    )
+
+    for name_i, list_i in list_sections.items():
+        shopping_list_i = list_i.find("ul", class_="shopping-list")
+        ingredient_strs_i = [
+            li.find("span", class_="item-details").contents[-1]
+            for li in shopping_list_i.find_all("li", class_="list-item")
+            if "hidden" not in li.attrs["class"]
+        ]
+        if not ingredient_strs_i:
+            continue
+
+        df_ingredients_i = pd.DataFrame(
+            [
+                cre_ingredient.match(i).groupdict()
+                for i in ingredient_strs_i
+                if cre_ingredient.match(i)
+            ]
+        )
+        quantities_i = [parse_quantity(q) for q in df_ingredients_i.quantity]
+        df_ingredients_i.insert(
+            2, "quantity_imperial", [q.imperial for q in quantities_i]
+        )
+        df_ingredients_i.insert(3, "quantity_metric", [q.metric for q in quantities_i])
+        frames.append(df_ingredients_i)
+        keys.append(name_i)
+
+    df_ingredients = pd.concat(frames, keys=keys)
+    df_ingredients.side_dish = df_ingredients.side_dish == "*"
+    df_ingredients.optional = df_ingredients.optional == "optional"
+    return df_ingredients[
+        [
+            "quantity",
+            "name",
+            "quantity_metric",
+            "quantity_imperial",
+            "optional",
+            "side_dish",
+        ]
+    ]
@@ -1,9 +1,11 @@
 import enum
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, TypeVar, Union
 
 from .trello_api import (
     DEFAULT_QUERY,
     Card,
+    CheckList,
     List_,
     NewCard,
     NewCheckItem,
@@ -34,9 +36,21 @@ def create_week_card(
     list_: Union[str, List_],
     pos: Union[int, Position] = Position.TOP,
     query: Optional[Dict[str, str]] = DEFAULT_QUERY,
+    max_workers: int = 1,
 ) -> Card:
     """
     Add a ``Card`` to the specified Trello ``List`` with ``CheckList`` for each grocery category.
+
+    Parameters
+    ----------
+    max_workers
+        Maximum number of concurrent requests to Trello.  Checklists are
+        created in parallel, followed by the check items of all checklists.
+
+        Each checklist and check item is created with an explicit position, so
+        the order of sections (and of items within each section) is preserved
+        regardless of the order in which requests complete.  Rate-limited
+        requests are retried according to ``trello_api.DEFAULT_BACKOFF``.
     """
     start_date = week.menu.start_datetime.strftime("%Y-%m-%d")
     description = "\n".join(
@@ -57,19 +71,31 @@ def create_week_card(
     )
     card = create_card(new_card, query=query)
 
-    for store_section in StoreSection:
+    def _create_checklist(i: int, store_section: StoreSection) -> CheckList:
         # Create a checklist.
-        new_check_list = NewCheckList(name=store_section, pos=Position.BOTTOM)
-        check_list = create_checklist(card, new_check_list, query=query)
+        new_check_list = NewCheckList(name=store_section, pos=i + 1)
+        return create_checklist(card, new_check_list, query=query)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        check_lists = list(
+            executor.map(_create_checklist, *zip(*enumerate(StoreSection)))
+        )
 
-        for item in getattr(week.shopping_list, store_section):
+        futures = [
             # Add item to checklist
-            new_check_item = NewCheckItem(
-                name=f"{ item.name } ({ item.formatted_amount })",
-                pos=Position.BOTTOM,
-                checked=str(item.is_checked).lower(),
-            )
-            check_item = create_check_item(
-                check_list=check_list, check_item=new_check_item, query=query
+            executor.submit(
+                create_check_item,
+                check_list=check_list,
+                check_item=NewCheckItem(
+                    name=f"{ item.name } ({ item.formatted_amount })",
+                    pos=j + 1,
+                    checked=str(item.is_checked).lower(),
+                ),
+                query=query,
             )
+            for store_section, check_list in zip(StoreSection, check_lists)
+            for j, item in enumerate(getattr(week.shopping_list, store_section))
+        ]
+        for future in futures:
+            future.result()
     return card
@@ -1,8 +1,10 @@
 import enum
+import time
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import requests
+import requests.adapters
 from pydantic import BaseModel, Field, parse_raw_as
 
 T = TypeVar("T")
@@ -13,12 +15,117 @@ class Query(BaseModel):
     token: str
 
 
+class Backoff(BaseModel):
+    """
+    Retry policy applied when Trello rate-limits a request (HTTP 429).
+    """
+
+    retries: int = 5
+    factor: float = 0.5
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int, response: requests.Response) -> float:
+        """
+        Seconds to wait before retry ``attempt`` (0-based), honouring any
+        ``Retry-After`` header sent by Trello.
+        """
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = self.factor * 2**attempt
+        return min(delay, self.max_delay)
+
+
+class TrelloClient:
+    """
+    Pooled, keep-alive HTTP transport for the Trello API.
+
+    Parameters
+    ----------
+    pool_size
+        Maximum number of connections kept open to Trello.  Should be at
+        least the number of threads sharing the client.
+    backoff
+        Retry policy.  Failed connections are retried up to
+        ``backoff.retries`` times, as are rate-limited (HTTP 429) requests,
+        after waiting ``backoff.delay()`` seconds.
+    timeout
+        Connect/read timeout (in seconds) applied to every request.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        backoff: Optional[Backoff] = None,
+        timeout: Optional[float] = 30.0,
+    ):
+        self.backoff = DEFAULT_BACKOFF if backoff is None else backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=self.backoff.retries,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the Trello API.
+
+        While Trello responds with HTTP 429 (rate limit exceeded), wait
+        according to :attr:`backoff` and retry.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(self.backoff.retries + 1):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == self.backoff.retries:
+                break
+            time.sleep(self.backoff.delay(attempt, response))
+        return response
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "TrelloClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+BASE_URL = "https://api.trello.com/1"
 DEFAULT_QUERY = Query(key="<trello app key>", token="<trello api token>")
+DEFAULT_BACKOFF = Backoff()
+DEFAULT_CLIENT = TrelloClient()
+
 
+def init(
+    query: Query,
+    backoff: Optional[Backoff] = None,
+    client: Optional[TrelloClient] = None,
+):
+    """
+    Set the credentials (and, optionally, the retry policy and HTTP client)
+    used by default by all API functions.
+    """
+    global DEFAULT_CLIENT
 
-def init(query: Query):
     DEFAULT_QUERY.key = query.key
     DEFAULT_QUERY.token = query.token
+    if backoff is not None:
+        for name in Backoff.__fields__:
+            setattr(DEFAULT_BACKOFF, name, getattr(backoff, name))
+    if client is not None:
+        DEFAULT_CLIENT = client
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request to the Trello API through :data:`DEFAULT_CLIENT`.
+    """
+    return DEFAULT_CLIENT.request(method, url, **kwargs)
 
 
 NameField = Field(regex=r"^([0-9a-fA-F]{24}|\w+)$")
@@ -247,9 +354,9 @@ def get_boards(
     """
     https://developer.atlassian.com/cloud/trello/rest/api-group-members/#api-members-id-boards-get
     """
-    url = f"https://api.trello.com/1/members/{ member }/boards"
+    url = f"{ BASE_URL }/members/{ member }/boards"
     headers = {"Accept": "application/json"}
-    response = requests.request("GET", url, headers=headers, params=query)
+    response = request("GET", url, headers=headers, params=query)
     return parse_raw_as(List[Board], response.text)
 
 
@@ -262,8 +369,8 @@ def get_cards(
     if isinstance(board, Board):
         board = board.id
 
-    url = f"https://api.trello.com/1/boards/{ board }/cards"
-    response = requests.request("GET", url, params=query)
+    url = f"{ BASE_URL }/boards/{ board }/cards"
+    response = request("GET", url, params=query)
     return parse_raw_as(List[Card], response.text)
 
 
@@ -275,9 +382,9 @@ def get_checklists(
     """
     if isinstance(card, Card):
         card = card.id
-    url = f"https://api.trello.com/1/cards/{ card }/checklists"
+    url = f"{ BASE_URL }/cards/{ card }/checklists"
 
-    response = requests.request("GET", url, params=query)
+    response = request("GET", url, params=query)
     try:
         return parse_raw_as(List[CheckList], response.text)
     except Exception as exception:
@@ -295,11 +402,11 @@ def update_check_item(
     if isinstance(card, Card):
         card = card.id
 
-    url = f"https://api.trello.com/1/cards/{ card }/checkItem/{ check_item.id }"
+    url = f"{ BASE_URL }/cards/{ card }/checkItem/{ check_item.id }"
     query = query.dict()
     query.update(**check_item.dict(exclude_none=True))
 
-    response = requests.request("PUT", url, params=query)
+    response = request("PUT", url, params=query)
 
     return CheckItem.parse_raw(response.text)
 
@@ -323,9 +430,9 @@ def get_lists(
     if isinstance(board, Board):
         board = board.id
 
-    url = f"https://api.trello.com/1/boards/{ board }/lists"
+    url = f"{ BASE_URL }/boards/{ board }/lists"
 
-    response = requests.request("GET", url, params=query)
+    response = request("GET", url, params=query)
     return parse_raw_as(List[List_], response.text)
 
 
@@ -333,11 +440,11 @@ def create_card(card: NewCard, query: Optional[Dict[str, str]] = DEFAULT_QUERY)
     """
     https://developer.atlassian.com/cloud/trello/rest/api-group-cards/#api-cards-post
     """
-    url = "https://api.trello.com/1/cards"
+    url = f"{ BASE_URL }/cards"
     query = query.dict()
     query.update(**card.dict(exclude_none=True))
 
-    response = requests.request("POST", url, params=query)
+    response = request("POST", url, params=query)
     return Card.parse_raw(response.text)
 
 
@@ -351,11 +458,11 @@ def create_checklist(
     """
     if isinstance(card, Card):
         card = card.id
-    url = f"https://api.trello.com/1/cards/{ card }/checklists"
+    url = f"{ BASE_URL }/cards/{ card }/checklists"
     query = query.dict()
     query.update(**check_list.dict(exclude_none=True))
 
-    response = requests.request("POST", url, params=query)
+    response = request("POST", url, params=query)
     return CheckList.parse_raw(response.text)
 
 
@@ -369,11 +476,11 @@ def create_check_item(
     """
     if isinstance(check_list, CheckList):
         check_list = check_list.id
-    url = f"https://api.trello.com/1/checklists/{ check_list }/checkItems"
+    url = f"{ BASE_URL }/checklists/{ check_list }/checkItems"
     query = query.dict()
     query.update(**check_item.dict(exclude_none=True))
 
-    response = requests.request("POST", url, params=query)
+    response = request("POST", url, params=query)
     try:
         return CheckItem.parse_raw(response.text)
     except:
@@ -401,6 +508,6 @@ def get_card(
     query = query.dict()
     query.update(fields=fields)
 
-    url = f"https://api.trello.com/1/cards/{ id }"
-    response = requests.request("GET", url, params=query)
+    url = f"{ BASE_URL }/cards/{ id }"
+    response = request("GET", url, params=query)
     return Card.parse_raw(response.text)
@@ -0,0 +1,201 @@
+import asyncio
+import enum
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+from pydantic import BaseModel, parse_raw_as
+
+from . import trello_api
+from .trello_api import (
+    DEFAULT_BACKOFF,
+    DEFAULT_QUERY,
+    Backoff,
+    Board,
+    Card,
+    CheckItem,
+    CheckList,
+    List_,
+    NewCard,
+    NewCheckItem,
+    NewCheckList,
+    Query,
+)
+
+__all__ = ["AsyncTrelloClient"]
+
+
+def _params(query: Query, model: Optional[BaseModel] = None) -> Dict[str, Any]:
+    params = query.dict()
+    if model is not None:
+        params.update(**model.dict(exclude_none=True))
+    # `httpx` formats query values with `str()`, which does not yield the value
+    # of `str` enums.
+    return {k: v.value if isinstance(v, enum.Enum) else v for k, v in params.items()}
+
+
+class AsyncTrelloClient:
+    """
+    Awaitable counterpart of the :mod:`trello_api` functions.
+
+    Parameters
+    ----------
+    query
+        Trello API key and token used for every request.
+    semaphore
+        Limits the number of requests in flight.  Share one semaphore between
+        all clients using the same token to respect Trello's per-token rate
+        limit.
+    pool_size
+        Maximum number of connections kept open to Trello.
+    backoff
+        Retry policy for failed connections and rate-limited (HTTP 429)
+        requests.
+    timeout
+        Timeout (in seconds) applied to every request.
+    """
+
+    def __init__(
+        self,
+        query: Query = DEFAULT_QUERY,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        pool_size: int = 10,
+        backoff: Optional[Backoff] = None,
+        timeout: Optional[float] = 30.0,
+    ):
+        self.query = query
+        self.semaphore = semaphore
+        self.backoff = DEFAULT_BACKOFF if backoff is None else backoff
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(retries=self.backoff.retries),
+        )
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a request to ``trello_api.BASE_URL + path``.
+
+        While Trello responds with HTTP 429 (rate limit exceeded), wait
+        according to :attr:`backoff` and retry.
+        """
+        url = f"{ trello_api.BASE_URL }{ path }"
+        for attempt in range(self.backoff.retries + 1):
+            if self.semaphore is None:
+                response = await self.client.request(method, url, **kwargs)
+            else:
+                async with self.semaphore:
+                    response = await self.client.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == self.backoff.retries:
+                break
+            await asyncio.sleep(self.backoff.delay(attempt, response))
+        return response
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncTrelloClient":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def get_boards(self, member: str) -> List[Board]:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-members/#api-members-id-boards-get
+        """
+        response = await self.request(
+            "GET",
+            f"/members/{ member }/boards",
+            headers={"Accept": "application/json"},
+            params=_params(self.query),
+        )
+        return parse_raw_as(List[Board], response.text)
+
+    async def get_lists(self, board: Union[str, Board]) -> List[List_]:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-boards/#api-boards-id-lists-get
+        """
+        if isinstance(board, Board):
+            board = board.id
+        response = await self.request(
+            "GET", f"/boards/{ board }/lists", params=_params(self.query)
+        )
+        return parse_raw_as(List[List_], response.text)
+
+    async def get_cards(self, board: Union[str, Board]) -> List[Card]:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-boards/#api-boards-id-cards-get
+        """
+        if isinstance(board, Board):
+            board = board.id
+        response = await self.request(
+            "GET", f"/boards/{ board }/cards", params=_params(self.query)
+        )
+        return parse_raw_as(List[Card], response.text)
+
+    async def get_checklists(self, card: Union[str, Card]) -> List[CheckList]:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-cards/#api-cards-id-checklists-get
+        """
+        if isinstance(card, Card):
+            card = card.id
+        response = await self.request(
+            "GET", f"/cards/{ card }/checklists", params=_params(self.query)
+        )
+        return parse_raw_as(List[CheckList], response.text)
+
+    async def create_card(self, card: NewCard) -> Card:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-cards/#api-cards-post
+        """
+        response = await self.request(
+            "POST", "/cards", params=_params(self.query, card)
+        )
+        return Card.parse_raw(response.text)
+
+    async def create_checklist(
+        self, card: Union[str, Card], check_list: NewCheckList
+    ) -> CheckList:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-cards/#api-cards-id-checklists-post
+        """
+        if isinstance(card, Card):
+            card = card.id
+        response = await self.request(
+            "POST",
+            f"/cards/{ card }/checklists",
+            params=_params(self.query, check_list),
+        )
+        return CheckList.parse_raw(response.text)
+
+    async def create_check_item(
+        self, check_list: Union[str, CheckList], check_item: NewCheckItem
+    ) -> CheckItem:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-checklists/#api-checklists-id-checkitems-post
+        """
+        if isinstance(check_list, CheckList):
+            check_list = check_list.id
+        response = await self.request(
+            "POST",
+            f"/checklists/{ check_list }/checkItems",
+            params=_params(self.query, check_item),
+        )
+        return CheckItem.parse_raw(response.text)
+
+    async def update_check_item(
+        self, card: Union[str, Card], check_item: CheckItem
+    ) -> CheckItem:
+        """
+        https://developer.atlassian.com/cloud/trello/rest/api-group-cards/#api-cards-idcard-checklist-idchecklist-checkitem-idcheckitem-put
+        """
+        if isinstance(card, Card):
+            card = card.id
+        response = await self.request(
+            "PUT",
+            f"/cards/{ card }/checkItem/{ check_item.id }",
+            params=_params(self.query, check_item),
+        )
+        return CheckItem.parse_raw(response.text)
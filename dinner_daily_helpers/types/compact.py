@@ -0,0 +1,126 @@
+"""
+Compact, read-only shopping lists for holding many weeks in memory.
+
+Items are tuples instead of pydantic models, and their strings (names,
+brands, amounts, notes) are interned, so repeated values across weeks are
+stored once.  Conversion to and from :class:`ShoppingList` is lossless.
+"""
+
+import sys
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from .shopping_list import Item, RecipeItem, ShoppingList
+
+__all__ = ["CompactItem", "CompactRecipeItem", "CompactShoppingList"]
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if type(value) is str else value
+
+
+class CompactItem(NamedTuple):
+    brand: str
+    cost: float
+    dish_type: int
+    formatted_amount: str
+    id: int
+    is_checked: bool
+    is_fulfilled: bool
+    is_on_sale: bool
+    is_optional: bool
+    name: str
+    notes: str
+
+    @classmethod
+    def from_item(cls, item: Item) -> "CompactItem":
+        return cls(
+            _intern(item.brand),
+            item.cost,
+            item.dish_type,
+            _intern(item.formatted_amount),
+            item.id,
+            item.is_checked,
+            item.is_fulfilled,
+            item.is_on_sale,
+            item.is_optional,
+            _intern(item.name),
+            _intern(item.notes),
+        )
+
+    def to_item(self) -> Item:
+        return Item.construct(**self._asdict())
+
+
+class CompactRecipeItem(NamedTuple):
+    recipe_id: int
+    recipe_name: str
+    shopping_list_item_id: int
+
+    @classmethod
+    def from_recipe_item(cls, item: RecipeItem) -> "CompactRecipeItem":
+        return cls(
+            item.recipe_id, _intern(item.recipe_name), item.shopping_list_item_id
+        )
+
+    def to_recipe_item(self) -> RecipeItem:
+        return RecipeItem.construct(**self._asdict())
+
+
+class CompactShoppingList(NamedTuple):
+    """
+    Read-only counterpart of :class:`ShoppingList`, with the same fields.
+    """
+
+    dairy: Tuple[CompactItem, ...]
+    frozen_foods: Tuple[CompactItem, ...]
+    grocery: Tuple[CompactItem, ...]
+    meat_poultry: Tuple[CompactItem, ...]
+    produce: Tuple[CompactItem, ...]
+    seafood: Tuple[CompactItem, ...]
+    staples: Tuple[CompactItem, ...]
+    dairy_fulfilled: bool
+    frozen_foods_fulfilled: bool
+    grocery_fulfilled: bool
+    meat_poultry_fulfilled: bool
+    produce_fulfilled: bool
+    seafood_fulfilled: bool
+    staples_fulfilled: bool
+    recipe_shop_items: Tuple[CompactRecipeItem, ...]
+    id: int
+    name: str
+    other: Tuple[CompactItem, ...]
+    cost_enabled: bool
+
+    @classmethod
+    def from_shopping_list(cls, shopping_list: ShoppingList) -> "CompactShoppingList":
+        values = {}
+        for name in cls._fields:
+            value = getattr(shopping_list, name)
+            if name == "recipe_shop_items":
+                value = tuple(map(CompactRecipeItem.from_recipe_item, value))
+            elif name in SECTIONS:
+                value = tuple(map(CompactItem.from_item, value))
+            values[name] = _intern(value)
+        return cls(**values)
+
+    def to_shopping_list(self) -> ShoppingList:
+        values = self._asdict()
+        for name in SECTIONS:
+            values[name] = [item.to_item() for item in values[name]]
+        values["recipe_shop_items"] = [
+            item.to_recipe_item() for item in self.recipe_shop_items
+        ]
+        return ShoppingList.construct(**values)
+
+    def items(self, section: Optional[str] = None) -> Iterator[CompactItem]:
+        """
+        Items of ``section`` (default: all sections, in field order).
+        """
+        for name in SECTIONS if section is None else (section,):
+            yield from getattr(self, name)
+
+
+#: Item list fields of :class:`ShoppingList`.
+SECTIONS = tuple(
+    name for name, field in ShoppingList.__fields__.items() if field.type_ is Item
+)
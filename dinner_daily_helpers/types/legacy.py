@@ -2,9 +2,9 @@ import datetime as dt
 import re
 from typing import List, Optional, TypeVar
 
-import pint
 from pydantic import BaseModel
 
+from ..quantity import parse_quantity
 from .menu import TIME_FORMAT, DayMenu
 from .menu import Dish as Dish_
 from .menu import DishType, Menu, MetaData, ProteinCategory
@@ -17,8 +17,6 @@ __all__ = [
 
 T = TypeVar("T")
 
-ureg = pint.get_application_registry()
-
 CRE_FAMILY_SIZE = re.compile(r"(?P<family_size>\d+)$")
 CRE_DATE = re.compile(rf"^(?P<month>\w+)\s+(?P<day>\d+)(st|nd|rd|th)?\s+(?P<year>\d+)$")
 LEGACY_MAP = {"Cals": "calories"}
@@ -107,7 +105,7 @@ def from_legacy(menu: LegacyMenu) -> Menu:
                 )
                 for dish in meal.side_dishes
             ],
-            time_to_table=ureg.parse_expression(meal.duration).to("minute").magnitude,
+            time_to_table=parse_quantity(meal.duration).imperial.to("minute").magnitude,
             **Nutrition.from_list(meal.nutrition).dict(),
         )
         for meal in menu.meals
@@ -0,0 +1,91 @@
+"""
+Trusted loading of models, skipping validation.
+
+Only use on data written by this package (e.g., by ``Model.json()`` or
+:mod:`..serialize`): values are converted to the declared field types (nested
+models, enums, lists and floats) but not checked, so malformed input yields
+malformed models instead of a ``ValidationError``.
+"""
+
+import enum
+import functools
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["construct", "parse_file_trusted", "parse_raw_trusted"]
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _plan(model_type: Type[BaseModel]) -> Tuple[Tuple[str, str, Any, Any], ...]:
+    """
+    ``(name, alias, convert, field)`` of each field of ``model_type``, where
+    ``convert`` is ``None`` if values are used as is.
+    """
+    plan = []
+    for name, field in model_type.__fields__.items():
+        type_ = field.type_
+        if isinstance(type_, type) and issubclass(type_, BaseModel):
+            convert = functools.partial(construct, type_)
+        elif isinstance(type_, type) and issubclass(type_, enum.Enum):
+            convert = type_
+        elif type_ is float:
+            convert = float
+        else:
+            convert = None
+
+        if field.shape == SHAPE_LIST and convert is not None:
+            convert = functools.partial(_convert_list, convert)
+        elif field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+            convert = None
+        plan.append((name, field.alias, convert, field))
+    return tuple(plan)
+
+
+def _convert_list(convert: Callable[[Any], Any], values: list) -> list:
+    return [None if value is None else convert(value) for value in values]
+
+
+def construct(model_type: Type[Model], obj: Dict[str, Any]) -> Model:
+    """
+    Build ``model_type`` (and nested models) from ``obj`` without validation.
+
+    Equivalent to ``model_type.parse_obj(obj)`` for valid ``obj``.
+    """
+    values = {}
+    fields_set = set()
+    for name, alias, convert, field in _plan(model_type):
+        try:
+            value = obj[alias]
+        except KeyError:
+            if not field.required:
+                values[name] = field.get_default()
+            continue
+        values[name] = value if convert is None or value is None else convert(value)
+        fields_set.add(name)
+    # As ``BaseModel.construct()``, minus per-call field introspection.
+    model = model_type.__new__(model_type)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__fields_set__", fields_set)
+    if model_type.__private_attributes__:
+        model._init_private_attributes()
+    return model
+
+
+def parse_raw_trusted(model_type: Type[Model], data: Union[str, bytes]) -> Model:
+    loads = json.loads if orjson is None else orjson.loads
+    return construct(model_type, loads(data))
+
+
+def parse_file_trusted(model_type: Type[Model], path: Union[str, Path]) -> Model:
+    return parse_raw_trusted(model_type, Path(path).read_bytes())
@@ -0,0 +1,15 @@
+import pint
+
+__all__ = ["ureg"]
+
+ureg = pint.UnitRegistry(system="cgs")
+
+# Add non-default units used by Dinner Daily.
+ureg.define("bulb = []")
+ureg.define("bunch = []")
+ureg.define("each = []")
+ureg.define("head = []")
+ureg.define("loaf = []")
+ureg.define("package = []")
+ureg.define("rib = []")
+ureg.define("tbs = tbsp")
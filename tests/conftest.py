@@ -0,0 +1,279 @@
+import hashlib
+import itertools as it
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import pytest
+
+Response = Tuple[int, Dict[str, str], bytes]
+Route = Callable[[str, str, Dict[str, str], Dict[str, str], bytes], Response]
+
+
+@pytest.fixture
+def umask():
+    """
+    Umask ``0o027`` while the test runs.
+    """
+    previous = os.umask(0o027)
+    yield 0o027
+    os.umask(previous)
+
+
+class StubServer:
+    """
+    Local HTTP server answering every request with ``route(method, path,
+    query, headers, body)`` after an artificial ``delay`` (in seconds).
+    """
+
+    def __init__(self, route: Route, delay: float = 0):
+        self.route = route
+        self.delay = delay
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        # Client addresses of all connections accepted so far.
+        self.connections = set()
+        # Number of requests being handled (and the maximum reached so far).
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                url = urlsplit(self.path)
+                query = dict(parse_qsl(url.query))
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                with server._lock:
+                    server.requests.append((self.command, url.path, query))
+                    server.connections.add(self.client_address)
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                time.sleep(server.delay)
+                with server._lock:
+                    server.active -= 1
+                status, headers, content = server.route(
+                    self.command, url.path, query, dict(self.headers), body
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = _handle
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self.url = "http://%s:%d" % self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def json_response(obj, status: int = 200, headers: Optional[Dict[str, str]] = None):
+    return (
+        status,
+        dict({"Content-Type": "application/json"}, **(headers or {})),
+        (json.dumps(obj).encode("utf8")),
+    )
+
+
+class TrelloStub:
+    """
+    Minimal in-memory Trello API: cards, checklists and check items.
+    """
+
+    def __init__(self, rate_limit: int = 0):
+        # Number of initial requests to reject with HTTP 429.
+        self.rate_limit = rate_limit
+        self._ids = it.count(1)
+        self._lock = threading.Lock()
+        self.check_lists: List[dict] = []
+        self.check_items: Dict[str, List[dict]] = {}
+
+    def new_id(self) -> str:
+        with self._lock:
+            return "%024x" % next(self._ids)
+
+    def __call__(self, method, path, query, headers, body):
+        with self._lock:
+            if self.rate_limit > 0:
+                self.rate_limit -= 1
+                return json_response({}, status=429, headers={"Retry-After": "0"})
+
+        parts = path.strip("/").split("/")[1:]
+        if method == "GET" and parts[0] == "boards" and parts[2] == "cards":
+            return json_response([])
+        elif method == "POST" and parts == ["cards"]:
+            return json_response(
+                {"id": self.new_id(), "name": query["name"], "idList": query["idList"]}
+            )
+        elif method == "POST" and parts[0] == "cards" and parts[2] == "checklists":
+            check_list = {
+                "id": self.new_id(),
+                "idBoard": "b" * 24,
+                "idCard": parts[1],
+                "name": query["name"],
+                "pos": int(query["pos"]),
+                "checkItems": [],
+            }
+            with self._lock:
+                self.check_lists.append(check_list)
+                self.check_items[check_list["id"]] = []
+            return json_response(check_list)
+        elif method == "POST" and parts[0] == "checklists":
+            check_item = {
+                "id": self.new_id(),
+                "idChecklist": parts[1],
+                "name": query["name"],
+                "pos": int(query["pos"]),
+                "state": "incomplete",
+                "due": None,
+            }
+            with self._lock:
+                self.check_items[parts[1]].append(check_item)
+            return json_response(check_item)
+        return json_response({"message": "not found"}, status=404)
+
+
+@pytest.fixture
+def trello_server(monkeypatch):
+    """
+    Stub Trello API server; ``trello_api.BASE_URL`` points to it.
+    """
+    import dinner_daily_helpers.trello_api
+
+    stub = TrelloStub()
+    with StubServer(stub) as server:
+        server.stub = stub
+        monkeypatch.setattr(
+            dinner_daily_helpers.trello_api, "BASE_URL", server.url + "/1"
+        )
+        yield server
+
+
+class DinnerDailyStub:
+    """
+    Minimal Dinner Daily API, serving the ``weeks`` fixture for every week to
+    requests bearing one of :attr:`tokens`.
+    """
+
+    def __init__(self):
+        week = json.loads(
+            Path(__file__)
+            .parent.joinpath("fixtures", "weeks", "2021-05-24.json")
+            .read_text()
+        )
+        self.responses = {
+            "week-menu": week["menu"],
+            "shopping-list": week["shopping_list"],
+        }
+        self.tokens = {"valid"}
+
+    def __call__(self, method, path, query, headers, body):
+        if headers.get("Authorization") not in {f"Bearer {t}" for t in self.tokens}:
+            return json_response({"message": "Unauthorized"}, status=401)
+        parts = path.strip("/").split("/")
+        if (
+            method == "GET"
+            and parts[:2] == ["api", "v2"]
+            and parts[2:3] in (["week-menu"], ["shopping-list"])
+            and query.get("week") in ("current", "previous")
+        ):
+            return json_response(self.responses[parts[2]])
+        return json_response({"message": "not found"}, status=404)
+
+
+@pytest.fixture
+def dinner_daily_server(monkeypatch):
+    """
+    Stub Dinner Daily API server; ``api.BASE_URL`` points to it.
+    """
+    import dinner_daily_helpers.api
+
+    stub = DinnerDailyStub()
+    with StubServer(stub) as server:
+        server.stub = stub
+        monkeypatch.setattr(
+            dinner_daily_helpers.api, "BASE_URL", server.url + "/api/v2"
+        )
+        yield server
+
+
+class MenusStub:
+    """
+    Printable menus and shopping lists of the Dinner Daily website, from the
+    ``legacy_html`` fixtures (``current`` week: 2018-05-12, ``previous``
+    week: 2018-05-05).
+
+    Pages have an ``ETag`` (unless :attr:`etags` is false), and requests with
+    a matching ``If-None-Match`` header get HTTP 304 responses.
+    """
+
+    def __init__(self):
+        self.fixtures = Path(__file__).parent.joinpath("fixtures", "legacy_html")
+        self.menus = {
+            week: self.fixtures.joinpath(f"{ date }-weekly-menu.html").read_bytes()
+            for week, date in (("current", "2018-05-12"), ("previous", "2018-05-05"))
+        }
+        self.etags = True
+
+    def page(self, page, store, week):
+        if page == "print":
+            return self.menus[week]
+        elif page == "print-shopping-list":
+            menu_hash = hashlib.sha1(self.menus[week]).hexdigest()[:8]
+            return f"<html>{ store } { week } { menu_hash }</html>".encode("utf8")
+
+    def __call__(self, method, path, query, headers, body):
+        parts = unquote(path).strip("/").split("/")
+        if method == "GET" and len(parts) == 4 and parts[3] in self.menus:
+            content = self.page(*parts[1:])
+            if content is not None:
+                response_headers = {"Content-Type": "text/html"}
+                if self.etags:
+                    etag = '"%s"' % hashlib.sha1(content).hexdigest()
+                    if headers.get("If-None-Match") == etag:
+                        return 304, {"ETag": etag}, b""
+                    response_headers["ETag"] = etag
+                return 200, response_headers, content
+        return 404, {}, b""
+
+
+@pytest.fixture
+def menus_server(monkeypatch):
+    """
+    Stub Dinner Daily menus server; ``download.BASE_URL`` points to it.
+    """
+    import dinner_daily_helpers.download
+
+    stub = MenusStub()
+    with StubServer(stub) as server:
+        server.stub = stub
+        monkeypatch.setattr(
+            dinner_daily_helpers.download, "BASE_URL", server.url + "/menus/"
+        )
+        yield server
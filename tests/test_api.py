@@ -0,0 +1,98 @@
+import base64
+import json
+import stat
+import time
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.api import (
+    DinnerDailyClient,
+    Session,
+    SessionExpired,
+    TokenStore,
+)
+from dinner_daily_helpers.types.week import Week, WeekOption
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode("utf8"))
+    return "header." + payload.decode("ascii").rstrip("=") + ".signature"
+
+
+@pytest.fixture
+def week():
+    return Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+
+
+def test_fetch_week(dinner_daily_server, week):
+    with DinnerDailyClient(Session(token="valid", refreshToken="r")) as client:
+        for week_option in (WeekOption.CURRENT, WeekOption.PREVIOUS, "previous"):
+            assert client.fetch_week(week_option) == week
+    assert [query for _, _, query in dinner_daily_server.requests] == [
+        {"week": "current"}
+    ] * 2 + [{"week": "previous"}] * 4
+    # Menus and shopping lists are fetched concurrently, over two kept alive
+    # connections.
+    assert len(dinner_daily_server.connections) == 2
+
+
+def test_refresh(dinner_daily_server, week, tmp_path):
+    store = TokenStore(tmp_path.joinpath("tokens", "session.json"))
+    store.save(Session(token="expired", refreshToken="r"))
+    calls = []
+
+    def refresh(expired):
+        calls.append(expired)
+        return Session(token="valid", refreshToken="r2")
+
+    with DinnerDailyClient(token_store=store, refresh=refresh) as client:
+        assert client.fetch_week() == week
+    assert calls == [Session(token="expired", refreshToken="r")]
+    assert store.load() == Session(token="valid", refreshToken="r2")
+    assert stat.S_IMODE(store.path.stat().st_mode) == 0o600
+
+    # No saved session: log in before the first request.
+    store.clear()
+    with DinnerDailyClient(token_store=store, refresh=refresh) as client:
+        client.get_menu()
+    assert calls[-1] is None
+    assert store.load() is not None
+
+
+def test_refresh_before_expiry(dinner_daily_server):
+    session = Session(token=_jwt(time.time() + 5), refreshToken="r")
+    dinner_daily_server.stub.tokens.add(session.token)
+    calls = []
+
+    def refresh(expired):
+        calls.append(expired)
+        return Session(token="valid", refreshToken="r")
+
+    with DinnerDailyClient(session, refresh=refresh) as client:
+        client.get_menu()
+    assert calls == [session]
+    assert len(dinner_daily_server.requests) == 1
+
+
+def test_session_expired(dinner_daily_server):
+    session = Session(token="expired", refreshToken="r")
+    with DinnerDailyClient(session) as client:
+        with pytest.raises(SessionExpired):
+            client.get_menu()
+
+    def refresh(expired):
+        return Session(token="still-expired", refreshToken="r")
+
+    with DinnerDailyClient(session, refresh=refresh) as client:
+        with pytest.raises(SessionExpired):
+            client.get_menu()
+
+
+def test_fetch_weeks_concurrently(dinner_daily_server, week):
+    dinner_daily_server.delay = 0.1
+    with DinnerDailyClient(Session(token="valid", refreshToken="r")) as client:
+        weeks = client.fetch_weeks([WeekOption.CURRENT, WeekOption.PREVIOUS])
+    assert weeks == [week, week]
+    assert dinner_daily_server.max_active == 4
@@ -0,0 +1,86 @@
+import stat
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from dinner_daily_helpers.archive import TABLE_SCHEMAS, WeekArchive  # noqa: E402
+from dinner_daily_helpers.types.week import Week  # noqa: E402
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+def shifted_week(week: Week, start_date: str) -> Week:
+    menu = week.menu.copy(update={"start_date": f"{ start_date }T00:00:00+00:00"})
+    return week.copy(update={"menu": menu})
+
+
+def other_menu(week: Week, menu_id: int) -> Week:
+    return week.copy(update={"menu": week.menu.copy(update={"id": menu_id})})
+
+
+def test_archive_append_and_read(tmp_path: Path):
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    archive = WeekArchive(tmp_path)
+    assert archive.weeks() == []
+    assert archive.read("dishes", columns=["name"]).empty
+
+    assert archive.append(week)
+    # Incremental: archived weeks are skipped unless overwritten.
+    assert not archive.append(week)
+    assert archive.append(week, overwrite=True)
+    assert archive.extend([week, shifted_week(week, "2020-12-28")]) == 1
+    assert archive.weeks() == ["2020-12-28", "2021-05-24"]
+
+    df_items = archive.read("shopping_items")
+    assert set(df_items.columns) == set(TABLE_SCHEMAS["shopping_items"].names) | {
+        "start_date"
+    }
+    items = [
+        item
+        for section in ("dairy", "frozen_foods", "grocery", "meat_poultry")
+        + ("produce", "seafood", "staples", "other")
+        for item in getattr(week.shopping_list, section)
+    ]
+    assert len(df_items) == 2 * len(items)
+
+    # Column-pruned read of a single year.
+    df_2021 = archive.read(
+        "shopping_items", columns=["name"], start="2021-01-01", end="2022-01-01"
+    )
+    assert list(df_2021.columns) == ["name"]
+    assert sorted(df_2021.name) == sorted(item.name for item in items)
+    assert df_2021.name.str.contains("salmon").sum() == 1
+
+    df_ingredients = archive.read("ingredients", end="2021-01-01")
+    assert set(df_ingredients.start_date) == {"2020-12-28"}
+    dishes = [
+        dish
+        for day_menu in week.menu.day_menus
+        for dish in [day_menu.main] + day_menu.sides
+    ]
+    assert len(df_ingredients) == sum(len(dish.ingredients) for dish in dishes)
+    assert len(archive.read("day_menus", start="2021-01-01")) == len(
+        week.menu.day_menus
+    )
+
+
+def test_archive_menus_of_same_week(tmp_path: Path, umask):
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    # E.g., another household's menu of the same week.
+    other = other_menu(week, week.menu.id + 1)
+    archive = WeekArchive(tmp_path)
+
+    assert archive.extend([week, other]) == 2
+    assert not archive.append(other)
+    assert archive.weeks() == ["2021-05-24"]
+    df_day_menus = archive.read("day_menus", columns=["menu_id"])
+    assert df_day_menus.menu_id.value_counts().to_dict() == {
+        week.menu.id: len(week.menu.day_menus),
+        other.menu.id: len(week.menu.day_menus),
+    }
+
+    # Same mode as files created with `open()`.
+    for path in tmp_path.rglob("*.parquet"):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
@@ -0,0 +1,59 @@
+import os
+import shutil
+import stat
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.batch import find_sources, format_summary, render_batch
+from dinner_daily_helpers.render import RenderFormat
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_render_batch(jobs: int, tmp_path: Path, umask):
+    sources = find_sources(fixtures_root.joinpath("legacy_menus"))
+    assert len(sources) == 5
+    output_dir = tmp_path.joinpath("rendered")
+
+    results = render_batch(sources, output_dir, RenderFormat.MARKDOWN, jobs=jobs)
+    assert [result.status for result in results] == ["rendered"] * len(sources)
+    for source, result in zip(sources, results):
+        expected = fixtures_root.joinpath("rendered", f"{ source.stem }.md")
+        assert result.output.read_text() == expected.read_text()
+        # Same mode as files created with `open()`.
+        assert stat.S_IMODE(result.output.stat().st_mode) == 0o640
+    assert "5 rendered, 0 skipped, 0 failed" in format_summary(results, 1.0)
+
+    # Outputs newer than their source are skipped.
+    results = render_batch(sources, output_dir, RenderFormat.MARKDOWN, jobs=jobs)
+    assert [result.status for result in results] == ["skipped"] * len(sources)
+
+
+def test_render_batch_stale_and_failed(tmp_path: Path):
+    source_dir = tmp_path.joinpath("menus")
+    source_dir.mkdir()
+    for name in ("2018-05-05-weekly-menu.json", "2018-05-12-weekly-menu.json"):
+        shutil.copy(fixtures_root.joinpath("legacy_menus", name), source_dir)
+    source_dir.joinpath("invalid.json").write_text("{}")
+    output_dir = tmp_path.joinpath("rendered")
+    sources = find_sources(source_dir.joinpath("*.json"))
+
+    results = render_batch(sources, output_dir, RenderFormat.MARKDOWN)
+    assert [result.status for result in results] == ["rendered", "rendered", "failed"]
+    assert "ValidationError" in results[2].error
+
+    # Modified source is rendered again.
+    mtime = results[1].output.stat().st_mtime + 10
+    os.utime(sources[1], (mtime, mtime))
+    results = render_batch(sources[:2], output_dir, RenderFormat.MARKDOWN)
+    assert [result.status for result in results] == ["skipped", "rendered"]
+
+
+def test_render_batch_conflicting_outputs(tmp_path: Path):
+    sources = [
+        fixtures_root.joinpath("legacy_menus", "2021-05-24.json"),
+        fixtures_root.joinpath("weeks", "2021-05-24.json"),
+    ]
+    with pytest.raises(ValueError):
+        render_batch(sources, tmp_path)
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import dinner_daily_helpers.cache
+import dinner_daily_helpers.render
+import pytest
+from dinner_daily_helpers.cache import MenuCache
+from dinner_daily_helpers.render import load_legacy_menu
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        fixtures_root.joinpath("legacy_html", "2018-05-05-weekly-menu.html"),
+        fixtures_root.joinpath("legacy_menus", "2018-05-05-weekly-menu.json"),
+        fixtures_root.joinpath("weeks", "2021-05-24.json"),
+    ],
+)
+def test_load_legacy_menu_cached(path: Path, tmp_path: Path, monkeypatch):
+    cache = MenuCache(tmp_path)
+    menu = load_legacy_menu(path, cache=cache)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached menu should not be parsed again.")
+
+    monkeypatch.setattr(dinner_daily_helpers.render, "extract_menu", fail)
+    monkeypatch.setattr(dinner_daily_helpers.render.LegacyMenu, "parse_raw", fail)
+    monkeypatch.setattr(dinner_daily_helpers.render.Week, "parse_raw", fail)
+    assert load_legacy_menu(path, cache=cache) == menu
+
+
+def test_cache_eviction(tmp_path: Path):
+    cache = MenuCache(tmp_path, max_bytes=2500)
+    for i in range(5):
+        cache.put(cache.key(b"%d" % i), b"x" * 1000)
+    # Only the two most recently used entries fit.
+    assert cache.get(cache.key(b"4")) == b"x" * 1000
+    assert cache.get(cache.key(b"3")) == b"x" * 1000
+    assert cache.get(cache.key(b"0")) is None
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_cache_key_format(monkeypatch):
+    key = MenuCache.key(b"menu")
+    assert MenuCache.key(b"menu") == key
+    monkeypatch.setattr(
+        dinner_daily_helpers.cache,
+        "CACHE_FORMAT",
+        dinner_daily_helpers.cache.CACHE_FORMAT + 1,
+    )
+    assert MenuCache.key(b"menu") != key
+
+
+def test_cache_corrupt_and_failed_entries(tmp_path: Path):
+    cache = MenuCache(tmp_path)
+    key = cache.key(b"corrupt")
+    tmp_path.joinpath(f"{ key }.pickle").write_bytes(b"not a pickle")
+    assert cache.get(key) is None
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(Exception):
+        cache.put(cache.key(b"unpicklable"), lambda: None)
+    # No temporary file left behind.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_entry_evicted_while_read(tmp_path: Path, monkeypatch):
+    cache = MenuCache(tmp_path)
+    key = cache.key(b"menu")
+    cache.put(key, {"menu": 1})
+    load = dinner_daily_helpers.cache.pickle.load
+
+    def load_and_evict(input_):
+        value = load(input_)
+        # Evicted by another process right after being read.
+        tmp_path.joinpath(f"{ key }.pickle").unlink()
+        return value
+
+    monkeypatch.setattr(dinner_daily_helpers.cache.pickle, "load", load_and_evict)
+    assert cache.get(key) == {"menu": 1}
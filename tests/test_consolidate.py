@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from dinner_daily_helpers.consolidate import consolidate, normalize_names
+from dinner_daily_helpers.shopping_list import extract_shopping_list
+from dinner_daily_helpers.types.compact import CompactShoppingList
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.fixture
+def week():
+    return Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+
+
+def _row(df, ingredient, **filters):
+    df = df[df.ingredient == ingredient]
+    for column, value in filters.items():
+        df = df[df[column] == value]
+    assert len(df) == 1
+    return df.iloc[0]
+
+
+def test_normalize_names():
+    names = pd.Series(["Red pepper (or orange or yellow)", "  Fresh  Cilantro "])
+    assert list(normalize_names(names)) == ["red pepper", "fresh cilantro"]
+
+
+def test_consolidate_units():
+    df = pd.DataFrame(
+        {
+            "section": ["meat_poultry"] * 3
+            + ["produce"] * 4
+            + ["staples"] * 5
+            + ["grocery"],
+            "name": ["Ground turkey", "ground turkey", "ground turkey (93% lean)"]
+            + ["kale", "Kale", "kale", "lemon"]
+            + ["olive oil"] * 3
+            + ["salt"] * 2
+            + ["cream cheese"],
+            "formatted_amount": ["3/4 lb", "8 oz", "1 1/2 lbs"]
+            + ["1 bunch", "2 bunch", "1 head", "3"]
+            + ["1 1/2 tbs", "1 tbs", "1 fl oz"]
+            + ["to taste", "to taste"]
+            + ["1 8-oz pkg"],
+        }
+    )
+    df_consolidated = consolidate(df)
+    assert len(df_consolidated) == 7
+    assert "weeks" not in df_consolidated.columns
+
+    turkey = _row(df_consolidated, "ground turkey")
+    assert turkey.unit == "pound"
+    assert turkey.quantity == pytest.approx(0.75 + 0.5 + 1.5)
+    assert turkey["items"] == 3
+
+    # Countable units are only summed with the same unit.
+    assert _row(df_consolidated, "kale", unit="bunch").quantity == 3
+    assert _row(df_consolidated, "kale", unit="head").quantity == 1
+    assert _row(df_consolidated, "lemon").unit == "each"
+
+    # In the most common unit, with 1 fl oz = 2 tbs.
+    olive_oil = _row(df_consolidated, "olive oil")
+    assert olive_oil.unit == "tbs"
+    assert olive_oil.quantity == pytest.approx(4.5)
+
+    # Amounts that cannot be parsed have no total.
+    salt = _row(df_consolidated, "salt")
+    assert pd.isna(salt.quantity)
+    assert (salt.unit, salt["items"]) == ("to taste", 2)
+
+    # Unknown units are counted by name, after a single number.
+    cream_cheese = _row(df_consolidated, "cream cheese")
+    assert (cream_cheese.quantity, cream_cheese.unit) == (1, "8-oz pkg")
+
+
+def test_consolidate_weeks(week):
+    single = consolidate([week.shopping_list])
+    compact = CompactShoppingList.from_shopping_list(week.shopping_list)
+    double = consolidate([week.shopping_list, compact])
+
+    pd.testing.assert_frame_equal(
+        single.drop(columns=["quantity", "items", "weeks"]),
+        double.drop(columns=["quantity", "items", "weeks"]),
+    )
+    pd.testing.assert_series_equal(double.quantity, 2 * single.quantity)
+    assert (double.weeks == 2).all()
+    assert (double["items"] == 2 * single["items"]).all()
+
+    # Listed twice in produce (1 bunch each).
+    cilantro = _row(single, "fresh cilantro")
+    assert (cilantro.quantity, cilantro.unit, cilantro["items"]) == (2, "bunch", 2)
+
+
+def test_consolidate_shopping_list():
+    html = fixtures_root.joinpath(
+        "legacy_shopping_lists", "shopping-list.html"
+    ).read_text()
+    df = extract_shopping_list(html)
+    df_consolidated = consolidate(
+        df, name="ingredient", amount="quantity", section="category"
+    )
+    assert df_consolidated["items"].sum() == len(df)
+
+    # Staples have no amount: no total, nor unit.
+    staples = df_consolidated[df_consolidated.section == "staple"]
+    assert len(staples) == (df.category == "staple").sum() > 0
+    assert staples.quantity.isna().all()
+    assert staples.unit.isna().all()
+    assert df_consolidated[df_consolidated.section != "staple"].unit.notna().all()
+
+    # Items without an amount at all.
+    df = pd.DataFrame(
+        {"section": ["staples"], "name": ["salt"], "formatted_amount": [None]}
+    )
+    salt = _row(consolidate(df), "salt")
+    assert pd.isna(salt.quantity) and pd.isna(salt.unit)
+    assert salt["items"] == 1
+
+
+def test_consolidate_archive(tmp_path, week):
+    pytest.importorskip("pyarrow")
+    from dinner_daily_helpers.archive import WeekArchive
+
+    archive = WeekArchive(tmp_path)
+    archive.append(week)
+    df_consolidated = consolidate(archive.read("shopping_items"))
+    pd.testing.assert_frame_equal(df_consolidated, consolidate([week.shopping_list]))
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import dinner_daily_helpers as ddh
+import pytest
+from dinner_daily_helpers.document import ParsedDocument
+from dinner_daily_helpers.menu import extract_menu
+from dinner_daily_helpers.shopping_list import extract_shopping_list
+from dinner_daily_helpers.types.legacy import LegacyMenu
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+PARSERS = ("html5lib", "lxml")
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize("path", fixtures_root.glob("legacy_html/*.html"))
+def test_extract_menu(path: Path, parser: str):
+    pytest.importorskip(parser)
+    menu = LegacyMenu.parse_obj(extract_menu(ParsedDocument(path.read_text(), parser)))
+    expected = LegacyMenu.parse_file(
+        fixtures_root.joinpath("legacy_menus", path.stem + ".json")
+    )
+    assert menu == expected
+
+
+def test_shopping_list_shared_document():
+    pytest.importorskip("lxml")
+    html = fixtures_root.joinpath(
+        "legacy_shopping_lists", "shopping-list.html"
+    ).read_text()
+    documents = [ParsedDocument(html, parser) for parser in PARSERS]
+
+    results = [
+        (
+            extract_shopping_list(document).astype(str),
+            ddh.get_staple_ingredients(document),
+            ddh.get_section_ingredients(document).astype(str),
+        )
+        for document in documents
+    ]
+    assert results[0][0].equals(results[1][0])
+    assert results[0][1] == results[1][1]
+    assert results[0][2].equals(results[1][2])
+    # Parsing a document once gives the same result as passing the source.
+    assert extract_shopping_list(html).astype(str).equals(results[-1][0])
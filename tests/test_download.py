@@ -0,0 +1,105 @@
+import json
+import stat
+
+import requests
+from dinner_daily_helpers.download import MANIFEST_NAME, download, download_weeks
+
+
+def _files(directory):
+    return sorted(p.name for p in directory.iterdir() if not p.name.startswith("."))
+
+
+def test_download(menus_server, tmp_path, umask):
+    menus_server.delay = 0.1
+    with requests.Session() as session:
+        download("current", tmp_path, session=session, store="Any Store")
+    assert menus_server.max_active == 2
+    assert _files(tmp_path) == [
+        "2018-05-12-shopping-list-Any Store.html",
+        "2018-05-12-weekly-menu-Any Store.html",
+    ]
+    assert (
+        tmp_path.joinpath("2018-05-12-weekly-menu-Any Store.html").read_bytes()
+        == menus_server.stub.menus["current"]
+    )
+    # Same mode as files created with `open()`.
+    for path in tmp_path.iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_download_weeks(menus_server, tmp_path):
+    menus_server.delay = 0.1
+    with requests.Session() as session:
+        results = download_weeks(
+            ["current", "previous"], tmp_path, session=session, stores=["A", "B"]
+        )
+    # All requests sent at once.
+    assert menus_server.max_active == 8
+    assert len(menus_server.requests) == 8
+    assert _files(tmp_path) == sorted(
+        f"{ date }-{ page }-{ store }.html"
+        for date in ("2018-05-05", "2018-05-12")
+        for page in ("shopping-list", "weekly-menu")
+        for store in "AB"
+    )
+    assert sorted(result.path.name for result in results) == _files(tmp_path)
+    assert {result.status for result in results} == {"written"}
+    assert tmp_path.joinpath("2018-05-05-shopping-list-B.html").read_bytes() == (
+        menus_server.stub.page("print-shopping-list", "B", "previous")
+    )
+
+
+def test_download_conditional(menus_server, tmp_path):
+    with requests.Session() as session:
+        download_weeks(["current", "previous"], tmp_path, session=session)
+        mtimes = {p: p.stat().st_mtime_ns for p in tmp_path.glob("*.html")}
+        manifest = json.loads(tmp_path.joinpath(MANIFEST_NAME).read_text())
+        assert len(manifest) == 4
+
+        results = download_weeks(["current", "previous"], tmp_path, session=session)
+        assert {result.status for result in results} == {"not-modified"}
+        assert {p: p.stat().st_mtime_ns for p in tmp_path.glob("*.html")} == mtimes
+
+        # New week.
+        menus_server.stub.menus["current"] = menus_server.stub.fixtures.joinpath(
+            "2018-05-19-weekly-menu.html"
+        ).read_bytes()
+        results = download_weeks(["current", "previous"], tmp_path, session=session)
+    assert [result.status for result in results] == [
+        "written",
+        "written",
+        "not-modified",
+        "not-modified",
+    ]
+    assert results[0].path.name == "2018-05-19-weekly-menu-Any Store.html"
+    assert len(_files(tmp_path)) == 6
+
+
+def test_download_unchanged(menus_server, tmp_path):
+    # Without validators, pages are compared to the last downloaded content.
+    menus_server.stub.etags = False
+    with requests.Session() as session:
+        download("previous", tmp_path, session=session)
+        mtimes = {p: p.stat().st_mtime_ns for p in tmp_path.glob("*.html")}
+        results = download("previous", tmp_path, session=session)
+        assert {result.status for result in results} == {"unchanged"}
+        assert {p: p.stat().st_mtime_ns for p in tmp_path.glob("*.html")} == mtimes
+
+        results = download_weeks(["previous"], tmp_path, session=session, force=True)
+        assert {result.status for result in results} == {"written"}
+
+
+def test_download_force_keeps_manifest(menus_server, tmp_path):
+    with requests.Session() as session:
+        download_weeks(["current"], tmp_path, session=session, stores=["A", "B"])
+        manifest = json.loads(tmp_path.joinpath(MANIFEST_NAME).read_text())
+
+        results = download_weeks(
+            ["current"], tmp_path, session=session, stores=["A"], force=True
+        )
+        assert {result.status for result in results} == {"written"}
+        # Entries of store B survive the forced run of store A.
+        assert json.loads(tmp_path.joinpath(MANIFEST_NAME).read_text()) == manifest
+
+        results = download_weeks(["current"], tmp_path, session=session, stores=["B"])
+        assert {result.status for result in results} == {"not-modified"}
@@ -0,0 +1,25 @@
+import stat
+
+import pytest
+from dinner_daily_helpers.files import write_atomic
+
+
+def test_write_atomic(tmp_path, umask):
+    path = tmp_path.joinpath("menu.md")
+    write_atomic(path, "# Menu\n")
+    assert path.read_text() == "# Menu\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    write_atomic(path, b"# Other menu\n")
+    assert path.read_bytes() == b"# Other menu\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["menu.md"]
+
+
+def test_write_atomic_failed(tmp_path):
+    path = tmp_path.joinpath("menu.md")
+    path.write_text("# Menu\n")
+    with pytest.raises(TypeError):
+        write_atomic(path, None)
+    # The existing file is untouched, and the temporary file removed.
+    assert path.read_text() == "# Menu\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["menu.md"]
@@ -0,0 +1,49 @@
+import re
+import subprocess as sp
+import sys
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time budget, in microseconds.
+BUDGET_US = 1_000_000
+HEAVY_MODULES = {"bs4", "html5lib", "lxml", "pandas", "pint"}
+CRE_IMPORT_TIME = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)"
+    r"(?P<module>\S+)$"
+)
+
+
+def _import_times(module: str) -> dict:
+    """
+    Cumulative import time (in microseconds) of every module imported by
+    ``import <module>`` in a fresh interpreter, parsed from ``-X importtime``.
+    """
+    process = sp.run(
+        [sys.executable, "-X", "importtime", "-c", f"import { module }"],
+        cwd=Path(__file__).parents[1],
+        stderr=sp.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return {
+        match.group("module"): int(match.group("cumulative"))
+        for match in map(CRE_IMPORT_TIME.match, process.stderr.splitlines())
+        if match
+    }
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "dinner_daily_helpers",
+        "dinner_daily_helpers.types.week",
+        "dinner_daily_helpers.types.legacy",
+        "dinner_daily_helpers.trello_api",
+    ],
+)
+def test_import_time(module: str):
+    import_times = _import_times(module)
+    top_level = {name.split(".")[0] for name in import_times}
+    assert not top_level & HEAVY_MODULES
+    assert import_times[module] < BUDGET_US
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+from dinner_daily_helpers.index import MenuIndex, main
+from dinner_daily_helpers.render import load_legacy_menu
+from dinner_daily_helpers.types.legacy import Dish
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+def test_index_menus(tmp_path: Path):
+    with MenuIndex(tmp_path.joinpath("menus.db")) as index:
+        paths = sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))
+        assert all(index.add_path(path) for path in paths)
+        # Incremental: identical documents and weeks are skipped.
+        assert not any(index.add_path(path) for path in paths)
+        html_path = fixtures_root.joinpath("legacy_html", "2018-05-05-weekly-menu.html")
+        assert not index.add_path(html_path)
+        assert load_legacy_menu(paths[0]) in index
+
+        # Shopping list of an indexed week is added once.
+        week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+        assert index.add_week(week)
+        assert not index.add_week(week)
+
+        connection = index.connection
+        assert connection.execute("SELECT COUNT(*) FROM weeks").fetchone()[0] == 5
+        rows = connection.execute(
+            "SELECT quantity, unit, processing FROM ingredients "
+            "JOIN dishes ON dishes.id = ingredients.dish_id "
+            "JOIN weeks ON weeks.id = dishes.week_id "
+            "WHERE date = 'May 5th 2018' AND ingredient = 'fresh parsley' "
+            "ORDER BY quantity"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ("1", "tbs", "chopped"),
+            ("2", "tbs", "chopped"),
+        ]
+        rows = connection.execute(
+            "SELECT section, formatted_amount FROM shopping_items "
+            "WHERE name = 'salmon fillets'"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("seafood", "1 1/2 lbs")]
+        assert (
+            connection.execute(
+                "SELECT calories FROM meals JOIN weeks ON weeks.id = meals.week_id "
+                "WHERE date = 'May 5th 2018' AND meal = 1"
+            ).fetchone()[0]
+            == 418
+        )
+
+        rows = index.search("salmon AND mango")
+        assert [row["title"] for row in rows] == ["Salmon with Mango Strawberry Salsa"]
+        assert {row["title"] for row in index.search("ingredients:salmon")} >= {
+            "Citrus Salmon",
+            "Salmon Thyme",
+        }
+
+
+def test_index_dishes_with_same_title(tmp_path: Path):
+    path = sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))[0]
+    menu = load_legacy_menu(path)
+    side_dishes = [
+        Dish(title="Salad", ingredients=[ingredient], instructions=[])
+        for ingredient in ("2 cups romaine lettuce", "1 cup baby spinach")
+    ]
+    meals = [menu.meals[0].copy(update={"side_dishes": side_dishes})]
+    menu = menu.copy(update={"meals": meals + menu.meals[1:]})
+
+    with MenuIndex(tmp_path.joinpath("menus.db")) as index:
+        assert index.add_menu(menu)
+        rows = index.connection.execute(
+            "SELECT dishes.id, ingredient FROM ingredients "
+            "JOIN dishes ON dishes.id = ingredients.dish_id "
+            "WHERE meal = 1 AND title = 'Salad' ORDER BY dishes.id"
+        ).fetchall()
+    # Each dish keeps its own ingredients.
+    assert [row["ingredient"] for row in rows] == ["romaine lettuce", "baby spinach"]
+    assert rows[0]["id"] != rows[1]["id"]
+
+
+def test_index_cli(tmp_path: Path, capsys):
+    database = tmp_path.joinpath("menus.db")
+    main(["ingest", str(database), str(fixtures_root.joinpath("legacy_menus"))])
+    assert capsys.readouterr().out == "5 added, 0 already indexed\n"
+    main(["ingest", str(database), str(fixtures_root.joinpath("legacy_menus"))])
+    assert capsys.readouterr().out == "0 added, 5 already indexed\n"
+    main(["search", str(database), "guacamole", "-n", "1"])
+    assert "Guacamole" in capsys.readouterr().out
@@ -0,0 +1,77 @@
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.markdown_html import markdown_to_html, render_pandoc_template
+from dinner_daily_helpers.render import (
+    HtmlBackend,
+    RenderFormat,
+    load_legacy_menu,
+    render,
+)
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+CRE_HEADING_ID = re.compile(r'<h\d id="([^"]*)"')
+CRE_TOC_HREF = re.compile(r'<a href="#([^"]*)"')
+
+
+def test_markdown_to_html_heading_ids():
+    body, toc = markdown_to_html(
+        "# Menu *(Walmart)*\n\n## Shrimp & Rice (25 mins)\n\n"
+        "### Ingredients\n\n## Salad\n\n### Ingredients\n"
+    )
+    assert CRE_HEADING_ID.findall(body) == [
+        "menu-walmart",
+        "shrimp--rice-25-mins",
+        "ingredients",
+        "salad",
+        "ingredients-1",
+    ]
+    assert toc == (
+        "<ul>\n"
+        '<li><a href="#menu-walmart">Menu <em>(Walmart)</em></a>\n'
+        "<ul>\n"
+        '<li><a href="#shrimp--rice-25-mins">Shrimp &amp; Rice (25 mins)</a></li>\n'
+        '<li><a href="#salad">Salad</a></li>\n'
+        "</ul></li>\n"
+        "</ul>"
+    )
+
+
+def test_render_pandoc_template():
+    template = (
+        "<title>$pagetitle$</title>\n"
+        "$if(toc)$\n"
+        "<nav>$toc$</nav>\n"
+        "$else$\n"
+        "<nav/>\n"
+        "$endif$\n"
+        '$for(css)$<link href="$css$">$sep$,$endfor$ $$5\n'
+    )
+    assert render_pandoc_template(
+        template, {"pagetitle": "Menu", "toc": "<ul/>", "css": ["a", "b"]}
+    ) == ('<title>Menu</title>\n<nav><ul/></nav>\n<link href="a">,<link href="b"> $5\n')
+    assert render_pandoc_template(template, {}) == "<title></title>\n<nav/>\n $5\n"
+
+
+@pytest.mark.parametrize(
+    "path", sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))[:2]
+)
+def test_render_html_backends(path: Path):
+    menu = load_legacy_menu(path)
+    html = render(menu, RenderFormat.HTML, html_backend=HtmlBackend.MARKDOWN_IT)
+    assert html.startswith("<!DOCTYPE html>")
+    assert f"<title>{ menu.title }</title>" in html
+    ids = CRE_HEADING_ID.findall(html)
+    assert len(ids) == len(set(ids))
+    assert set(CRE_TOC_HREF.findall(html)) <= set(ids)
+
+    if shutil.which("pandoc") is None:
+        return
+    pandoc_html = render(menu, RenderFormat.HTML, html_backend=HtmlBackend.PANDOC)
+    # Identical headings and table of contents (up to line wrapping).
+    pandoc_html = " ".join(pandoc_html.split())
+    assert CRE_HEADING_ID.findall(pandoc_html) == ids
+    assert CRE_TOC_HREF.findall(pandoc_html) == CRE_TOC_HREF.findall(html)
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from dinner_daily_helpers.menu import ingredients_table
+from dinner_daily_helpers.types.legacy import LegacyMenu
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+def test_ingredients_table_units():
+    menu = LegacyMenu.parse_file(
+        fixtures_root.joinpath("legacy_menus", "2018-05-05-weekly-menu.json")
+    )
+    df_ingredients = ingredients_table(menu.dict()).set_index(["meal", "dish"])
+
+    salmon = df_ingredients.loc[(1, "Citrus Salmon")]
+    # Known units are kept as is.
+    assert salmon.iloc[0][["quantity", "unit", "ingredient"]].tolist() == [
+        "1",
+        "lb",
+        "salmon fillets",
+    ]
+    # Unknown units are part of the ingredient name; the unit is "each".
+    garlic = salmon[salmon.ingredient == "garlic clove"].iloc[0]
+    assert garlic[["quantity", "unit", "processing"]].tolist() == [
+        "1",
+        "each",
+        "minced",
+    ]
+    assert not df_ingredients.ingredient.str.startswith("clove").any()
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.document import ParsedDocument
+from dinner_daily_helpers.menu import extract_menu
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+pytest.importorskip("lxml")
+
+
+@pytest.mark.parametrize("path", fixtures_root.glob("legacy_html/*.html"))
+def test_engine_parity(path: Path):
+    html = path.read_text()
+    expected = extract_menu(html, engine="bs4")
+    assert extract_menu(html, engine="lxml") == expected
+    assert extract_menu(ParsedDocument(html), engine="lxml") == expected
+
+
+def test_engine_parity_add_a_side():
+    html = fixtures_root.joinpath("legacy_html", "2018-05-05-weekly-menu.html")
+    menu = extract_menu(html.read_text(), engine="lxml")
+    # "Add a side" placeholders are skipped.
+    assert [len(meal["side_dishes"]) for meal in menu["meals"]] == [2, 1, 2, 1, 1]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        extract_menu("<html></html>", engine="regex")
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from dinner_daily_helpers.nutrition import FIELDS, NutritionTable
+from dinner_daily_helpers.types.menu import ProteinCategory
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.fixture
+def menus():
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    menu = week.menu
+    # Second week: first two days only, one week later.
+    next_menu = menu.copy(
+        update={
+            "start_date": "2021-05-31T00:00:00+00:00",
+            "day_menus": menu.day_menus[:2],
+        }
+    )
+    return [menu, next_menu]
+
+
+def test_nutrition_table(menus):
+    table = NutritionTable.from_menus(menus)
+    day_menus = menus[0].day_menus
+    assert table.values.shape == (len(day_menus) + 2, len(FIELDS))
+    assert list(table.start_date.astype(str)) == ["2021-05-24", "2021-05-31"]
+
+    calories = table.index("calories")
+    expected = [
+        sum(day_menu.calories for day_menu in day_menus),
+        sum(day_menu.calories for day_menu in day_menus[:2]),
+    ]
+    np.testing.assert_allclose(table.weekly()[:, calories], expected)
+    np.testing.assert_allclose(
+        table.weekly_mean()[:, calories],
+        [expected[0] / len(day_menus), expected[1] / 2],
+    )
+    np.testing.assert_allclose(table.rolling_mean(2)[:, calories], [sum(expected) / 2])
+    assert table.rolling_mean(1).shape == (2, len(FIELDS))
+    for window in (0, -1):
+        with pytest.raises(ValueError, match="window must be positive"):
+            table.rolling_mean(window)
+
+    by_category = table.by_protein_category()
+    assert by_category.shape == (len(ProteinCategory), len(FIELDS))
+    for category in ProteinCategory:
+        times = [
+            day_menu.time_to_table
+            for menu in menus
+            for day_menu in menu.day_menus
+            if day_menu.main.protein_category == category
+        ]
+        mean = by_category[category, table.index("time_to_table")]
+        if times:
+            assert mean == pytest.approx(np.mean(times))
+        else:
+            assert np.isnan(mean)
+
+    df = table.to_frame()
+    assert list(df.columns) == list(FIELDS)
+    np.testing.assert_allclose(df["calories"], expected)
+
+
+def test_nutrition_table_from_archive(menus, tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    from dinner_daily_helpers.archive import WeekArchive
+
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    archive = WeekArchive(tmp_path)
+    archive.extend(week.copy(update={"menu": menu}) for menu in menus)
+    table = NutritionTable.from_frame(archive.read("day_menus"))
+    expected = NutritionTable.from_menus(menus)
+    np.testing.assert_allclose(table.weekly(), expected.weekly())
+    np.testing.assert_allclose(
+        table.by_protein_category(), expected.by_protein_category()
+    )
+    assert (table.start_date == expected.start_date).all()
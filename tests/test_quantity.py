@@ -0,0 +1,30 @@
+import pint
+import pytest
+from dinner_daily_helpers.quantity import QuantityParser
+
+
+def test_quantity_parser_cache():
+    parse_quantity = QuantityParser(maxsize=2)
+
+    quantity = parse_quantity("3/4 lb")
+    assert str(quantity.imperial.units) == "pound"
+    assert quantity.metric.to("pound").magnitude == pytest.approx(0.75)
+    assert parse_quantity("3/4 lb") is quantity
+    assert parse_quantity("2") == (2, 2)
+
+    # Failures are cached too.
+    for i in range(2):
+        with pytest.raises(pint.UndefinedUnitError):
+            parse_quantity("1 large")
+
+    info = parse_quantity.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 2)
+
+    # The cached exception is raised again, attributes included.
+    exceptions = []
+    for i in range(2):
+        with pytest.raises(pint.DimensionalityError) as exc_info:
+            parse_quantity("3 lb + 2")
+        exceptions.append(exc_info.value)
+    assert exceptions[1] is exceptions[0]
+    assert exceptions[1].units2 == "dimensionless"
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.render import (
+    RenderFormat,
+    get_environment,
+    load_legacy_menu,
+    render,
+)
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.mark.parametrize(
+    "path", sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))
+)
+def test_render_markdown(path: Path):
+    menu = load_legacy_menu(path)
+    expected = fixtures_root.joinpath("rendered", f"{ path.stem }.md").read_text()
+    assert render(menu, RenderFormat.MARKDOWN) == expected
+    # Rendering again reuses the compiled template.
+    assert render(menu, RenderFormat.MARKDOWN) == expected
+
+
+def test_environment_cached():
+    environment = get_environment()
+    assert get_environment() is environment
+    template = environment.get_template("weekly_menu.template.md")
+    assert environment.get_template("weekly_menu.template.md") is template
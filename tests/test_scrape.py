@@ -0,0 +1,174 @@
+import itertools as it
+import time
+
+import dinner_daily_helpers.scrape
+import pytest
+from dinner_daily_helpers.scrape import BrowserPool, Session
+from pydantic import ValidationError
+from selenium.common.exceptions import WebDriverException
+from test_api import _jwt
+
+
+class FakeDriver:
+    """
+    Stands in for a logged in Chrome driver: local storage holds a session
+    until :attr:`logged_in` is cleared, and every call fails once
+    :attr:`alive` is cleared.
+    """
+
+    ids = it.count()
+
+    def __init__(self):
+        self.id = next(self.ids)
+        self.token = f"token-{ self.id }"
+        self.alive = True
+        self.logged_in = True
+        self.quit_count = 0
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise WebDriverException("Chrome not reachable")
+        if script == "window.localStorage.clear();":
+            self.logged_in = False
+            return None
+        if self.logged_in:
+            return {"token": self.token, "refreshToken": "r"}
+        return {}
+
+    def quit(self):
+        self.quit_count += 1
+
+
+@pytest.fixture
+def logins(monkeypatch):
+    """
+    ``(driver, username)`` of each call to :func:`scrape.login`.
+    """
+    calls = []
+
+    def login(driver, username, password, timeouts=None, timings=None):
+        calls.append((driver, username))
+        driver.logged_in = True
+        return Session(token=f"token-{ driver.id }", refreshToken="r")
+
+    monkeypatch.setattr(dinner_daily_helpers.scrape, "login", login)
+    return calls
+
+
+def test_pool_reuses_drivers(logins):
+    drivers = []
+
+    def driver_factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    with BrowserPool(driver_factory=driver_factory) as pool:
+        for i in range(3):
+            with pool.session("alice", "password") as (driver, session):
+                assert driver is drivers[0]
+                assert session.token == f"token-{ driver.id }"
+        with pool.session("bob", "password") as (driver, session):
+            assert driver is drivers[1]
+        # Drivers in use are not shared.
+        with pool.session("alice", "password") as (first, _):
+            with pool.session("alice", "password") as (second, _):
+                assert first is not second
+        assert len(drivers) == 3
+        assert [username for _, username in logins] == ["alice", "bob", "alice"]
+        # Beyond `max_idle`, released drivers are quit.
+        assert sum(driver.quit_count for driver in drivers) == 1
+
+    # Closing quits idle drivers.
+    assert all(driver.quit_count == 1 for driver in drivers)
+    with pytest.raises(RuntimeError):
+        with pool.session("alice", "password"):
+            pass
+
+
+def test_pool_recycles_drivers(logins):
+    # Too old.
+    with BrowserPool(max_age=0, driver_factory=FakeDriver) as pool:
+        with pool.session("alice", "password") as (old, _):
+            pass
+        with pool.session("alice", "password") as (driver, _):
+            assert driver is not old
+        assert old.quit_count == 1
+
+    with BrowserPool(driver_factory=FakeDriver) as pool:
+        with pool.session("alice", "password") as (driver, _):
+            pass
+
+        # Logged out.
+        old = driver
+        old.logged_in = False
+        with pool.session("alice", "password") as (driver, _):
+            assert driver is not old
+        assert old.quit_count == 1
+
+        # Unresponsive.
+        old = driver
+        old.alive = False
+        with pool.session("alice", "password") as (driver, _):
+            assert driver is not old
+        assert old.quit_count == 1
+
+        # Expired session.
+        old = driver
+        old.token = _jwt(time.time() - 1)
+        with pool.session("alice", "password") as (driver, _):
+            assert driver is not old
+        assert old.quit_count == 1
+
+        # Failed in use, or session rejected by the API.
+        def crash():
+            raise WebDriverException("crashed")
+
+        def unauthorized():
+            Session.parse_obj({"message": "Unauthorized"})
+
+        for fail, exception in [
+            (crash, WebDriverException),
+            (unauthorized, ValidationError),
+        ]:
+            old = driver
+            with pytest.raises(exception):
+                with pool.session("alice", "password") as (driver, _):
+                    fail()
+            assert old.quit_count == 1
+            with pool.session("alice", "password") as (driver, _):
+                assert driver is not old
+
+        # Other exceptions return the driver to the pool.
+        old = driver
+        with pytest.raises(KeyError):
+            with pool.session("alice", "password") as (driver, _):
+                raise KeyError()
+        with pool.session("alice", "password") as (driver, _):
+            assert driver is old
+    assert len(logins) == 8
+
+
+def test_browser_refresh_pool(logins, monkeypatch):
+    with BrowserPool(driver_factory=FakeDriver) as pool:
+        refresh = dinner_daily_helpers.scrape.browser_refresh("alice", "password", pool)
+        with pool.session("alice", "password") as (driver, expired):
+            pass
+
+        # Refreshing a session that is not the pooled driver's one reuses it.
+        assert refresh(Session(token="other", refreshToken="r")) == expired
+        assert len(logins) == 1
+
+        # The pooled driver still holds the expired session: log out, then
+        # log in again on the same driver.
+        logged_in = []
+        login = dinner_daily_helpers.scrape.login
+
+        def login_logged_out(driver, *args, **kwargs):
+            logged_in.append(driver.logged_in)
+            return login(driver, *args, **kwargs)
+
+        monkeypatch.setattr(dinner_daily_helpers.scrape, "login", login_logged_out)
+        refresh(expired)
+        assert logged_in == [False]
+        assert len(logins) == 2
+        assert logins[-1][0] is driver
@@ -0,0 +1,48 @@
+import io
+import json
+from pathlib import Path
+
+import dinner_daily_helpers.serialize
+import pytest
+from dinner_daily_helpers.render import RenderFormat, load_legacy_menu, render
+from dinner_daily_helpers.serialize import dumps, read_ndjson, write_ndjson
+from dinner_daily_helpers.types.legacy import LegacyMenu
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.mark.parametrize("indent", [True, False])
+def test_dumps_without_orjson(indent: bool, monkeypatch):
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    expected = dumps(week, indent=indent)
+    monkeypatch.setattr(dinner_daily_helpers.serialize, "orjson", None)
+    assert dumps(week, indent=indent) == expected
+    assert Week.parse_raw(expected) == week
+
+
+def test_render_json():
+    path = fixtures_root.joinpath("legacy_menus", "2018-05-05-weekly-menu.json")
+    menu = load_legacy_menu(path)
+    rendered = render(menu, RenderFormat.JSON)
+    assert json.loads(rendered)["title"] == menu.title
+    assert LegacyMenu.parse_raw(rendered) == menu
+
+
+def test_ndjson_round_trip():
+    menus = [
+        load_legacy_menu(path)
+        for path in sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))
+    ]
+    output = io.BytesIO()
+    # Models are consumed lazily.
+    assert write_ndjson((menu for menu in menus), output) == len(menus)
+    assert output.getvalue().count(b"\n") == len(menus)
+
+    output.seek(0)
+    parsed = read_ndjson(output, LegacyMenu)
+    assert next(parsed) == menus[0]
+    assert list(parsed) == menus[1:]
+
+    output.seek(0)
+    assert list(read_ndjson(output, LegacyMenu, trusted=True)) == menus
@@ -0,0 +1,104 @@
+import time
+from pathlib import Path
+
+import dinner_daily_helpers.trello
+import dinner_daily_helpers.trello_api
+import pytest
+from dinner_daily_helpers.trello import StoreSection, create_week_card
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+LIST_ID = "a" * 24
+
+
+def _week(item_count: int) -> Week:
+    """
+    Fixture week with ``item_count`` shopping list items spread round-robin
+    over the store sections.
+    """
+    week = Week.parse_file(fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    items = [
+        item
+        for store_section in StoreSection
+        for item in getattr(week.shopping_list, store_section)
+    ]
+    sections = {store_section: [] for store_section in StoreSection}
+    for i in range(item_count):
+        item = items[i % len(items)].copy(update={"name": f"item { i }"})
+        sections[list(StoreSection)[i % len(sections)]].append(item)
+    return week.copy(update={"shopping_list": week.shopping_list.copy(update=sections)})
+
+
+def _check_item_names(server) -> list:
+    """
+    ``(checklist name, check item names)`` of each checklist, ordered by their
+    recorded positions.
+    """
+    stub = server.stub
+    return [
+        (
+            check_list["name"],
+            [
+                item["name"]
+                for item in sorted(
+                    stub.check_items[check_list["id"]], key=lambda i: i["pos"]
+                )
+            ],
+        )
+        for check_list in sorted(stub.check_lists, key=lambda c: c["pos"])
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_create_week_card_order(trello_server, max_workers):
+    week = _week(40)
+    trello_server.delay = 0.002
+    card = create_week_card(week, LIST_ID, max_workers=max_workers)
+
+    assert card.idList == LIST_ID
+    expected = [
+        (
+            store_section.value,
+            [
+                f"{ item.name } ({ item.formatted_amount })"
+                for item in getattr(week.shopping_list, store_section)
+            ],
+        )
+        for store_section in StoreSection
+    ]
+    assert _check_item_names(trello_server) == expected
+    assert sum(len(names) for _, names in expected) == 40
+
+
+def test_create_week_card_rate_limited(trello_server, monkeypatch):
+    backoff = dinner_daily_helpers.trello_api.Backoff(retries=3, factor=0)
+    monkeypatch.setattr(
+        dinner_daily_helpers.trello_api,
+        "DEFAULT_CLIENT",
+        dinner_daily_helpers.trello_api.TrelloClient(backoff=backoff),
+    )
+    trello_server.stub.rate_limit = 3
+    week = _week(16)
+    create_week_card(week, LIST_ID, max_workers=4)
+    assert sum(len(names) for _, names in _check_item_names(trello_server)) == 16
+
+
+def test_create_week_card_scaling(trello_server):
+    """
+    Wall-clock time of serial requests grows linearly with the number of check
+    items; with a worker pool it should grow much more slowly.
+    """
+    trello_server.delay = 0.01
+    timings = {}
+    for item_count in (8, 32, 64):
+        for max_workers in (1, 16):
+            start = time.perf_counter()
+            create_week_card(_week(item_count), LIST_ID, max_workers=max_workers)
+            timings[item_count, max_workers] = time.perf_counter() - start
+
+    serial_slope = timings[64, 1] - timings[8, 1]
+    concurrent_slope = timings[64, 16] - timings[8, 16]
+    assert concurrent_slope < 0.5 * serial_slope, ", ".join(
+        f"items={ item_count } max_workers={ max_workers }: { duration:.3f}s"
+        for (item_count, max_workers), duration in sorted(timings.items())
+    )
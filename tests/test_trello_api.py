@@ -0,0 +1,13 @@
+import dinner_daily_helpers.trello_api
+from dinner_daily_helpers.trello_api import TrelloClient, get_cards
+
+BOARD_ID = "c" * 24
+
+
+def test_client_keep_alive(trello_server, monkeypatch):
+    with TrelloClient(pool_size=2) as client:
+        monkeypatch.setattr(dinner_daily_helpers.trello_api, "DEFAULT_CLIENT", client)
+        for i in range(20):
+            assert get_cards(BOARD_ID) == []
+    assert len(trello_server.requests) == 20
+    assert len(trello_server.connections) == 1
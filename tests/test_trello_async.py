@@ -0,0 +1,52 @@
+import asyncio
+
+from dinner_daily_helpers.trello_api import (
+    CheckItem,
+    NewCard,
+    NewCheckItem,
+    NewCheckList,
+)
+from dinner_daily_helpers.trello_async import AsyncTrelloClient
+
+LIST_ID = "a" * 24
+
+
+async def _create_cards(card_count: int, item_count: int, semaphore):
+    async def create(client: AsyncTrelloClient, i: int):
+        card = await client.create_card(NewCard(name=f"card { i }", idList=LIST_ID))
+        check_list = await client.create_checklist(
+            card, NewCheckList(name="produce", pos=1)
+        )
+        return await asyncio.gather(
+            *[
+                client.create_check_item(
+                    check_list, NewCheckItem(name=f"item { j }", pos=j + 1)
+                )
+                for j in range(item_count)
+            ]
+        )
+
+    # One client per household, sharing a single per-token semaphore.
+    clients = [AsyncTrelloClient(semaphore=semaphore) for i in range(card_count)]
+    try:
+        return await asyncio.gather(
+            *[create(client, i) for i, client in enumerate(clients)]
+        )
+    finally:
+        await asyncio.gather(*[client.aclose() for client in clients])
+
+
+def test_async_client_semaphore(trello_server):
+    trello_server.delay = 0.005
+
+    async def main():
+        return await _create_cards(4, 10, asyncio.Semaphore(3))
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(item, CheckItem) for items in results for item in items)
+    assert [[item.pos for item in items] for items in results] == [
+        list(range(1, 11))
+    ] * 4
+    assert len(trello_server.requests) == 4 * (2 + 10)
+    assert 1 < trello_server.max_active <= 3
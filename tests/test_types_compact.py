@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+from dinner_daily_helpers.types.compact import (
+    SECTIONS,
+    CompactItem,
+    CompactRecipeItem,
+    CompactShoppingList,
+)
+from dinner_daily_helpers.types.shopping_list import Item, RecipeItem, ShoppingList
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+def test_fields_match_models():
+    assert CompactItem._fields == tuple(Item.__fields__)
+    assert CompactRecipeItem._fields == tuple(RecipeItem.__fields__)
+    assert CompactShoppingList._fields == tuple(ShoppingList.__fields__)
+
+
+def test_compact_shopping_list_round_trip():
+    path = fixtures_root.joinpath("weeks", "2021-05-24.json")
+    shopping_list = Week.parse_file(path).shopping_list
+    compact = CompactShoppingList.from_shopping_list(shopping_list)
+
+    restored = compact.to_shopping_list()
+    assert restored == shopping_list
+    assert restored.json() == shopping_list.json()
+    assert restored.__fields_set__ == shopping_list.__fields_set__
+    assert restored.seafood[0].__fields_set__ == set(Item.__fields__)
+
+    assert len(list(compact.items())) == sum(
+        len(getattr(shopping_list, section)) for section in SECTIONS
+    )
+    assert [item.name for item in compact.items("seafood")] == [
+        item.name for item in shopping_list.seafood
+    ]
+
+    # Strings are shared between lists.
+    other = CompactShoppingList.from_shopping_list(Week.parse_file(path).shopping_list)
+    assert other.seafood[0].name is compact.seafood[0].name
+    assert other.seafood[0].name is sys.intern("salmon fillets")
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+from dinner_daily_helpers.types.legacy import LegacyMenu
+from dinner_daily_helpers.types.menu import ProteinCategory
+from dinner_daily_helpers.types.trusted import construct, parse_file_trusted
+from dinner_daily_helpers.types.week import Week
+
+fixtures_root = Path(__file__).parent.joinpath("fixtures")
+
+
+@pytest.mark.parametrize(
+    "model_type, path",
+    [(Week, path) for path in sorted(fixtures_root.joinpath("weeks").glob("*.json"))]
+    + [
+        (LegacyMenu, path)
+        for path in sorted(fixtures_root.joinpath("legacy_menus").glob("*.json"))
+    ],
+)
+def test_parse_file_trusted(model_type, path: Path):
+    expected = model_type.parse_file(path)
+    trusted = parse_file_trusted(model_type, path)
+    assert trusted == expected
+    assert trusted.json() == expected.json()
+    assert trusted.__fields_set__ == expected.__fields_set__
+
+
+def test_construct_types():
+    week = parse_file_trusted(Week, fixtures_root.joinpath("weeks", "2021-05-24.json"))
+    day_menu = week.menu.day_menus[0]
+    assert isinstance(day_menu.main.protein_category, ProteinCategory)
+    assert isinstance(day_menu.calories, float)
+    # Missing optional fields take their default.
+    dish = construct(type(day_menu.main), {"name": "Salad"})
+    assert dish.big_image_url is None
+    assert dish.__fields_set__ == {"name"}